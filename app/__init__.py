@@ -2,6 +2,14 @@ from flask import Flask
 from app.utils.filters import (
     add_trailing_slash,
 )
+from app.utils import (
+    compression,
+    http_cache,
+    http_compression,
+    load_monitor,
+    read_only,
+    sqlite,
+)
 import logging_config
 from .extensions import db, migrate, login_manager
 from .api.v1.feeditems import api_feeditems_blueprint
@@ -12,11 +20,16 @@ from .api.v1.summarize import api_summarize_blueprint
 from .api.v1.groq import api_groq_blueprint
 from .api.v1.settings_categories import settings_categories_blueprint
 from .api.v1.daily import api_daily_blueprint
+from .api.v1.refresh import api_refresh_blueprint
+from .api.v1.maintenance import api_maintenance_blueprint
+from .api.v1.archive import api_archive_blueprint
 from .routes.routes import routes_blueprint
 from .routes.add_feed import add_feed_blueprint
 from .routes.mark_as_read import mark_as_read_blueprint
 from .routes.auth import auth_blueprint
 from .models import User
+from . import feed_counters  # noqa: F401, registers the counter events
+from . import item_fields, read_state, search, settings_cache
 from .context_processors import inject_version
 
 
@@ -32,8 +45,14 @@ def create_app(config_name=None):
     log_file = app.config.get("LOG_FILE", "logs/app.log")
     logging_config.setup_logging(log_level, log_file)
 
+    compression.init_app(app)
     db.init_app(app)
+    sqlite.init_app(app, db)
     migrate.init_app(app, db)
+    search.init_app(app)
+    item_fields.init_app(app)
+    settings_cache.init_app(app)
+    read_state.init_app(app)
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
 
@@ -43,6 +62,20 @@ def create_app(config_name=None):
 
     app.jinja_env.filters["add_trailing_slash"] = add_trailing_slash
 
+    # Request latencies are tracked so background jobs can back off while
+    # the web tier is busy.
+    load_monitor.init_app(app)
+
+    # GET requests only read, so they never take the SQLite write lock.
+    read_only.init_app(app, db)
+
+    # Polled endpoints answer 304 until the data they show changes.
+    http_cache.init_app(app, db)
+
+    # JSON and HTML are compressed per response, static files are sent
+    # precompressed.
+    http_compression.init_app(app)
+
     # Blueprints
 
     # API UI Info Blueprint
@@ -101,6 +134,20 @@ def create_app(config_name=None):
     # is a web API with a Daily feature.
     app.register_blueprint(api_daily_blueprint, url_prefix="/api/daily")
 
+    # API Refresh Blueprint This blueprint is responsible for queueing
+    # on-demand refreshes of a single feed or category.
+    app.register_blueprint(api_refresh_blueprint, url_prefix="/api/refresh")
+
+    # API Maintenance Blueprint This blueprint is responsible for reporting
+    # database size and row counts.
+    app.register_blueprint(
+        api_maintenance_blueprint, url_prefix="/api/maintenance"
+    )
+
+    # API Archive Blueprint This blueprint is responsible for searching and
+    # reading feed items moved to the archive by the cleaner.
+    app.register_blueprint(api_archive_blueprint, url_prefix="/api/archive")
+
     app.context_processor(inject_version)
 
     return app
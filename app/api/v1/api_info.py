@@ -1,41 +1,96 @@
 from datetime import datetime
-from flask import Blueprint, jsonify
-from flask_login import current_user
+from flask import Blueprint, current_app, jsonify
+from flask_login import current_user, login_required
 import humanize
 import pytz
-from app.models import Category, Feed, FeedItem, User, Settings
+from sqlalchemy import func, select
+from app import db, events, read_state, settings_cache
+from app.models import Category, Feed, FeedCounter, User
+from app.utils.http_cache import VersionedMemo, conditional, revalidate
 
 api_ui_info_blueprint = Blueprint("api", __name__)
 
+sidebar_memo = VersionedMemo()
+
+
+def sidebar_query(user_id):
+    """
+    Returns a statement selecting the categories of a user with their feeds
+    and unread counts, one row per feed and one for each empty category.
+    """
+    return (
+        select(
+            Category.id.label("category_id"),
+            Category.name.label("category_name"),
+            Feed.id,
+            Feed.title,
+            Feed.url,
+            Feed.daily_enabled,
+            Feed.max_items,
+            func.coalesce(FeedCounter.unread, 0).label("unread_count"),
+        )
+        .outerjoin(
+            Feed,
+            (Feed.category_id == Category.id) & (Feed.user_id == user_id),
+        )
+        .outerjoin(FeedCounter, FeedCounter.feed_id == Feed.id)
+        .where(Category.user_id == user_id)
+        .order_by(Category.id, Feed.id)
+    )
+
+
+def sidebar(user_id):
+    """
+    Returns the categories of a user with their feeds and unread counts, in
+    the shape of the categories_and_blogs response. Read state changes that
+    are not written yet are included.
+    """
+    deltas = read_state.unread_deltas(user_id)
+    data = []
+    for row in db.session.execute(sidebar_query(user_id)).mappings():
+        if not data or data[-1]["id"] != row["category_id"]:
+            data.append(
+                {
+                    "id": row["category_id"],
+                    "name": row["category_name"],
+                    "feeds": [],
+                }
+            )
+        if row["id"] is not None:
+            data[-1]["feeds"].append(
+                {
+                    "feed": {
+                        "id": row["id"],
+                        "title": row["title"],
+                        "url": row["url"],
+                        "daily_enabled": row["daily_enabled"],
+                        "max_items": row["max_items"],
+                    },
+                    "unread_count": row["unread_count"]
+                    + deltas.get(row["id"], 0),
+                }
+            )
+    return data
+
 
 @api_ui_info_blueprint.route("/categories_and_blogs", methods=["GET"])
+@conditional
 def get_categories_and_blogs():
     """
-    Returns categories and associated feeds with unread counts.
+    Returns the categories of the current user and their feeds with unread
+    counts. The result is memoized until the next write or for
+    SIDEBAR_CACHE_TTL seconds.
 
     Returns:
         dict: A dictionary containing categories and associated feeds
         with unread counts.
     """
     if current_user.is_authenticated:
-        categories = Category.query.all()
-        data = []
-
-        for cat in categories:
-            feeds = Feed.query.filter_by(category_id=cat.id).all()
-            feed_data = []
-
-            for feed in feeds:
-                unread_count = FeedItem.query.filter_by(
-                    feed_id=feed.id, read=False
-                ).count()
-                feed_data.append(
-                    {"feed": feed.to_dict(), "unread_count": unread_count}
-                )
-
-            cat_data = {"id": cat.id, "name": cat.name, "feeds": feed_data}
-            data.append(cat_data)
-
+        data = sidebar_memo.get(
+            current_user.id,
+            lambda: sidebar(current_user.id),
+            current_app.config.get("SIDEBAR_CACHE_TTL", 10),
+        )
         return jsonify({"categories_and_blogs": data})
     else:
         return jsonify({})
@@ -52,12 +107,11 @@ def get_last_sync():
     if current_user.is_authenticated:
         user = User.query.filter_by(id=current_user.id).first()
         if user and user.last_sync is not None:
-            settings = Settings.query.filter_by(user_id=user.id).first()
+            settings = settings_cache.get_settings(user.id)
             if settings and settings.timezone:
-                user_tz = pytz.timezone(settings.timezone)
                 user_last_sync = user.last_sync.replace(
                     tzinfo=pytz.utc
-                ).astimezone(user_tz)
+                ).astimezone(settings.tz)
             else:
                 if user.last_sync.tzinfo is None:
                     user_last_sync = pytz.utc.localize(user.last_sync)
@@ -67,20 +121,60 @@ def get_last_sync():
             last_sync_time = humanize.naturaltime(
                 datetime.now(pytz.utc) - user_last_sync.astimezone(pytz.utc)
             )
-            return jsonify({"last_sync": last_sync_time})
+            return revalidate(jsonify({"last_sync": last_sync_time}))
         else:
-            return jsonify({"last_sync": "Never"})
+            return revalidate(jsonify({"last_sync": "Never"}))
     else:
         return jsonify({})
 
 
 @api_ui_info_blueprint.route("/unread-count")
+@conditional
 def unread_count():
     if current_user.is_authenticated:
-        unread_items_count = (
-            FeedItem.query.join(Feed)
-            .filter(Feed.user_id == current_user.id, FeedItem.read == False)
-            .count()
+        unread_items_count = db.session.execute(
+            select(func.coalesce(func.sum(FeedCounter.unread), 0))
+            .join(Feed, Feed.id == FeedCounter.feed_id)
+            .where(Feed.user_id == current_user.id)
+        ).scalar()
+        unread_items_count += sum(
+            read_state.unread_deltas(current_user.id).values()
         )
         return jsonify(unread_count=unread_items_count)
     return jsonify(unread_count=0)
+
+
+@api_ui_info_blueprint.route("/events")
+@login_required
+def live_events():
+    """
+    Streams live updates of the current user as Server-Sent Events, see
+    `app.events`. The stream holds a server thread, so at most
+    EVENTS_MAX_STREAMS are open at a time.
+
+    Returns:
+        Response: A text/event-stream, or 503 if too many streams are open
+        and the client should poll instead.
+    """
+    user_id = current_user.id
+    subscription = events.broker.subscribe(
+        user_id, current_app.config.get("EVENTS_MAX_STREAMS", 4)
+    )
+    if subscription is None:
+        return (
+            jsonify({"status": "error", "error": "Too many event streams"}),
+            503,
+        )
+    # Runs after the request ended, so it must not touch the database.
+    response = current_app.response_class(
+        events.stream(
+            user_id,
+            subscription,
+            current_app.config.get("EVENTS_KEEPALIVE", 15),
+        ),
+        mimetype="text/event-stream",
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    # Keeps nginx from buffering the stream.
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
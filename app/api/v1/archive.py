@@ -0,0 +1,64 @@
+import re
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import current_user
+from app.archive import archive_dir, read_archived_item, search_archive
+
+api_archive_blueprint = Blueprint("api_archive_blueprint", __name__)
+
+MAX_SEARCH_LIMIT = 200
+MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+
+@api_archive_blueprint.route("/search", methods=["GET"])
+def search_archived_items():
+    """
+    Search archived feed items of the current user.
+    ---
+    Parameters:
+        q (str): Case-insensitive substring of the title.
+        feed_id (int): Only return items of this feed.
+        month (str): Only search the YYYY-MM segment.
+        limit (int): The maximum number of results (default 50).
+    Responses:
+        200: A list of archived items without their summaries.
+        400: Invalid month.
+        401: User not authenticated.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    month = request.args.get("month")
+    if month is not None and not MONTH_PATTERN.fullmatch(month):
+        return jsonify({"error": "month must be YYYY-MM"}), 400
+
+    limit = min(request.args.get("limit", 50, type=int), MAX_SEARCH_LIMIT)
+    items = search_archive(
+        archive_dir(current_app),
+        current_user.id,
+        query=request.args.get("q"),
+        feed_id=request.args.get("feed_id", type=int),
+        month=month,
+        limit=limit,
+    )
+    return jsonify(items), 200
+
+
+@api_archive_blueprint.route("/<int:item_id>", methods=["GET"])
+def get_archived_item(item_id):
+    """
+    Return a single archived feed item including its summary.
+    ---
+    Responses:
+        200: The archived item.
+        401: User not authenticated.
+        404: Item not found in the archive.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    item = read_archived_item(
+        archive_dir(current_app), current_user.id, item_id
+    )
+    if item is None:
+        return jsonify({"error": "Item not found"}), 404
+    return jsonify(item), 200
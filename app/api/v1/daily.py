@@ -2,8 +2,10 @@ import logging
 import pytz
 from flask import Blueprint, jsonify, request, session
 from flask_login import current_user
-from app.models import SummarizedArticle, ArticleLink, FeedItem, Settings, Feed
-from app import db
+from sqlalchemy import select, tuple_
+from app.models import SummarizedArticle, ArticleLink, FeedItem, Feed
+from app import db, settings_cache
+from app.utils.cursors import InvalidCursor, decode_cursor, encode_cursor
 from app.utils.text import get_text_from_url, text_to_html_list
 from app.utils.groq import groq_request
 from app.utils.promts import SUMMARIZE
@@ -11,10 +13,11 @@ from app.utils.promts import SUMMARIZE
 
 api_daily_blueprint = Blueprint("api_daily_blueprint", __name__)
 
+CURSOR_KIND = "daily"
+
 
 def get_user_timezone():
-    user_settings = Settings.query.filter_by(user_id=current_user.id).first()
-    return pytz.timezone(user_settings.timezone) if user_settings else pytz.utc
+    return settings_cache.get_timezone(current_user.id)
 
 
 @api_daily_blueprint.route("/feed", methods=["GET"])
@@ -30,17 +33,20 @@ def daily_feed():
 
     Query Parameters:
     - limit (int): Maximum number of articles to retrieve. Default is 10.
+    - cursor (str): The next_cursor of the previous page.
     - last_item_id (int): ID of the last retrieved summarized article,
-      used for pagination.
+      for clients that do not send a cursor.
     - unread (bool): If provided, filters the results to only include
       unread articles.
     Returns:
-    - A JSON response containing a list of dictionaries, each representing
-      a summarized article, with details such as summary, image link,
-      associated original articles, publication date converted to the
-      user's timezone, and read status.
+    - A JSON response containing `items`, a list of dictionaries, each
+      representing a summarized article, with details such as summary,
+      image link, associated original articles, publication date converted
+      to the user's timezone, and read status, and `next_cursor`, the
+      cursor of the next page or null on the last page.
 
     Responses:
+    - 400: Invalid cursor
     - 401: User not authenticated
     - 200: Successful retrieval of articles with summary details
     """
@@ -51,24 +57,44 @@ def daily_feed():
         )
 
     limit = int(request.args.get("limit", 10))
+    cursor = request.args.get("cursor")
     last_item_id = request.args.get("last_item_id")
     unread = request.args.get("unread")
 
+    # EXISTS instead of joins, so LIMIT counts summaries, not their links.
+    has_articles = (
+        select(ArticleLink.id)
+        .join(FeedItem, FeedItem.id == ArticleLink.original_article_id)
+        .where(ArticleLink.summarized_article_id == SummarizedArticle.id)
+        .exists()
+    )
     query = (
         db.session.query(SummarizedArticle)
-        .join(ArticleLink)
-        .join(FeedItem)
+        .filter(has_articles)
         .order_by(
             SummarizedArticle.pub_date.desc(), SummarizedArticle.id.desc()
         )
     )
 
-    if not last_item_id:
+    if not (cursor or last_item_id):
         session["issued_articles"] = []
 
     issued_articles = set(session.get("issued_articles", []))
 
-    if last_item_id:
+    if cursor:
+        try:
+            last_pub_date, last_id = decode_cursor(CURSOR_KIND, cursor, 2)
+        except InvalidCursor:
+            return (
+                jsonify({"status": "error", "error": "Invalid cursor"}),
+                400,
+            )
+        query = query.filter(
+            tuple_(SummarizedArticle.pub_date, SummarizedArticle.id)
+            < tuple_(last_pub_date, last_id)
+        )
+    elif last_item_id:
+        # Clients that page by item ID, see `cursor`.
         last_item = (
             db.session.query(SummarizedArticle)
             .filter_by(id=last_item_id)
@@ -90,12 +116,15 @@ def daily_feed():
     if unread:
         query = query.filter(SummarizedArticle.read == False)
 
-    summarized_articles = query.limit(limit * 2).all()
+    window = limit * 2
+    summarized_articles = query.limit(window).all()
 
     result = []
     new_issued_articles = list(issued_articles)
+    user_timezone = get_user_timezone()
 
     for summarized_article in summarized_articles:
+        last_article = summarized_article
         if summarized_article.id in issued_articles:
             continue
 
@@ -111,7 +140,6 @@ def daily_feed():
             if naive_datetime_utc and naive_datetime_utc.tzinfo:
                 naive_datetime_utc = naive_datetime_utc.replace(tzinfo=None)
 
-            user_timezone = get_user_timezone()
             datetime_in_user_tz = (
                 pytz.utc.localize(naive_datetime_utc).astimezone(user_timezone)
                 if naive_datetime_utc
@@ -149,12 +177,22 @@ def daily_feed():
         if len(result) >= limit:
             break
 
-    if len(summarized_articles) < limit * 2:
+    if len(summarized_articles) < window:
         new_issued_articles = []
 
     session["issued_articles"] = new_issued_articles
 
-    return jsonify(result)
+    # Older summaries may exist after a full page or a full window of
+    # already issued ones; the cursor continues after the last row read.
+    next_cursor = None
+    if summarized_articles and (
+        len(result) >= limit or len(summarized_articles) == window
+    ):
+        next_cursor = encode_cursor(
+            CURSOR_KIND, last_article.pub_date, last_article.id
+        )
+
+    return jsonify({"items": result, "next_cursor": next_cursor})
 
 
 @api_daily_blueprint.route("/summarize/<int:id>", methods=["GET", "POST"])
@@ -197,9 +235,7 @@ def summarize_article(id):
     if not current_user.is_authenticated:
         return (jsonify(status="error", error="User not authenticated"), 401)
 
-    current_user_settings = Settings.query.filter_by(
-        user_id=current_user.id
-    ).first()
+    current_user_settings = settings_cache.get_settings(current_user.id)
 
     if not current_user_settings.groq_api_key:
         return jsonify({"status": "error", "error": "Missing API key"}), 403
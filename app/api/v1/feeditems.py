@@ -1,86 +1,187 @@
 import logging
 from flask import Blueprint, jsonify, request
 from flask_login import current_user
-import pytz
+from sqlalchemy import select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import Settings, Feed, FeedItem
-from app.utils.serialization import serialize_item
+from app import db, read_state, search, settings_cache
+from app.models import Feed, FeedItem
+from app.utils.cursors import InvalidCursor, decode_cursor, encode_cursor
+from app.utils.http_cache import conditional
+from app.utils.serialization import serialize_row
 
 api_feeditems_blueprint = Blueprint("api_feeditems_blueprint", __name__)
 
+CURSOR_KIND = "feeditems"
+
 
 def get_user_timezone():
     """
     Retrieve the user's timezone from settings. If not found, default to UTC.
     """
-    user_settings = Settings.query.filter_by(user_id=current_user.id).first()
-    return pytz.timezone(user_settings.timezone) if user_settings else pytz.utc
+    return settings_cache.get_timezone(current_user.id)
+
+
+def in_category(cat_id):
+    """
+    Filter for feeds of a category that does not let SQLite start the join
+    from the category index. That plan collects every item of the category
+    and sorts it on each page; walking feed_item in (pub_date, id) order and
+    stopping after `limit` matches does not sort at all.
+    """
+    # An expression instead of the bare column disqualifies the term from
+    # index use.
+    return Feed.category_id + 0 == cat_id
+
+
+# The columns of FeedItem.to_dict plus the title of the feed, so a listing
+# page is a single joined query that loads no ORM objects.
+LISTING_COLUMNS = (
+    FeedItem.id,
+    FeedItem.title,
+    FeedItem.link,
+    FeedItem.summary,
+    FeedItem.excerpt,
+    FeedItem.first_image,
+    FeedItem.word_count,
+    FeedItem.pub_date,
+    FeedItem.creator,
+    FeedItem.read,
+    FeedItem.guid,
+    FeedItem.feed_id,
+    Feed.title.label("feed_title"),
+)
+
+
+def listing_query(*conditions):
+    """
+    Select the listing columns of the feed items matching `conditions`,
+    joined with their feed.
+    """
+    return (
+        select(*LISTING_COLUMNS)
+        .join(Feed, Feed.id == FeedItem.feed_id)
+        .where(*conditions)
+    )
 
 
-def get_items(query, limit, last_item_id):
+def get_items(query, limit, cursor=None, last_item_id=None, unread_only=False):
     """
-    Fetch a limited number of items based on the query and last item ID for
-    pagination.
+    Fetch a limited number of items based on the query, continuing after the
+    position given by a cursor or the last item ID. Read state changes that
+    are not written yet are applied, see `app.read_state`.
 
     Parameters:
-    - query: SQLAlchemy query object
+    - query: Select statement returned by listing_query
     - limit: Number of items to retrieve
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, only used
+    without a cursor
+    - unread_only: Whether the query selects unread items only
 
     Returns:
-    - List of FeedItem objects
+    - List of read-only result rows and the cursor of the next page, or None
+    if this is the last page
+
+    Raises:
+    - InvalidCursor: If the cursor cannot be verified
     """
-    if last_item_id:
+    anchor = None
+    if cursor:
+        anchor = decode_cursor(CURSOR_KIND, cursor, 2)
+    elif last_item_id:
+        # Clients that page by item ID cost one extra lookup per page and
+        # stop paging if the item has been cleaned up.
         try:
-            last_item = FeedItem.query.get(last_item_id)
-            query = query.filter(
-                (FeedItem.pub_date < last_item.pub_date)
-                | (
-                    (FeedItem.pub_date == last_item.pub_date)
-                    & (FeedItem.id < last_item.id)
+            anchor = db.session.execute(
+                select(FeedItem.pub_date, FeedItem.id).where(
+                    FeedItem.id == last_item_id
                 )
-            )
+            ).first()
         except SQLAlchemyError as e:
             logging.error("Error fetching last item: %s", str(e))
-            return []
+            return [], None
+        if anchor is None:
+            logging.warning("Last item %s not found", last_item_id)
+            return [], None
+    if anchor:
+        # A row value comparison is a range on the listing indexes, the
+        # equivalent OR of two terms can only be used as a filter.
+        query = query.where(
+            tuple_(FeedItem.pub_date, FeedItem.id) < tuple_(*anchor)
+        )
+    # Items pending to be marked as read are dropped from unread listings,
+    # fetching as many more keeps the page full.
+    hidden = read_state.hidden_count(current_user.id) if unread_only else 0
     try:
-        items = (
-            query.order_by(FeedItem.pub_date.desc(), FeedItem.id.desc())
-            .limit(limit)
+        rows = (
+            db.session.execute(
+                query.order_by(
+                    FeedItem.pub_date.desc(), FeedItem.id.desc()
+                ).limit(limit + hidden)
+            )
+            .mappings()
             .all()
         )
     except SQLAlchemyError as e:
         logging.error("Error fetching items: %s", e)
-        return []
-    return items
+        return [], None
+    rows = read_state.apply_overlay(rows, current_user.id, unread_only)[:limit]
+
+    next_cursor = None
+    if rows and len(rows) == limit:
+        next_cursor = encode_cursor(
+            CURSOR_KIND, rows[-1]["pub_date"], rows[-1]["id"]
+        )
+    return rows, next_cursor
 
 
-def create_response(items, user_timezone):
+def create_response(query, limit, user_timezone, unread_only=False):
     """
-    Create a JSON response with serialized items.
+    Create a JSON response with a page of serialized items and the cursor of
+    the next page. The position is taken from the `cursor` or
+    `last_item_id` request argument.
 
     Parameters:
-    - items: List of FeedItem objects
+    - query: Select statement returned by listing_query
+    - limit: Number of items to retrieve
     - user_timezone: User's timezone for serialization
+    - unread_only: Whether the query selects unread items only
 
     Returns:
-    - JSON response with serialized items
+    - JSON response with serialized items and next_cursor, or a 400 error
+    for an invalid cursor
     """
-    item_ids = [item.id for item in items]
+    try:
+        rows, next_cursor = get_items(
+            query,
+            limit,
+            cursor=request.args.get("cursor"),
+            last_item_id=request.args.get("last_item_id"),
+            unread_only=unread_only,
+        )
+    except InvalidCursor:
+        return jsonify({"status": "error", "error": "Invalid cursor"}), 400
+    item_ids = [row["id"] for row in rows]
     logging.debug("Returned item IDs: %s", item_ids)
-    return jsonify([serialize_item(item, user_timezone) for item in items])
+    return jsonify(
+        {
+            "items": [serialize_row(row, user_timezone) for row in rows],
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @api_feeditems_blueprint.route("", methods=["GET"])
+@conditional
 def get_feed_items():
     """
     Retrieve unread feed items for the current user with optional pagination.
 
     Query parameters:
     - limit: Maximum number of items to retrieve (default: 5)
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, for clients
+    that do not send a cursor
 
     Returns:
     - JSON response with serialized unread feed items
@@ -92,26 +193,26 @@ def get_feed_items():
         )
 
     limit = int(request.args.get("limit", 5))
-    last_item_id = request.args.get("last_item_id")
     user_timezone = get_user_timezone()
 
-    query = FeedItem.query.join(Feed, Feed.id == FeedItem.feed_id).filter(
+    query = listing_query(
         Feed.user_id == current_user.id, FeedItem.read.is_(False)
     )
 
-    items = get_items(query, limit, last_item_id)
-    return create_response(items, user_timezone)
+    return create_response(query, limit, user_timezone, unread_only=True)
 
 
 @api_feeditems_blueprint.route("/all", methods=["GET"])
+@conditional
 def get_all_feed_items():
     """
     Retrieve all feed items for the current user with optional pagination.
 
     Query parameters:
     - limit: Maximum number of items to retrieve (default: 5)
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, for clients
+    that do not send a cursor
 
     Returns:
     - JSON response with serialized feed items
@@ -123,16 +224,15 @@ def get_all_feed_items():
         )
 
     limit = int(request.args.get("limit", 5))
-    last_item_id = request.args.get("last_item_id")
     user_timezone = get_user_timezone()
 
-    query = FeedItem.query
+    query = listing_query()
 
-    items = get_items(query, limit, last_item_id)
-    return create_response(items, user_timezone)
+    return create_response(query, limit, user_timezone)
 
 
 @api_feeditems_blueprint.route("/<int:cat_id>", methods=["GET"])
+@conditional
 def get_category_feed_items(cat_id):
     """
     Retrieve unread feed items for a specific category and the current user
@@ -143,8 +243,9 @@ def get_category_feed_items(cat_id):
 
     Query parameters:
     - limit: Maximum number of items to retrieve (default: 5)
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, for clients
+    that do not send a cursor
 
     Returns:
     - JSON response with serialized unread feed items in the specified category
@@ -156,20 +257,19 @@ def get_category_feed_items(cat_id):
         )
 
     limit = int(request.args.get("limit", 5))
-    last_item_id = request.args.get("last_item_id")
     user_timezone = get_user_timezone()
 
-    query = FeedItem.query.join(Feed, Feed.id == FeedItem.feed_id).filter(
-        Feed.category_id == cat_id,
+    query = listing_query(
+        in_category(cat_id),
         Feed.user_id == current_user.id,
         FeedItem.read.is_(False),
     )
 
-    items = get_items(query, limit, last_item_id)
-    return create_response(items, user_timezone)
+    return create_response(query, limit, user_timezone, unread_only=True)
 
 
 @api_feeditems_blueprint.route("/<int:cat_id>/all", methods=["GET"])
+@conditional
 def get_all_category_feed_items(cat_id):
     """
     Retrieve all feed items for a specific category and the current user with
@@ -178,8 +278,9 @@ def get_all_category_feed_items(cat_id):
     Parameters: - cat_id: Category ID
 
     Query parameters: - limit: Maximum number of items to retrieve (default: 5)
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, for clients
+    that do not send a cursor
 
     Returns: - JSON response with serialized feed items in the specified
     category
@@ -191,18 +292,15 @@ def get_all_category_feed_items(cat_id):
         )
 
     limit = int(request.args.get("limit", 5))
-    last_item_id = request.args.get("last_item_id")
     user_timezone = get_user_timezone()
 
-    query = FeedItem.query.join(Feed, Feed.id == FeedItem.feed_id).filter(
-        Feed.category_id == cat_id
-    )
+    query = listing_query(in_category(cat_id))
 
-    items = get_items(query, limit, last_item_id)
-    return create_response(items, user_timezone)
+    return create_response(query, limit, user_timezone)
 
 
 @api_feeditems_blueprint.route("/<int:cat_id>/<int:feed_id>", methods=["GET"])
+@conditional
 def get_specific_feed_items(cat_id, feed_id):
     """
     Retrieve unread feed items for a specific feed within a category for the
@@ -211,8 +309,9 @@ def get_specific_feed_items(cat_id, feed_id):
     Parameters: - cat_id: Category ID - feed_id: Feed ID
 
     Query parameters: - limit: Maximum number of items to retrieve (default: 5)
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, for clients
+    that do not send a cursor
 
     Returns: - JSON response with serialized unread feed items in the specified
     feed
@@ -224,23 +323,22 @@ def get_specific_feed_items(cat_id, feed_id):
         )
 
     limit = int(request.args.get("limit", 5))
-    last_item_id = request.args.get("last_item_id")
     user_timezone = get_user_timezone()
 
-    query = FeedItem.query.join(Feed, Feed.id == FeedItem.feed_id).filter(
+    query = listing_query(
         Feed.category_id == cat_id,
         Feed.id == feed_id,
         Feed.user_id == current_user.id,
         FeedItem.read.is_(False),
     )
 
-    items = get_items(query, limit, last_item_id)
-    return create_response(items, user_timezone)
+    return create_response(query, limit, user_timezone, unread_only=True)
 
 
 @api_feeditems_blueprint.route(
     "/<int:cat_id>/<int:feed_id>/all", methods=["GET"]
 )
+@conditional
 def get_all_specific_feed_items(cat_id, feed_id):
     """
     Retrieve all feed items for a specific feed within a category for the
@@ -252,8 +350,9 @@ def get_all_specific_feed_items(cat_id, feed_id):
 
     Query parameters:
     - limit: Maximum number of items to retrieve (default: 5)
-    - last_item_id: ID of the last item from the previous request for
-    pagination
+    - cursor: The next_cursor of the previous page
+    - last_item_id: ID of the last item of the previous page, for clients
+    that do not send a cursor
 
     Returns:
     - JSON response with serialized feed items in the specified feed
@@ -265,12 +364,74 @@ def get_all_specific_feed_items(cat_id, feed_id):
         )
 
     limit = int(request.args.get("limit", 5))
-    last_item_id = request.args.get("last_item_id")
     user_timezone = get_user_timezone()
 
-    query = FeedItem.query.join(Feed, Feed.id == FeedItem.feed_id).filter(
-        Feed.category_id == cat_id, Feed.id == feed_id
-    )
+    query = listing_query(Feed.category_id == cat_id, Feed.id == feed_id)
 
-    items = get_items(query, limit, last_item_id)
-    return create_response(items, user_timezone)
+    return create_response(query, limit, user_timezone)
+
+
+@api_feeditems_blueprint.route("/search", methods=["GET"])
+@conditional
+def search_feed_items():
+    """
+    Full-text search over the current user's feed items, best matches first.
+
+    Query parameters:
+    - q: The search text; every word must match, a trailing * matches
+    prefixes
+    - category_id: Optional category filter
+    - feed_id: Optional feed filter
+    - limit: Maximum number of items to retrieve (default: 20)
+    - cursor: The next_cursor of the previous page
+
+    Returns:
+    - JSON response with the matching items, each with a highlighted
+    snippet, and the cursor of the next page
+    """
+    if not current_user.is_authenticated:
+        return (
+            jsonify({"status": "error", "error": "User not authenticated"}),
+            401,
+        )
+    if not search.is_supported(db.session.connection()):
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "error": "Search is only available with SQLite",
+                }
+            ),
+            501,
+        )
+
+    query = request.args.get("q", "").strip()
+    if not query:
+        return (
+            jsonify({"status": "error", "error": "Missing search query"}),
+            400,
+        )
+    limit = min(int(request.args.get("limit", 20)), 100)
+    user_timezone = get_user_timezone()
+
+    try:
+        rows, next_cursor = search.search_items(
+            current_user.id,
+            query,
+            category_id=request.args.get("category_id", type=int),
+            feed_id=request.args.get("feed_id", type=int),
+            limit=limit,
+            cursor=request.args.get("cursor"),
+        )
+    except InvalidCursor:
+        return jsonify({"status": "error", "error": "Invalid cursor"}), 400
+    except SQLAlchemyError as e:
+        logging.error("Error searching items: %s", e)
+        return jsonify({"status": "error", "error": "Search failed"}), 500
+
+    items = []
+    for row in read_state.apply_overlay(rows, current_user.id):
+        item = serialize_row(row, user_timezone)
+        del item["score"]
+        items.append(item)
+    return jsonify({"items": items, "next_cursor": next_cursor})
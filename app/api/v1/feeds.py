@@ -135,3 +135,57 @@ def update_feed_category(feed_id):
     except SQLAlchemyError as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
+
+
+@api_feeds_blueprint.route("/<int:feed_id>/max_items", methods=["PUT"])
+def update_feed_max_items(feed_id):
+    """
+    Update the maximum number of items kept for a feed.
+    ---
+    Parameters:
+        feed_id (int): The ID of the feed to be updated.
+    Request Body:
+        max_items (int): The new cap, or null to keep all items. Favourites
+            are never removed and do not count towards the cap.
+    Responses:
+        200: Feed item cap updated successfully.
+        400: Not a valid value.
+        401: User not authenticated.
+        404: Feed not found.
+        500: Database error occurred.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    data = request.get_json()
+    max_items = data.get("max_items")
+
+    if max_items is not None and (
+        not isinstance(max_items, int)
+        or isinstance(max_items, bool)
+        or max_items < 1
+    ):
+        return jsonify({"error": "Not a valid value"}), 400
+
+    try:
+        feed = Feed.query.filter_by(
+            id=feed_id, user_id=current_user.id
+        ).first()
+        if not feed:
+            return jsonify({"error": "Feed not found"}), 404
+
+        feed.max_items = max_items
+        db.session.commit()
+        return (
+            jsonify(
+                {
+                    "status": "success",
+                    "feed": {"id": feed.id, "max_items": feed.max_items},
+                }
+            ),
+            200,
+        )
+
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
@@ -1,6 +1,6 @@
 from flask import Blueprint, jsonify
 from flask_login import current_user, login_required
-from app.models import Settings
+from app import settings_cache
 from app.utils.groq import check_groq_api
 
 api_groq_blueprint = Blueprint("api_groq_blueprint", __name__)
@@ -24,7 +24,7 @@ def check_groq():
             {"status": "error", "message": "User not authenticated"}
         )
 
-    user_settings = Settings.query.filter_by(user_id=current_user.id).first()
+    user_settings = settings_cache.get_settings(current_user.id)
 
     if not user_settings or not user_settings.groq_api_key:
         return jsonify({"status": "error", "message": "No GROQ API key found"})
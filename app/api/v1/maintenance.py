@@ -0,0 +1,22 @@
+from flask import Blueprint, jsonify
+from flask_login import current_user
+from app import db
+from app.db_maintenance import database_stats
+
+api_maintenance_blueprint = Blueprint("api_maintenance_blueprint", __name__)
+
+
+@api_maintenance_blueprint.route("/stats", methods=["GET"])
+def get_database_stats():
+    """
+    Return database size, free pages and per-table row counts.
+    ---
+    Responses:
+        200: Database statistics.
+        401: User not authenticated.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    stats = database_stats(db.session.connection(), db.metadata.sorted_tables)
+    return jsonify(stats), 200
@@ -0,0 +1,130 @@
+from flask import Blueprint, current_app, jsonify
+from flask_login import current_user
+from app.models import Feed
+from app.refresh_queue import enqueue_refresh, get_job
+
+api_refresh_blueprint = Blueprint("api_refresh_blueprint", __name__)
+
+
+def queue_response(feed_ids):
+    """
+    Queue a refresh of the given feeds and build the API response.
+
+    Parameters:
+    - feed_ids: IDs of the feeds to refresh
+
+    Returns:
+    - 202 with the job ID, or 429 if every feed was refreshed too recently
+    """
+    job, skipped = enqueue_refresh(
+        current_app._get_current_object(), current_user.id, feed_ids
+    )
+    if job is None:
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "error": "Refresh rate limit exceeded",
+                    "skipped_feed_ids": skipped,
+                }
+            ),
+            429,
+        )
+
+    return (
+        jsonify(
+            {
+                "status": "queued",
+                "job_id": job["id"],
+                "feed_ids": job["feed_ids"],
+                "skipped_feed_ids": skipped,
+            }
+        ),
+        202,
+    )
+
+
+@api_refresh_blueprint.route("/feed/<int:feed_id>", methods=["POST"])
+def refresh_feed(feed_id):
+    """
+    Queue an immediate refresh of a single feed.
+    ---
+    Parameters:
+        feed_id (int): The ID of the feed to refresh.
+    Responses:
+        202: Refresh queued.
+        401: User not authenticated.
+        404: Feed not found.
+        429: The feed was refreshed too recently.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    feed = Feed.query.filter_by(id=feed_id, user_id=current_user.id).first()
+    if not feed:
+        return jsonify({"error": "Feed not found"}), 404
+
+    return queue_response([feed.id])
+
+
+@api_refresh_blueprint.route("/category/<int:cat_id>", methods=["POST"])
+def refresh_category(cat_id):
+    """
+    Queue an immediate refresh of every feed in a category.
+    ---
+    Parameters:
+        cat_id (int): The ID of the category to refresh.
+    Responses:
+        202: Refresh queued.
+        401: User not authenticated.
+        404: Category has no feeds.
+        429: Every feed in the category was refreshed too recently.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    feed_ids = [
+        feed_id
+        for (feed_id,) in Feed.query.with_entities(Feed.id)
+        .filter_by(category_id=cat_id, user_id=current_user.id)
+        .all()
+    ]
+    if not feed_ids:
+        return jsonify({"error": "Category has no feeds"}), 404
+
+    return queue_response(feed_ids)
+
+
+@api_refresh_blueprint.route("/<job_id>", methods=["GET"])
+def refresh_status(job_id):
+    """
+    Return the status of a refresh job.
+    ---
+    Parameters:
+        job_id (str): The ID returned when the refresh was queued.
+    Responses:
+        200: Job status with the number of new items once it is done.
+        401: User not authenticated.
+        404: Job not found.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "User not authenticated"}), 401
+
+    job = get_job(job_id)
+    if not job or job["user_id"] != current_user.id:
+        return jsonify({"error": "Job not found"}), 404
+
+    return (
+        jsonify(
+            {
+                "job_id": job["id"],
+                "status": job["status"],
+                "feed_ids": job["feed_ids"],
+                "new_items": job["new_items"],
+                "error": job["error"],
+                "created_at": job["created_at"],
+                "finished_at": job["finished_at"],
+            }
+        ),
+        200,
+    )
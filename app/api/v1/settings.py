@@ -4,7 +4,7 @@ import pytz
 from flask import Blueprint, jsonify, request
 from flask_login import current_user
 from werkzeug.security import generate_password_hash
-from app import db
+from app import db, settings_cache
 from app.models import Settings, User, Feed
 
 api_settings_blueprint = Blueprint("api_settings_blueprint", __name__)
@@ -25,45 +25,36 @@ def user_settings():
     if not current_user.is_authenticated:
         return jsonify({"error": "User not authenticated"}), 401
 
-    # Fetch the current user's settings
-    current_user_settings = Settings.query.filter_by(
-        user_id=current_user.id
-    ).first()
-
     if request.method == "GET":
-        # If the user has a GROQ API key, replace it with asterisks for
-        # security
-        if current_user_settings.groq_api_key:
-            current_user_settings.groq_api_key = (
-                "******************************"
-            )
-        else:
-            current_user_settings.groq_api_key = None
-
-        # If the user has an OpenAI API key, replace it with asterisks for
-        # security
-        if current_user_settings.openai_api_key:
-            current_user_settings.openai_api_key = (
-                "******************************"
-            )
-        else:
-            current_user_settings.openai_api_key = None
+        # Read the cached settings, they are invalidated on every write
+        cached_settings = settings_cache.get_settings(current_user.id)
 
-        # Return the user's settings in a JSON format
+        # Return the user's settings in a JSON format. If the user has a
+        # GROQ API key, replace it with asterisks for security
         return (
             jsonify(
-                update_interval=current_user_settings.update_interval,
-                timezone=current_user_settings.timezone,
-                language=current_user_settings.language,
-                unread=current_user_settings.unread,
-                groq_api_key=current_user_settings.groq_api_key,
-                translate=current_user_settings.translate,
-                clean_after_days=current_user_settings.clean_after_days,
+                update_interval=cached_settings.update_interval,
+                timezone=cached_settings.timezone,
+                language=cached_settings.language,
+                unread=cached_settings.unread,
+                groq_api_key=(
+                    "******************************"
+                    if cached_settings.groq_api_key
+                    else None
+                ),
+                translate=cached_settings.translate,
+                clean_after_days=cached_settings.clean_after_days,
+                archive_expired=cached_settings.archive_expired,
             ),
             200,
         )
 
     if request.method == "POST":
+        # Fetch the current user's settings
+        current_user_settings = Settings.query.filter_by(
+            user_id=current_user.id
+        ).first()
+
         # Extract the data from the request
         update_data = request.json
 
@@ -79,6 +70,13 @@ def user_settings():
                 jsonify({"error": "Not a boolean value: 'translate'"}),
                 400,
             )
+        if "archive_expired" in update_data and not isinstance(
+            update_data["archive_expired"], bool
+        ):
+            return (
+                jsonify({"error": "Not a boolean value: 'archive_expired'"}),
+                400,
+            )
 
         # Validate integer fields and set default value for clean_after_days
         if "clean_after_days" in update_data:
@@ -126,6 +124,7 @@ def user_settings():
                 groq_api_key=current_user_settings.groq_api_key,
                 translate=current_user_settings.translate,
                 clean_after_days=current_user_settings.clean_after_days,
+                archive_expired=current_user_settings.archive_expired,
             ),
             200,
         )
@@ -137,10 +136,6 @@ def daily_settings():
     if not current_user.is_authenticated:
         return jsonify({"message": "User not authenticated."}), 401
 
-    # Query the database for the settings of the current user
-    current_user_settings = Settings.query.filter_by(
-        user_id=current_user.id
-    ).first()
     user = User.query.filter_by(id=current_user.id).first()
 
     if user.daily_sync_at is None:
@@ -154,11 +149,12 @@ def daily_settings():
     if user.daily_sync_at.tzinfo is None:
         user.daily_sync_at = pytz.utc.localize(user.daily_sync_at)
 
-    user_timezone = pytz.timezone(current_user_settings.timezone)
+    user_timezone = settings_cache.get_timezone(current_user.id)
     daily_sync_at_user_tz = user.daily_sync_at.astimezone(user_timezone)
     daily_sync_at = daily_sync_at_user_tz.strftime("%H:%M:%S")
 
     if request.method == "GET":
+        current_user_settings = settings_cache.get_settings(current_user.id)
         feeds = Feed.query.filter_by(user_id=current_user.id).all()
         feed_output = [feed.to_dict() for feed in feeds]
 
@@ -183,6 +179,9 @@ def daily_settings():
     elif request.method == "POST":
         # Update the settings of the current user based on the
         # data received from the POST request
+        current_user_settings = Settings.query.filter_by(
+            user_id=current_user.id
+        ).first()
         active = request.json.get("active")
         hours_summary = request.json.get("hours_summary")
         translate = request.json.get("translate")
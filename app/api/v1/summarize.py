@@ -1,7 +1,7 @@
 import logging
 from flask import Blueprint, jsonify, request
 from flask_login import current_user
-from app.models import Settings
+from app import settings_cache
 from app.utils.groq import groq_request
 from app.utils.promts import SUMMARIZE
 from app.utils.text import get_text_from_url, text_to_html_list
@@ -25,9 +25,7 @@ def summarize():
             401,
         )
 
-    current_user_settings = Settings.query.filter_by(
-        user_id=current_user.id
-    ).first()
+    current_user_settings = settings_cache.get_settings(current_user.id)
 
     if not current_user_settings.groq_api_key:
         return jsonify({"status": "error", "error": "Missing API key"}), 403
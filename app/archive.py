@@ -0,0 +1,222 @@
+"""
+Cold storage for expired feed items.
+
+Instead of being deleted, expired items can be moved into append-only,
+gzip-compressed JSON lines segments, one per month of publication. Every
+write appends a new gzip member to the segment and records the member's
+byte offset in a small plain-text index next to it, so archived items can be
+searched without decompressing anything and read by decompressing a single
+member.
+
+    <archive dir>/2024-06.jsonl.gz      compressed items
+    <archive dir>/2024-06.index.jsonl   id, user, feed, title, date, offset
+"""
+
+import glob
+import gzip
+import json
+import os
+import threading
+import zlib
+from datetime import datetime
+from sqlalchemy import select
+from app import db
+from app.models import Feed, FeedItem
+
+SEGMENT_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".index.jsonl"
+READ_BLOCK_SIZE = 64 * 1024
+
+_lock = threading.Lock()
+
+
+def archive_dir(app):
+    """Returns the archive directory of the application, creating it."""
+    path = app.config.get("ARCHIVE_DIR") or os.path.join(
+        app.instance_path, "archive"
+    )
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def segment_month(pub_date):
+    """Returns the segment name (YYYY-MM) for a publication date."""
+    return (pub_date or datetime.now()).strftime("%Y-%m")
+
+
+def load_archive_rows(item_ids):
+    """
+    Loads the columns that are archived for the given feed items.
+
+    Returns:
+        list[dict]: One JSON serializable dict per item.
+    """
+    rows = db.session.execute(
+        select(
+            FeedItem.id,
+            FeedItem.feed_id,
+            Feed.user_id,
+            FeedItem.title,
+            FeedItem.link,
+            FeedItem.summary,
+            FeedItem.pub_date,
+            FeedItem.creator,
+            FeedItem.guid,
+            FeedItem.read,
+            FeedItem.favourite,
+        )
+        .join(Feed, Feed.id == FeedItem.feed_id)
+        .where(FeedItem.id.in_(item_ids))
+        .order_by(FeedItem.id)
+    ).mappings()
+    return [
+        dict(
+            row,
+            pub_date=row["pub_date"].isoformat() if row["pub_date"] else None,
+        )
+        for row in rows
+    ]
+
+
+def archive_items(directory, rows):
+    """
+    Appends items to the monthly segments and their indexes.
+
+    Items are written before they are deleted from the database, so a failed
+    delete can leave an item archived twice; readers keep the copy written
+    last, which has the newer read state.
+
+    Args:
+        directory (str): The archive directory.
+        rows (list[dict]): Items as returned by `load_archive_rows`.
+
+    Returns:
+        int: The number of archived items.
+    """
+    by_month = {}
+    for row in rows:
+        pub_date = (
+            datetime.fromisoformat(row["pub_date"])
+            if row["pub_date"]
+            else None
+        )
+        by_month.setdefault(segment_month(pub_date), []).append(row)
+
+    with _lock:
+        for month, month_rows in by_month.items():
+            segment = os.path.join(directory, month + SEGMENT_SUFFIX)
+            index = os.path.join(directory, month + INDEX_SUFFIX)
+            payload = "".join(
+                json.dumps(row, ensure_ascii=False) + "\n"
+                for row in month_rows
+            ).encode("utf-8")
+
+            with open(segment, "ab") as f:
+                offset = f.tell()
+                f.write(gzip.compress(payload))
+                f.flush()
+                os.fsync(f.fileno())
+
+            with open(index, "a", encoding="utf-8") as f:
+                for row in month_rows:
+                    entry = {
+                        "id": row["id"],
+                        "user_id": row["user_id"],
+                        "feed_id": row["feed_id"],
+                        "title": row["title"],
+                        "pub_date": row["pub_date"],
+                        "offset": offset,
+                    }
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    return len(rows)
+
+
+def iter_index(directory, month=None):
+    """
+    Yields index entries, newest month first and the last written entry of
+    a month first. Of an item archived twice only the last copy is yielded.
+    """
+    pattern = (glob.escape(month) if month else "*") + INDEX_SUFFIX
+    seen = set()
+    for path in sorted(
+        glob.glob(os.path.join(directory, pattern)), reverse=True
+    ):
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+        for entry in reversed(entries):
+            if entry["id"] in seen:
+                continue
+            seen.add(entry["id"])
+            entry["month"] = os.path.basename(path)[: -len(INDEX_SUFFIX)]
+            yield entry
+
+
+def search_archive(
+    directory, user_id, query=None, feed_id=None, month=None, limit=50
+):
+    """
+    Searches the archive index by title, feed and month.
+
+    Args:
+        directory (str): The archive directory.
+        user_id (int): Only items of this user are returned.
+        query (str): Optional case-insensitive title substring.
+        feed_id (int): Optional feed filter.
+        month (str): Optional YYYY-MM segment filter.
+        limit (int): The maximum number of results.
+
+    Returns:
+        list[dict]: Matching index entries without the summaries.
+    """
+    query = query.lower() if query else None
+    results = []
+    for entry in iter_index(directory, month):
+        if entry["user_id"] != user_id:
+            continue
+        if feed_id is not None and entry["feed_id"] != feed_id:
+            continue
+        if query and query not in (entry["title"] or "").lower():
+            continue
+        results.append(
+            {key: value for key, value in entry.items() if key != "offset"}
+        )
+        if len(results) >= limit:
+            break
+    return results
+
+
+def read_member(path, offset):
+    """Decompresses the single gzip member that starts at `offset`."""
+    decompressor = zlib.decompressobj(wbits=31)
+    chunks = []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while not decompressor.eof:
+            block = f.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            chunks.append(decompressor.decompress(block))
+    return b"".join(chunks).decode("utf-8")
+
+
+def read_archived_item(directory, user_id, item_id):
+    """
+    Returns a full archived item, including its summary, or None.
+    """
+    for entry in iter_index(directory):
+        if entry["id"] != item_id:
+            continue
+        if entry["user_id"] != user_id:
+            return None
+        segment = os.path.join(directory, entry["month"] + SEGMENT_SUFFIX)
+        for line in read_member(segment, entry["offset"]).splitlines():
+            row = json.loads(line)
+            if row["id"] == item_id:
+                return row
+    return None
@@ -9,10 +9,13 @@ from dateutil.relativedelta import relativedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from app import create_app, db
+from app import create_app, db, events
 from app.models import User, Settings
 from .feed_updater import update_feeds_thread
+from .feed_scheduler import update_due_feeds
 from .feed_cleaner import clean_feeds
+from .db_maintenance import run_maintenance
+from .feed_counters import reconcile_counters
 from .daily_updater import process_and_summarize_articles
 
 app = create_app()
@@ -74,6 +77,9 @@ def process_and_summarize_articles_with_context(sheduler, app):
         user.daily_sync_at += relativedelta(days=1)
 
         db.session.commit()
+        events.broker.publish(
+            user.id, "daily", {"duration_minutes": int(duration_minutes)}
+        )
 
         logging.info("Task completed in %s minutes", duration_minutes)
     schedule_daily_sync(sheduler, app)
@@ -159,18 +165,21 @@ def schedule_update_feeds_job(scheduler, app, user, first_run):
         )
         logging.info("Update feeds job scheduled to run immediately")
 
+    # Feeds are refreshed by a rolling scheduler that spreads them across the
+    # update interval instead of hitting every feed at the same instant.
+    tick_seconds = app.config.get("FEED_SCHEDULER_TICK", 60)
     scheduler.add_job(
-        update_feeds_thread,
-        IntervalTrigger(
-            minutes=update_interval_minutes, timezone=user_timezone
-        ),
+        update_due_feeds,
+        IntervalTrigger(seconds=tick_seconds, timezone=user_timezone),
         id="update_feeds_job",
         replace_existing=True,
         args=[app],
     )
     logging.info(
-        "Update feeds job scheduled to run every %d minutes",
+        "Update feeds job spreads refreshes over %d minutes, "
+        "checking every %d seconds",
         update_interval_minutes,
+        tick_seconds,
     )
 
 
@@ -187,16 +196,57 @@ def schedule_clean_feeds_job(scheduler, app, user):
             replace_existing=True,
             args=[app],
         )
+        # The cleaner works in small time-budgeted slices, so it runs often.
+        interval_minutes = app.config.get("CLEANER_INTERVAL_MINUTES", 10)
         scheduler.add_job(
             clean_feeds,
-            IntervalTrigger(hours=3, timezone=user_timezone),
+            IntervalTrigger(minutes=interval_minutes, timezone=user_timezone),
+            id=job_id,
+            replace_existing=True,
+            args=[app],
+        )
+        logging.info(
+            "Clean feeds job scheduled to "
+            "run immediately and then every %d minutes",
+            interval_minutes,
+        )
+
+
+def schedule_maintenance_job(scheduler, app, user):
+    user_timezone = pytz_timezone(user.settings.timezone)
+
+    job_id = "db_maintenance"
+    if not scheduler.get_job(job_id):
+        interval_minutes = app.config.get("MAINTENANCE_INTERVAL_MINUTES", 60)
+        scheduler.add_job(
+            run_maintenance,
+            IntervalTrigger(minutes=interval_minutes, timezone=user_timezone),
+            id=job_id,
+            replace_existing=True,
+            args=[app],
+        )
+        logging.info(
+            "Database maintenance job scheduled to run every %d minutes",
+            interval_minutes,
+        )
+
+
+def schedule_reconcile_counters_job(scheduler, app, user):
+    user_timezone = pytz_timezone(user.settings.timezone)
+
+    job_id = "reconcile_counters"
+    if not scheduler.get_job(job_id):
+        interval_minutes = app.config.get("COUNTER_RECONCILE_MINUTES", 60)
+        scheduler.add_job(
+            reconcile_counters,
+            IntervalTrigger(minutes=interval_minutes, timezone=user_timezone),
             id=job_id,
             replace_existing=True,
             args=[app],
         )
         logging.info(
-            "Clean feeds job scheduled to"
-            "run immediately and then every 3 hours"
+            "Feed counter reconciliation scheduled to run every %d minutes",
+            interval_minutes,
         )
 
 
@@ -208,6 +258,8 @@ def schedule_jobs(scheduler, app, first_run=False):
             if user:
                 schedule_update_feeds_job(scheduler, app, user, first_run)
                 schedule_clean_feeds_job(scheduler, app, user)
+                schedule_maintenance_job(scheduler, app, user)
+                schedule_reconcile_counters_job(scheduler, app, user)
                 schedule_daily_sync(scheduler, app)
 
 
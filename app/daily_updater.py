@@ -5,7 +5,6 @@ import numpy as np
 
 import pandas as pd
 import nltk
-from bs4 import BeautifulSoup
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.text_rank import TextRankSummarizer
@@ -20,6 +19,7 @@ from app.models import (
     Settings,
     User,
 )
+from app.utils.cleaner import summary_fields
 from app.utils.text import get_text_from_url, get_image_from_url
 from app.utils.groq import groq_compare_titles, groq_request
 from app.utils.chatgpt import openai_compare_titles
@@ -53,11 +53,9 @@ def clean_text(text: str) -> str:
     return text
 
 
-def extract_first_image_link_from_summary(summary: str, link: str) -> str:
-    soup = BeautifulSoup(summary, "html.parser")
-    img_tag = soup.find("img")
-    if img_tag and "src" in img_tag.attrs:
-        return img_tag["src"]
+def first_image_link(first_image: str, link: str) -> str:
+    if first_image:
+        return first_image
 
     try:
         return get_image_from_url(link)
@@ -87,9 +85,7 @@ def create_summary(
         try:
             text = clean_text(summary_text)
             summary = extract_summary(text, num_sentences)
-            image_link = extract_first_image_link_from_summary(
-                summary_text, link
-            )
+            image_link = first_image_link(df.iloc[idx]["first_image"], link)
             summaries.append(
                 f"{df.iloc[idx]['title']}\nSummary: {summary}\nLink: {link}"
             )
@@ -191,19 +187,31 @@ def fetch_recent_articles(hours: int = 24) -> pd.DataFrame:
         logger.info("No new items to process.")
         return pd.DataFrame()
 
-    data = [
-        {
-            "id": item.id,
-            "title": item.title,
-            "summary": item.summary if item.summary else "",
-            "link": item.link,
-            "text": (item.title if item.title else "") * 5
-            + " "
-            + (item.summary if item.summary else ""),
-            "pub_date": item.pub_date,  # <-- Добавляем pub_date
-        }
-        for item in items
-    ]
+    data = []
+    for item in items:
+        # Items stored before the derived columns existed are parsed here
+        # until `flask items backfill` has run.
+        fields = (
+            summary_fields(item.summary)
+            if item.plain_text is None
+            else {
+                "plain_text": item.plain_text,
+                "first_image": item.first_image,
+            }
+        )
+        data.append(
+            {
+                "id": item.id,
+                "title": item.title,
+                "summary": fields["plain_text"],
+                "first_image": fields["first_image"],
+                "link": item.link,
+                "text": (item.title if item.title else "") * 5
+                + " "
+                + fields["plain_text"],
+                "pub_date": item.pub_date,  # <-- Добавляем pub_date
+            }
+        )
 
     return pd.DataFrame(data)
 
@@ -402,8 +410,9 @@ def save_summaries_to_db(processed_summaries: dict, df: pd.DataFrame) -> None:
     This function takes a dictionary of processed summaries and a Pandas
     DataFrame as input. It iterates over the summaries, checks if a summary is
     available for each article, and if so, saves the summary to the database.
-    If a summary is not available, it skips the article. It also extracts the
-    first image link from the summary and saves it to the database.
+    If a summary is not available, it skips the article. It also saves the
+    first image of the summary, stored with the article at ingest, or the
+    image of the linked page.
 
     Args:
         processed_summaries (dict): A dictionary of processed summaries where the
@@ -438,10 +447,8 @@ def save_summaries_to_db(processed_summaries: dict, df: pd.DataFrame) -> None:
         image_link = None
         for link in links:
             try:
-                summary_text = df.loc[df["link"] == link, "summary"].values[0]
-                image_link = extract_first_image_link_from_summary(
-                    summary_text, link
-                )
+                first_image = df.loc[df["link"] == link, "first_image"].iloc[0]
+                image_link = first_image_link(first_image, link)
                 if image_link:
                     break
             except Exception as e:
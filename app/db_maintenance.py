@@ -0,0 +1,161 @@
+"""
+Scheduled database maintenance.
+
+After the cleaner deletes old items SQLite keeps the freed pages inside the
+file and the query planner statistics go stale. This job returns free pages
+to the file system with `PRAGMA incremental_vacuum` in bounded steps, runs
+`PRAGMA optimize` on every run and a full `ANALYZE` periodically.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+from app.models import JobState
+
+ANALYZE_STATE = "db_maintenance:analyze"
+
+
+def is_sqlite(connection):
+    """Returns True if the connection is to a SQLite database."""
+    return connection.dialect.name == "sqlite"
+
+
+def pragma(connection, name):
+    """Returns the value of a single-valued SQLite PRAGMA."""
+    return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def incremental_vacuum(connection, max_pages, step=100):
+    """
+    Releases up to `max_pages` free pages, `step` pages per statement, so the
+    write lock is only held briefly.
+
+    Args:
+        connection (Connection): An SQLAlchemy connection to a SQLite DB.
+        max_pages (int): The maximum number of pages to release in total.
+        step (int): The number of pages released per statement.
+
+    Returns:
+        int: The number of pages released.
+    """
+    released = 0
+    while released < max_pages:
+        free_pages = pragma(connection, "freelist_count")
+        if not free_pages:
+            break
+        pages = min(step, free_pages, max_pages - released)
+        # The sqlite3 cursor only steps a row-less PRAGMA once, which frees a
+        # single page; executescript runs the statement to completion.
+        connection.commit()
+        connection.connection.driver_connection.executescript(
+            f"PRAGMA incremental_vacuum({int(pages)})"
+        )
+        released += pages
+    return released
+
+
+def database_file(connection):
+    """Returns the path of the main SQLite database file, if any."""
+    for row in connection.exec_driver_sql("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or None
+    return None
+
+
+def database_stats(connection, tables):
+    """
+    Collects size and row count information about the database.
+
+    Args:
+        connection (Connection): An SQLAlchemy connection.
+        tables (list[Table]): The tables to count rows for.
+
+    Returns:
+        dict: The database size, free pages and per-table row counts.
+    """
+    stats = {"dialect": connection.dialect.name, "tables": {}}
+    for table in tables:
+        stats["tables"][table.name] = connection.execute(
+            select(func.count()).select_from(table)
+        ).scalar()
+
+    if is_sqlite(connection):
+        page_size = pragma(connection, "page_size")
+        free_pages = pragma(connection, "freelist_count")
+        path = database_file(connection)
+        stats.update(
+            {
+                "file": path,
+                "file_size": (
+                    os.path.getsize(path)
+                    if path and os.path.exists(path)
+                    else None
+                ),
+                "page_size": page_size,
+                "page_count": pragma(connection, "page_count"),
+                "free_pages": free_pages,
+                "free_bytes": free_pages * page_size,
+                "auto_vacuum": pragma(connection, "auto_vacuum"),
+            }
+        )
+    return stats
+
+
+def analyze_due(state, hours):
+    """Returns True if the last full ANALYZE is older than `hours`."""
+    if state.updated_at is None:
+        return True
+    return datetime.now() - state.updated_at >= timedelta(hours=hours)
+
+
+def run_maintenance(app):
+    """
+    Runs one bounded maintenance pass.
+
+    Args:
+        app (Flask): The Flask application context to use.
+    """
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                if not is_sqlite(connection):
+                    logging.info(
+                        "Skipping maintenance, %s manages its own storage",
+                        connection.dialect.name,
+                    )
+                    return
+
+                start_time = time.monotonic()
+                released = incremental_vacuum(
+                    connection,
+                    app.config.get("MAINTENANCE_VACUUM_PAGES", 1000),
+                )
+
+                state = JobState.get_or_create(ANALYZE_STATE)
+                analyzed = analyze_due(
+                    state, app.config.get("MAINTENANCE_ANALYZE_HOURS", 24)
+                )
+                connection.exec_driver_sql(
+                    "ANALYZE" if analyzed else "PRAGMA optimize"
+                )
+                connection.commit()
+
+            if analyzed:
+                state.updated_at = datetime.now()
+            db.session.commit()
+
+            logging.info(
+                "Database maintenance released %d pages%s in %.2f seconds",
+                released,
+                " and ran ANALYZE" if analyzed else "",
+                time.monotonic() - start_time,
+            )
+        except SQLAlchemyError as e:
+            logging.error("Database error: %s", e, exc_info=True)
+            db.session.rollback()
+        except Exception as e:
+            logging.error("Unhandled exception: %s", e, exc_info=True)
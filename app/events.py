@@ -0,0 +1,180 @@
+"""
+In-process publish/subscribe of live updates, streamed to browsers by the
+`/api/events` endpoint as Server-Sent Events.
+
+Events are addressed to a user and published only after the transaction
+that caused them committed:
+
+    unread      {"feeds": {feed_id: delta}, "reset": [feed_id, ...]}
+                unread count changes, from the counter maintenance of
+                `app.feed_counters`; reset feeds have no unread items left
+    items       {"feed_id": id, "count": n} after an `update_feed` run
+                that stored new items
+    last_sync   {"last_sync": iso datetime} when the user's last sync
+                time changed
+    daily       {"duration_minutes": m} when a Daily run completed
+
+The web server and the background worker run in one process, so a broker
+held in memory reaches every open stream. Nothing is collected while no
+stream is open.
+"""
+
+import json
+import queue
+import threading
+from collections import defaultdict
+from sqlalchemy import event, inspect, select
+from app import db
+from app.models import Feed, User
+
+PENDING = "events_pending"
+QUEUE_SIZE = 100
+# How long a disconnected client waits before it reconnects.
+RETRY_MS = 5000
+
+
+class EventBroker:
+    """
+    Fans events out to the queues of the subscribed streams. A stream that
+    falls `QUEUE_SIZE` events behind gets a single `resync` event instead,
+    telling the client to reload its state.
+    """
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, user_id, limit=None):
+        """
+        Returns a new queue receiving the user's events, or None if `limit`
+        streams are open already.
+        """
+        subscription = queue.Queue(QUEUE_SIZE)
+        with self._lock:
+            if limit is not None and self._count() >= limit:
+                return None
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, user_id, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    def _count(self):
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def count(self):
+        with self._lock:
+            return self._count()
+
+    def publish(self, user_id, name, data):
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.put_nowait((name, data))
+            except queue.Full:
+                with subscription.mutex:
+                    subscription.queue.clear()
+                subscription.put_nowait(("resync", {}))
+
+
+broker = EventBroker()
+
+
+def format_event(name, data):
+    """Encodes an event in the text/event-stream format."""
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+def stream(user_id, subscription, keepalive):
+    """
+    Yields the events of a subscription as a text/event-stream, with a
+    comment every `keepalive` seconds so proxies keep the connection open.
+    Unsubscribes once the client went away.
+    """
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            try:
+                name, data = subscription.get(timeout=keepalive)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(name, data)
+    finally:
+        broker.unsubscribe(user_id, subscription)
+
+
+def publish_after_commit(session, user_id, name, data):
+    """Publishes an event once the session's transaction committed."""
+    session.info.setdefault(PENDING, []).append((user_id, name, data))
+
+
+def record_unread(session, deltas=None, reset=None):
+    """
+    Queues unread count changes for the owners of the feeds. Called by
+    `app.feed_counters` while it updates the counters.
+
+    Args:
+        session (Session): The session whose transaction made the changes.
+        deltas (dict): Unread count changes by feed ID.
+        reset (list[int] | Select): Feeds whose items were all marked as
+            read, or a statement selecting them.
+    """
+    if not broker.has_subscribers():
+        return
+    deltas = {
+        feed_id: delta for feed_id, delta in (deltas or {}).items() if delta
+    }
+    changes = defaultdict(lambda: {"feeds": {}, "reset": []})
+    connection = session.connection()
+    if deltas:
+        for feed_id, user_id in connection.execute(
+            select(Feed.id, Feed.user_id).where(Feed.id.in_(deltas))
+        ):
+            changes[user_id]["feeds"][feed_id] = deltas[feed_id]
+    if reset is not None:
+        for feed_id, user_id in connection.execute(
+            select(Feed.id, Feed.user_id).where(Feed.id.in_(reset))
+        ):
+            changes[user_id]["reset"].append(feed_id)
+    for user_id, data in changes.items():
+        publish_after_commit(session, user_id, "unread", data)
+
+
+def collect_after_flush(session, flush_context):
+    """Queues a last_sync event for users whose last sync time changed."""
+    if not broker.has_subscribers():
+        return
+    for obj in session.dirty:
+        if not isinstance(obj, User):
+            continue
+        if not inspect(obj).attrs.last_sync.history.has_changes():
+            continue
+        last_sync = obj.last_sync.isoformat() if obj.last_sync else None
+        publish_after_commit(
+            session, obj.id, "last_sync", {"last_sync": last_sync}
+        )
+
+
+def publish_after_commit_hook(session):
+    """Publishes the events queued during the committed transaction."""
+    for user_id, name, data in session.info.pop(PENDING, ()):
+        broker.publish(user_id, name, data)
+
+
+def discard_after_rollback(session, previous_transaction):
+    session.info.pop(PENDING, None)
+
+
+event.listen(db.session, "after_flush", collect_after_flush)
+event.listen(db.session, "after_commit", publish_after_commit_hook)
+event.listen(db.session, "after_soft_rollback", discard_after_rollback)
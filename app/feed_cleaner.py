@@ -1,17 +1,291 @@
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import delete, func, select
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import User, FeedItem, Feed
-from app import db
+from app.models import (
+    User,
+    FeedItem,
+    Feed,
+    ArticleLink,
+    JobState,
+    SummarizedArticle,
+)
+from app.utils import load_monitor
+from app import archive, db, feed_counters
 
 
-def clean_old_feed_items(user, app):
+def delete_feed_items(item_ids):
+    """
+    Deletes feed items and the ArticleLink rows that point to them with two
+    set-based DELETE statements and updates the feed counters. The caller is
+    responsible for committing.
+
+    Args:
+        item_ids (list[int] | Select): IDs of the feed items to delete, or a
+            statement selecting them.
+
+    Returns:
+        tuple: The number of deleted feed items and ArticleLink rows.
+    """
+    feed_counters.subtract_items(item_ids)
+    links = db.session.execute(
+        delete(ArticleLink)
+        .where(ArticleLink.original_article_id.in_(item_ids))
+        .execution_options(synchronize_session=False)
+    )
+    items = db.session.execute(
+        delete(FeedItem)
+        .where(FeedItem.id.in_(item_ids))
+        .execution_options(synchronize_session=False)
+    )
+    return items.rowcount, links.rowcount
+
+
+def delete_summarized_articles(article_ids):
+    """
+    Deletes Daily summaries and the ArticleLink rows that point to them with
+    two set-based DELETE statements. The caller is responsible for
+    committing.
+
+    Args:
+        article_ids (list[int] | Select): IDs of the summaries to delete, or
+            a statement selecting them.
+
+    Returns:
+        tuple: The number of deleted summaries and ArticleLink rows.
+    """
+    links = db.session.execute(
+        delete(ArticleLink)
+        .where(ArticleLink.summarized_article_id.in_(article_ids))
+        .execution_options(synchronize_session=False)
+    )
+    articles = db.session.execute(
+        delete(SummarizedArticle)
+        .where(SummarizedArticle.id.in_(article_ids))
+        .execution_options(synchronize_session=False)
+    )
+    return articles.rowcount, links.rowcount
+
+
+class CleanupBudget:
+    """
+    Limits the amount of work a single clean up slice may do.
+
+    A slice stops when its time or row budget is used up, when a chunk held
+    the write lock for longer than `max_chunk_seconds`, or when recent web
+    request latency is above `busy_latency`.
+    """
+
+    def __init__(
+        self,
+        seconds=None,
+        rows=None,
+        max_chunk_seconds=None,
+        busy_latency=None,
+    ):
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.rows = rows
+        self.max_chunk_seconds = max_chunk_seconds
+        self.busy_latency = busy_latency
+        self.backed_off = False
+
+    @classmethod
+    def from_config(cls, config):
+        """Creates a budget from the CLEANER_* application settings."""
+        return cls(
+            seconds=config.get("CLEANER_TIME_BUDGET"),
+            rows=config.get("CLEANER_ROW_BUDGET"),
+            max_chunk_seconds=config.get("CLEANER_MAX_CHUNK_SECONDS"),
+            busy_latency=config.get("CLEANER_BUSY_LATENCY"),
+        )
+
+    def consume(self, rows, chunk_seconds):
+        """Accounts for a deleted chunk."""
+        if self.rows is not None:
+            self.rows -= rows
+        if self.max_chunk_seconds and chunk_seconds > self.max_chunk_seconds:
+            logging.info(
+                "Clean up chunk took %.2f seconds, backing off",
+                chunk_seconds,
+            )
+            self.backed_off = True
+
+    def limit(self, chunk_size):
+        """Returns the chunk size allowed by the remaining row budget."""
+        if self.rows is None:
+            return chunk_size
+        return max(min(chunk_size, self.rows), 0)
+
+    def exhausted(self):
+        """Returns True if the slice should stop."""
+        if self.backed_off:
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return True
+        if self.rows is not None and self.rows <= 0:
+            return True
+        if self.busy_latency and load_monitor.is_busy(self.busy_latency):
+            logging.info("Web requests are slow, backing off clean up")
+            self.backed_off = True
+            return True
+        return False
+
+
+def delete_in_chunks(
+    select_ids, chunk_size, budget=None, state=None, archive_to=None
+):
+    """
+    Repeatedly selects a chunk of feed item IDs and deletes them, committing
+    after every chunk so the write lock is only held briefly.
+
+    Args:
+        select_ids (Select): A statement selecting feed item IDs to delete,
+            ordered by ID.
+        chunk_size (int): The maximum number of items deleted per chunk.
+        budget (CleanupBudget): Optional limit on the work done.
+        state (JobState): Optional cursor to resume from. It is advanced
+            after every chunk and reset once the pass is complete.
+        archive_to (str): Optional archive directory. Every chunk is written
+            to the archive before it is deleted.
+
+    Returns:
+        dict: Deleted item, archived item and link counts, number of chunks,
+        duration and whether the pass completed.
+    """
+    stats = {
+        "items": 0,
+        "archived": 0,
+        "links": 0,
+        "chunks": 0,
+        "duration": 0.0,
+        "complete": False,
+    }
+    start_time = time.monotonic()
+    while True:
+        if budget is not None and budget.exhausted():
+            break
+
+        limit = budget.limit(chunk_size) if budget else chunk_size
+        stmt = select_ids
+        if state is not None:
+            stmt = stmt.where(FeedItem.id > state.cursor)
+        item_ids = db.session.execute(stmt.limit(limit)).scalars().all()
+
+        if item_ids:
+            chunk_start = time.monotonic()
+            if archive_to is not None:
+                stats["archived"] += archive.archive_items(
+                    archive_to, archive.load_archive_rows(item_ids)
+                )
+            items, links = delete_feed_items(item_ids)
+            if state is not None:
+                state.cursor = item_ids[-1]
+                state.updated_at = datetime.now()
+            db.session.commit()
+
+            stats["items"] += items
+            stats["links"] += links
+            stats["chunks"] += 1
+            if budget is not None:
+                budget.consume(items, time.monotonic() - chunk_start)
+
+        if len(item_ids) < limit:
+            stats["complete"] = True
+            if state is not None:
+                state.cursor = 0
+                state.updated_at = datetime.now()
+                db.session.commit()
+            break
+
+    stats["duration"] = time.monotonic() - start_time
+    return stats
+
+
+def excess_item_ids(feed_id, max_items):
+    """
+    Returns a statement selecting the items of a feed beyond its newest
+    `max_items`. Items are ranked with ROW_NUMBER() by publication date;
+    favourites are neither ranked nor selected.
+    """
+    rank = (
+        func.row_number()
+        .over(order_by=(FeedItem.pub_date.desc(), FeedItem.id.desc()))
+        .label("rank")
+    )
+    ranked = (
+        select(FeedItem.id, rank)
+        .where(
+            FeedItem.feed_id == feed_id,
+            FeedItem.favourite.is_(False),
+        )
+        .subquery()
+    )
+    return select(ranked.c.id).where(ranked.c.rank > max_items)
+
+
+def enforce_item_caps(user_id, budget=None, archive_to=None):
+    """
+    Trims every capped feed of a user down to its `max_items` newest items
+    with one ranked DELETE per feed, committing after every feed.
+
+    Args:
+        user_id (int): The user whose feeds are trimmed.
+        budget (CleanupBudget): Optional limit on the work done.
+        archive_to (str): Optional archive directory. Excess items are
+            written to the archive before they are deleted.
+
+    Returns:
+        dict: Deleted item, archived item and link counts and the number of
+        trimmed feeds.
+    """
+    stats = {"items": 0, "archived": 0, "links": 0, "feeds": 0}
+    capped_feeds = db.session.execute(
+        select(Feed.id, Feed.max_items).where(
+            Feed.user_id == user_id, Feed.max_items.is_not(None)
+        )
+    ).all()
+    for feed_id, max_items in capped_feeds:
+        if budget is not None and budget.exhausted():
+            break
+
+        chunk_start = time.monotonic()
+        excess_ids = excess_item_ids(feed_id, max_items)
+        if archive_to is not None:
+            stats["archived"] += archive.archive_items(
+                archive_to, archive.load_archive_rows(excess_ids)
+            )
+        items, links = delete_feed_items(excess_ids)
+        db.session.commit()
+
+        if items:
+            stats["feeds"] += 1
+        stats["items"] += items
+        stats["links"] += links
+        if budget is not None:
+            budget.consume(items, time.monotonic() - chunk_start)
+    return stats
+
+
+def clean_old_feed_items(user, app, budget=None):
     """
     Cleans old feed items for a specific user based on user settings.
 
+    Expired items are deleted in bounded chunks with set-based statements,
+    without loading them into the session. If the user enabled
+    `archive_expired` they are moved to the archive first. The position of
+    the scan is persisted, so a run stopped by its budget resumes where it
+    left off. Feeds with a `max_items` cap are trimmed first.
+
     Args:
         user (User): The user whose feed items need to be cleaned.
         app (Flask): The Flask application context to use.
+        budget (CleanupBudget): Optional limit on the work done.
+
+    Returns:
+        dict: Deleted item and link counts, number of chunks, duration,
+        whether the pass completed and the number of items removed by feed
+        caps, or None if the clean up failed.
     """
     with app.app_context():
         logging.info(
@@ -28,50 +302,147 @@ def clean_old_feed_items(user, app):
                 cutoff_date,
             )
 
-            feeds = (
-                db.session.query(Feed).filter(Feed.user_id == user.id).all()
-            )
-            for feed in feeds:
-                old_items = (
-                    db.session.query(FeedItem)
-                    .filter(
-                        FeedItem.feed_id == feed.id,
-                        FeedItem.pub_date < cutoff_date,
-                        FeedItem.favourite == False,
-                    )
-                    .all()
+            user_feed_ids = select(Feed.id).where(Feed.user_id == user.id)
+            select_ids = (
+                select(FeedItem.id)
+                .where(
+                    FeedItem.feed_id.in_(user_feed_ids),
+                    FeedItem.pub_date < cutoff_date,
+                    FeedItem.favourite.is_(False),
                 )
-
+                .order_by(FeedItem.id)
+            )
+            archive_to = (
+                archive.archive_dir(app)
+                if user.settings.archive_expired
+                else None
+            )
+            capped = enforce_item_caps(user.id, budget, archive_to)
+            if capped["feeds"]:
                 logging.info(
-                    "Found %d old items for feed %d", len(old_items), feed.id
+                    "Trimmed %d capped feeds for user %s: %d items deleted",
+                    capped["feeds"],
+                    user.username,
+                    capped["items"],
                 )
-                for item in old_items:
-                    logging.debug(
-                        'Deleting feed item "%s" with pub_date %s',
-                        item.title,
-                        item.pub_date,
+
+            state = JobState.get_or_create(f"feed_cleaner:{user.id}")
+            stats = delete_in_chunks(
+                select_ids,
+                app.config.get("CLEANER_CHUNK_SIZE", 500),
+                budget=budget,
+                state=state,
+                archive_to=archive_to,
+            )
+            stats["capped"] = capped["items"]
+
+            logging.info(
+                "Old feed items cleaned up for user %s: %d items (%d "
+                "archived) and %d article links deleted in %d chunks, "
+                "%.2f seconds%s",
+                user.username,
+                stats["items"],
+                stats["archived"],
+                stats["links"],
+                stats["chunks"],
+                stats["duration"],
+                "" if stats["complete"] else ", will resume later",
+            )
+            return stats
+        except SQLAlchemyError as e:
+            logging.error("Database error: %s", e, exc_info=True)
+            db.session.rollback()
+        except Exception as e:
+            logging.error("Unhandled exception: %s", e, exc_info=True)
+        return None
+
+
+def clean_summarized_articles(app):
+    """
+    Removes Daily summaries older than `DAILY_RETENTION_DAYS` and summaries
+    that no ArticleLink points to any more, because the cleaner deleted
+    their original articles.
+
+    Summaries are committed before their links are created, so orphans
+    younger than `DAILY_ORPHAN_GRACE_MINUTES` are kept.
+
+    Args:
+        app (Flask): The Flask application context to use.
+
+    Returns:
+        dict: The number of expired and orphaned summaries and of deleted
+        ArticleLink rows, or None if the clean up failed.
+    """
+    with app.app_context():
+        try:
+            stats = {"expired": 0, "orphaned": 0, "links": 0}
+            retention_days = app.config.get("DAILY_RETENTION_DAYS", 90)
+            if retention_days:
+                cutoff_date = datetime.now() - timedelta(days=retention_days)
+                expired_ids = select(SummarizedArticle.id).where(
+                    func.coalesce(
+                        SummarizedArticle.pub_date,
+                        SummarizedArticle.created_at,
                     )
-                    db.session.delete(item)
+                    < cutoff_date
+                )
+                stats["expired"], stats["links"] = delete_summarized_articles(
+                    expired_ids
+                )
 
+            grace_cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(
+                minutes=app.config.get("DAILY_ORPHAN_GRACE_MINUTES", 60)
+            )
+            orphaned = db.session.execute(
+                delete(SummarizedArticle)
+                .where(
+                    ~select(ArticleLink.id)
+                    .where(
+                        ArticleLink.summarized_article_id
+                        == SummarizedArticle.id
+                    )
+                    .exists(),
+                    SummarizedArticle.created_at < grace_cutoff,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            stats["orphaned"] = orphaned.rowcount
             db.session.commit()
+
             logging.info(
-                "Old feed items cleaned up for user %s", user.username
+                "Daily summaries cleaned up: %d expired, %d orphaned, %d "
+                "article links deleted",
+                stats["expired"],
+                stats["orphaned"],
+                stats["links"],
             )
+            return stats
         except SQLAlchemyError as e:
             logging.error("Database error: %s", e, exc_info=True)
             db.session.rollback()
         except Exception as e:
             logging.error("Unhandled exception: %s", e, exc_info=True)
+        return None
 
 
 def clean_feeds(app):
     """
     This function cleans the feeds for all users.
+
+    It runs as a small, time-budgeted slice (see `CleanupBudget`) and is
+    scheduled often; every slice resumes from the persisted cursor. Daily
+    summaries are cleaned up at the end of every slice that did not back off
+    for the web tier.
+
     Args:
         app (Flask): The Flask application context to use.
     """
     with app.app_context():
         logging.info("Starting feed clean up thread")
+        budget = CleanupBudget.from_config(app.config)
+        if budget.exhausted():
+            logging.info("Skipping feed clean up slice, web tier is busy")
+            return
         try:
             users = db.session.query(User).all()
             if not users:
@@ -85,7 +456,14 @@ def clean_feeds(app):
                     )
                     continue
 
-                clean_old_feed_items(user, app)
+                clean_old_feed_items(user, app, budget)
+                if budget.exhausted():
+                    break
+
+            # A backlog of expired items can use up every slice, so the few
+            # Daily summaries are cleaned up whenever a slice ends.
+            if not budget.backed_off:
+                clean_summarized_articles(app)
 
         except SQLAlchemyError as e:
             logging.error("Database error: %s", e, exc_info=True)
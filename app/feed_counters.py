@@ -0,0 +1,269 @@
+"""
+Maintains the denormalized per-feed item counts in `FeedCounter`.
+
+Changes made through the ORM (new items, mark as read, deleted feeds) are
+applied after every flush, aggregated to one UPDATE per touched feed. Bulk
+UPDATE and DELETE statements bypass the ORM, so their callers use
+`subtract_items`, `mark_items_read`, `mark_items_unread` and
+`mark_feeds_read` in the same transaction. A periodic `reconcile_counters`
+job recounts everything to repair any drift. The counters are written
+through the session's connection, so these functions flag the session for
+`app.utils.http_cache` themselves.
+"""
+
+import logging
+from collections import Counter, defaultdict
+from sqlalchemy import case, delete, event, func, insert, inspect, select
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from app import db, events
+from app.models import Feed, FeedCounter, FeedItem
+from app.utils import http_cache
+
+counters = FeedCounter.__table__
+
+
+def count_items(feed_ids=None):
+    """
+    Returns a statement counting unread and total items per feed.
+
+    Args:
+        feed_ids (list[int]): Optional feeds to count, all feeds if None.
+    """
+    stmt = (
+        select(
+            Feed.id,
+            func.count(case((FeedItem.read.is_(False), 1))),
+            func.count(FeedItem.id),
+        )
+        .outerjoin(FeedItem, FeedItem.feed_id == Feed.id)
+        .group_by(Feed.id)
+    )
+    if feed_ids is not None:
+        stmt = stmt.where(Feed.id.in_(feed_ids))
+    return stmt
+
+
+def recount(connection, feed_ids=None):
+    """
+    Replaces the counters of the given feeds (or all feeds) with freshly
+    counted values.
+    """
+    stmt = delete(counters)
+    if feed_ids is not None:
+        stmt = stmt.where(counters.c.feed_id.in_(feed_ids))
+    connection.execute(stmt)
+    connection.execute(
+        insert(counters).from_select(
+            ["feed_id", "unread", "total"], count_items(feed_ids)
+        )
+    )
+
+
+def apply_deltas(connection, deltas):
+    """
+    Adds `(unread, total)` deltas to the counters of each feed. Feeds without
+    a counter row are recounted instead.
+    """
+    missing = []
+    for feed_id, (unread, total) in deltas.items():
+        if not unread and not total:
+            continue
+        result = connection.execute(
+            update(counters)
+            .where(counters.c.feed_id == feed_id)
+            .values(
+                unread=counters.c.unread + unread,
+                total=counters.c.total + total,
+            )
+        )
+        if result.rowcount == 0:
+            missing.append(feed_id)
+    if missing:
+        recount(connection, missing)
+
+
+def read_state_change(item):
+    """
+    Returns -1 if a dirty item was marked as read, 1 if it was marked as
+    unread and 0 otherwise.
+    """
+    history = inspect(item).attrs.read.history
+    if not history.deleted or bool(history.deleted[0]) == bool(item.read):
+        return 0
+    return -1 if item.read else 1
+
+
+def update_counters_after_flush(session, flush_context):
+    """
+    Applies the item changes of a flush to the counters.
+    """
+    deleted_feeds = {
+        obj.id for obj in session.deleted if isinstance(obj, Feed)
+    }
+    new_feeds = [obj.id for obj in session.new if isinstance(obj, Feed)]
+    deltas = defaultdict(lambda: [0, 0])
+
+    for item in session.new:
+        if isinstance(item, FeedItem):
+            deltas[item.feed_id][0] += 0 if item.read else 1
+            deltas[item.feed_id][1] += 1
+    for item in session.deleted:
+        if isinstance(item, FeedItem):
+            read = inspect(item).attrs.read.history.non_added()
+            deltas[item.feed_id][0] -= 1 if read and not read[0] else 0
+            deltas[item.feed_id][1] -= 1
+    for item in session.dirty:
+        if isinstance(item, FeedItem):
+            deltas[item.feed_id][0] += read_state_change(item)
+
+    if not (deleted_feeds or new_feeds or deltas):
+        return
+
+    connection = session.connection()
+    if deleted_feeds:
+        connection.execute(
+            delete(counters).where(counters.c.feed_id.in_(deleted_feeds))
+        )
+    if new_feeds:
+        recount(connection, new_feeds)
+    deltas = {
+        feed_id: delta
+        for feed_id, delta in deltas.items()
+        if feed_id not in deleted_feeds and feed_id not in new_feeds
+    }
+    apply_deltas(connection, deltas)
+    events.record_unread(
+        session, {feed_id: unread for feed_id, (unread, _) in deltas.items()}
+    )
+
+
+event.listen(db.session, "after_flush", update_counters_after_flush)
+
+
+def subtract_items(item_ids):
+    """
+    Subtracts items from their feeds' counters. Called right before a bulk
+    DELETE of the same items, in the same transaction.
+
+    Args:
+        item_ids (list[int] | Select): IDs of the items, or a statement
+            selecting them.
+    """
+    rows = db.session.execute(
+        select(
+            FeedItem.feed_id,
+            func.count(case((FeedItem.read.is_(False), 1))),
+            func.count(FeedItem.id),
+        )
+        .where(FeedItem.id.in_(item_ids))
+        .group_by(FeedItem.feed_id)
+    ).all()
+    apply_deltas(
+        db.session.connection(),
+        {feed_id: (-unread, -total) for feed_id, unread, total in rows},
+    )
+    http_cache.flag(db.session)
+    events.record_unread(
+        db.session, {feed_id: -unread for feed_id, unread, _ in rows}
+    )
+
+
+def change_unread(feed_ids, sign):
+    changed = Counter(feed_ids)
+    apply_deltas(
+        db.session.connection(),
+        {feed_id: (sign * count, 0) for feed_id, count in changed.items()},
+    )
+    http_cache.flag(db.session)
+    events.record_unread(
+        db.session,
+        {feed_id: sign * count for feed_id, count in changed.items()},
+    )
+    return dict(changed)
+
+
+def mark_items_read(feed_ids):
+    """
+    Subtracts items marked as read by a bulk UPDATE from their feeds' unread
+    counters. Called in the same transaction, with the feed ID of each
+    changed row, e.g. from the statement's RETURNING clause.
+
+    Args:
+        feed_ids (list[int]): One feed ID per item that was marked as read.
+
+    Returns:
+        dict: The number of items marked as read per feed ID.
+    """
+    return change_unread(feed_ids, -1)
+
+
+def mark_items_unread(feed_ids):
+    """
+    Adds items marked as unread by a bulk UPDATE to their feeds' unread
+    counters, see `mark_items_read`.
+    """
+    return change_unread(feed_ids, 1)
+
+
+def mark_feeds_read(feed_ids):
+    """
+    Resets the unread counters of feeds whose items were all marked as read
+    by a bulk UPDATE.
+
+    Args:
+        feed_ids (list[int] | Select): IDs of the feeds, or a statement
+            selecting them.
+    """
+    db.session.connection().execute(
+        update(counters)
+        .where(counters.c.feed_id.in_(feed_ids))
+        .values(unread=0)
+    )
+    http_cache.flag(db.session)
+    events.record_unread(db.session, reset=feed_ids)
+
+
+def reconcile_counters(app):
+    """
+    Recounts all feeds and logs how many counters had drifted.
+
+    Args:
+        app (Flask): The Flask application context to use.
+
+    Returns:
+        int: The number of corrected counters, or None if the job failed.
+    """
+    with app.app_context():
+        try:
+            connection = db.session.connection()
+            before = {
+                row.feed_id: (row.unread, row.total)
+                for row in connection.execute(select(counters))
+            }
+            recount(connection)
+            after = {
+                row.feed_id: (row.unread, row.total)
+                for row in connection.execute(select(counters))
+            }
+            drifted = sum(
+                1
+                for feed_id, counts in after.items()
+                if before.get(feed_id) != counts
+            )
+            if drifted:
+                # Cached responses show the drifted counts.
+                http_cache.flag(db.session)
+            db.session.commit()
+
+            if drifted:
+                logging.warning("Reconciled %d drifted feed counters", drifted)
+            else:
+                logging.info("Feed counters are consistent")
+            return drifted
+        except SQLAlchemyError as e:
+            logging.error("Database error: %s", e, exc_info=True)
+            db.session.rollback()
+        except Exception as e:
+            logging.error("Unhandled exception: %s", e, exc_info=True)
+        return None
@@ -0,0 +1,159 @@
+"""
+Rolling feed scheduler.
+
+Instead of refreshing every feed at the same instant once per update
+interval, each feed gets a stable offset inside the interval, derived from a
+hash of its ID, plus a small random jitter. A tick job runs every
+`FEED_SCHEDULER_TICK` seconds and refreshes only the feeds that are due, which
+spreads outbound requests and database writes evenly across the interval.
+"""
+
+import logging
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, UTC
+from pytz import timezone as pytz_timezone
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+from app.models import User, Feed
+from .feed_updater import update_feed
+
+_next_due = {}
+_interval_seconds = None
+_lock = threading.Lock()
+
+
+def feed_offset(feed_id, interval_seconds):
+    """
+    Returns the stable offset of a feed inside the update interval.
+
+    Args:
+        feed_id (int): The ID of the feed.
+        interval_seconds (int): The length of the update interval.
+
+    Returns:
+        int: Seconds from the start of an interval window.
+    """
+    return zlib.crc32(str(feed_id).encode()) % max(interval_seconds, 1)
+
+
+def next_due_time(feed_id, interval_seconds, now, jitter_seconds=0):
+    """
+    Calculates the next time a feed should be refreshed.
+
+    Slots repeat every `interval_seconds`, starting at the feed's offset.
+    A random jitter of up to `jitter_seconds` is added to each slot.
+
+    Args:
+        feed_id (int): The ID of the feed.
+        interval_seconds (int): The length of the update interval.
+        now (datetime): The current time (timezone aware).
+        jitter_seconds (float): The maximum jitter to add.
+
+    Returns:
+        datetime: The next due time, always after `now`.
+    """
+    interval_seconds = max(interval_seconds, 1)
+    offset = feed_offset(feed_id, interval_seconds)
+    timestamp = now.timestamp()
+    window_start = timestamp - (timestamp % interval_seconds)
+    due = window_start + offset
+    if due <= timestamp:
+        due += interval_seconds
+    if jitter_seconds:
+        due += random.uniform(0, jitter_seconds)
+    return datetime.fromtimestamp(due, UTC)
+
+
+def reset_schedule(feed_ids=None):
+    """
+    Forgets the due times of the given feeds, or of every feed.
+
+    Forgotten feeds are assigned their next slot on the following tick. This
+    is used after a feed has been refreshed outside the rolling schedule.
+    """
+    with _lock:
+        if feed_ids is None:
+            _next_due.clear()
+        else:
+            for feed_id in feed_ids:
+                _next_due.pop(feed_id, None)
+
+
+def collect_due_feeds(feeds, interval_seconds, jitter_seconds, now):
+    """
+    Returns the feeds that are due and advances their due times.
+
+    Feeds without a due time yet are only scheduled, not returned.
+    """
+    global _interval_seconds
+    due_feeds = []
+    with _lock:
+        if interval_seconds != _interval_seconds:
+            _next_due.clear()
+            _interval_seconds = interval_seconds
+
+        feed_ids = set()
+        for feed in feeds:
+            feed_ids.add(feed.id)
+            due = _next_due.get(feed.id)
+            if due is not None and due <= now:
+                due_feeds.append(feed)
+            if due is None or due <= now:
+                _next_due[feed.id] = next_due_time(
+                    feed.id, interval_seconds, now, jitter_seconds
+                )
+
+        for feed_id in set(_next_due) - feed_ids:
+            del _next_due[feed_id]
+
+    return due_feeds
+
+
+def update_due_feeds(app):
+    """
+    Refreshes the feeds whose slot in the update interval has passed.
+
+    Args:
+        app (Flask): The Flask application context to use.
+    """
+    with app.app_context():
+        try:
+            user = db.session.query(User).first()
+            if not user or not user.settings:
+                return
+
+            interval_seconds = user.settings.update_interval * 60
+            jitter_seconds = min(
+                app.config.get("FEED_SCHEDULER_JITTER", 30),
+                interval_seconds / 10,
+            )
+            now = datetime.now(UTC)
+            feeds = db.session.query(Feed).filter_by(user_id=user.id).all()
+            due_feeds = collect_due_feeds(
+                feeds, interval_seconds, jitter_seconds, now
+            )
+            if not due_feeds:
+                return
+
+            user_timezone = pytz_timezone(user.settings.timezone)
+            start_time = time.time()
+            new_items = 0
+            for feed in due_feeds:
+                new_items += update_feed(feed, user, user_timezone) or 0
+
+            user.last_sync = now
+            db.session.commit()
+            logging.info(
+                "Refreshed %d due feeds with %d new items in %.2f seconds",
+                len(due_feeds),
+                new_items,
+                time.time() - start_time,
+            )
+        except SQLAlchemyError as e:
+            logging.error("Database error: %s", e, exc_info=True)
+            db.session.rollback()
+        except Exception as e:
+            logging.error("Unhandled exception: %s", e, exc_info=True)
@@ -6,8 +6,8 @@ import feedparser
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from pytz import timezone as pytz_timezone
 from app.models import User, Feed, FeedItem
-from app import db, create_app
-from app.utils.cleaner import clean_summary
+from app import db, create_app, events
+from app.utils.cleaner import clean_summary, summary_fields
 
 app = create_app()
 
@@ -27,7 +27,14 @@ def update_user_feeds(user):
 
 
 def update_feed(feed, user, user_timezone):
+    """
+    Fetches a single feed and stores entries that are not in the database yet.
+
+    Returns:
+        int: The number of new items added.
+    """
     logging.info("Updating feed %s", feed.title)
+    new_items = 0
     try:
         feed_data = feedparser.parse(feed.url, sanitize_html=False)
     except http.client.RemoteDisconnected:
@@ -35,7 +42,7 @@ def update_feed(feed, user, user_timezone):
             "Failed to update feed %s due to connection issues. Moving on to the next feed.",
             feed.url,
         )
-        return
+        return new_items
     entries = feed_data.entries
     clean_after_date = datetime.now(user_timezone) - timedelta(
         days=user.settings.clean_after_days - 1
@@ -150,6 +157,7 @@ def update_feed(feed, user, user_timezone):
                 link=entry.link,
                 pub_date=pub_date,
                 summary=summary,
+                **summary_fields(summary),
                 guid=guid,
                 feed_id=feed.id,
                 creator=creator,
@@ -157,6 +165,7 @@ def update_feed(feed, user, user_timezone):
             try:
                 db.session.add(new_item)
                 db.session.commit()
+                new_items += 1
                 logging.info("New feed item added: %s", new_item.title)
             except IntegrityError as e:
                 db.session.rollback()
@@ -167,8 +176,17 @@ def update_feed(feed, user, user_timezone):
                 db.session.rollback()
                 logging.error("Error adding feed item: %s", e)
 
+    if new_items:
+        events.broker.publish(
+            user.id, "items", {"feed_id": feed.id, "count": new_items}
+        )
+    return new_items
+
 
 def update_feeds_thread(app=app):
+    # Imported here to avoid a circular import with feed_scheduler.
+    from .feed_scheduler import reset_schedule
+
     with app.app_context():
         logging.info("Starting feed update thread")
         try:
@@ -190,6 +208,9 @@ def update_feeds_thread(app=app):
             update_user_feeds(user)
             user.last_sync = now
             db.session.commit()
+            # Every feed is fresh now, let the rolling scheduler assign new
+            # slots from here on.
+            reset_schedule()
             end_time = time.time()
             elapsed_time = end_time - start_time
             logging.info(
@@ -0,0 +1,80 @@
+"""
+Backfills the fields derived from the summary of feed items.
+
+New items get their plain text, excerpt, first image and word count at
+ingest (see `app.utils.cleaner.summary_fields`). Items stored before those
+columns existed are filled in by `flask items backfill`, in batches so the
+write lock is only held briefly.
+"""
+
+import logging
+import click
+from flask.cli import AppGroup
+from sqlalchemy import select, update
+from app import db
+from app.models import FeedItem
+from app.utils.cleaner import summary_fields
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def backfill_batch(last_id, batch_size=BACKFILL_BATCH_SIZE):
+    """
+    Derives the fields of up to `batch_size` items without plain text and
+    an ID above `last_id`, and commits them.
+
+    Returns:
+        tuple: The number of updated items and the last processed ID.
+    """
+    rows = db.session.execute(
+        select(FeedItem.id, FeedItem.summary)
+        .where(FeedItem.plain_text.is_(None), FeedItem.id > last_id)
+        .order_by(FeedItem.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0, last_id
+
+    db.session.execute(
+        update(FeedItem),
+        [
+            {"id": item_id, **summary_fields(summary)}
+            for item_id, summary in rows
+        ],
+    )
+    db.session.commit()
+    return len(rows), rows[-1].id
+
+
+def backfill_derived_fields(batch_size=BACKFILL_BATCH_SIZE):
+    """
+    Fills in the derived fields of all items that do not have them yet.
+
+    Returns:
+        int: The number of updated items.
+    """
+    updated = 0
+    last_id = 0
+    while True:
+        count, last_id = backfill_batch(last_id, batch_size)
+        if not count:
+            break
+        updated += count
+        logging.info("Backfilled %d feed items up to ID %d", updated, last_id)
+    return updated
+
+
+items_cli = AppGroup("items", help="Maintain stored feed items.")
+
+
+@items_cli.command("backfill")
+@click.option("--batch-size", default=BACKFILL_BATCH_SIZE, show_default=True)
+def backfill_command(batch_size):
+    """Derive plain text, excerpt, first image and word count."""
+    updated = backfill_derived_fields(batch_size)
+    click.echo(f"Backfilled {updated} feed items")
+
+
+def init_app(app):
+    """Registers the `flask items` commands."""
+    app.cli.add_command(items_cli)
@@ -2,6 +2,16 @@ from datetime import datetime, timezone
 from flask_login import UserMixin
 from werkzeug.security import check_password_hash
 from .extensions import db
+from .utils.compression import CompressedText
+
+
+def bounded_string(length):
+    """
+    Returns a VARCHAR(length) column type. SQLite never enforces the length,
+    so PostgreSQL uses TEXT instead and long feed titles and links are
+    stored rather than rejected.
+    """
+    return db.String(length).with_variant(db.Text(), "postgresql")
 
 
 class User(UserMixin, db.Model):
@@ -63,8 +73,8 @@ db.Index("index_category_user_id", Category.user_id)
 
 class Feed(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(200), nullable=True)
-    url = db.Column(db.String(200), unique=True, nullable=False)
+    title = db.Column(bounded_string(200), nullable=True)
+    url = db.Column(bounded_string(200), unique=True, nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     category_id = db.Column(
         db.Integer, db.ForeignKey("category.id"), nullable=True
@@ -73,6 +83,7 @@ class Feed(db.Model):
         "FeedItem", backref="feed", lazy=True, cascade="all, delete-orphan"
     )
     daily_enabled = db.Column(db.Boolean, default=True, nullable=False)
+    max_items = db.Column(db.Integer, nullable=True)
 
     def to_dict(self):
         return {
@@ -80,6 +91,7 @@ class Feed(db.Model):
             "title": self.title,
             "url": self.url,
             "daily_enabled": self.daily_enabled,
+            "max_items": self.max_items,
         }
 
 
@@ -96,6 +108,10 @@ class FeedItem(db.Model):
         title (str): The title of the feed item.
         link (str): The URL of the feed item.
         summary (str): A brief summary of the feed item.
+        plain_text (str): The text of the summary without HTML.
+        excerpt (str): The beginning of the plain text, for previews.
+        first_image (str): The URL of the first image in the summary.
+        word_count (int): The number of words in the summary.
         pub_date (datetime): The publication date of the feed item.
         creator (str): The creator of the feed item.
         read (bool): Whether the feed item has been read.
@@ -111,14 +127,28 @@ class FeedItem(db.Model):
     """
 
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(200), nullable=False)
-    link = db.Column(db.String(200), unique=True, nullable=False)
-    summary = db.Column(db.Text, nullable=True)
+    title = db.Column(bounded_string(200), nullable=False)
+    link = db.Column(bounded_string(200), unique=True, nullable=False)
+    # The summary and its plain text are stored compressed, see
+    # app.utils.compression.
+    summary = db.Column(CompressedText, nullable=True)
+    # Derived from the summary at ingest, see cleaner.summary_fields. NULL
+    # for items stored before these columns existed, until `flask items
+    # backfill` has run.
+    plain_text = db.Column(CompressedText, nullable=True)
+    excerpt = db.Column(db.String(300), nullable=True)
+    first_image = db.Column(db.Text, nullable=True)
+    word_count = db.Column(db.Integer, nullable=True)
     pub_date = db.Column(db.DateTime, nullable=True, index=True)
-    creator = db.Column(db.String(200), nullable=True)
-    read = db.Column(db.Boolean, default=False, nullable=False)
+    creator = db.Column(bounded_string(200), nullable=True)
+    # The previous value is loaded on change so the unread counters can tell
+    # whether an item was actually marked as read, see app.feed_counters.
+    read = db.column_property(
+        db.Column(db.Boolean, default=False, nullable=False),
+        active_history=True,
+    )
     favourite = db.Column(db.Boolean, default=False, nullable=False)
-    guid = db.Column(db.String(500))
+    guid = db.Column(bounded_string(500))
     feed_id = db.Column(db.Integer, db.ForeignKey("feed.id"), nullable=False)
     summarized_articles = db.relationship(
         "ArticleLink",
@@ -138,6 +168,9 @@ class FeedItem(db.Model):
             "title": self.title,
             "link": self.link,
             "summary": self.summary,
+            "excerpt": self.excerpt,
+            "first_image": self.first_image,
+            "word_count": self.word_count,
             "pub_date": self.pub_date.isoformat() if self.pub_date else None,
             "creator": self.creator,
             "read": self.read,
@@ -146,8 +179,27 @@ class FeedItem(db.Model):
         }
 
 
-db.Index("index_feed_item_feed_id", FeedItem.feed_id)
-db.Index("index_feed_item_read", FeedItem.read)
+# The listings page through items ordered by (pub_date DESC, id DESC), these
+# indexes let every listing walk feed_item in that order instead of sorting.
+db.Index(
+    "index_feed_item_feed_id_read_pub_date",
+    FeedItem.feed_id,
+    FeedItem.read,
+    FeedItem.pub_date,
+    FeedItem.id,
+)
+db.Index(
+    "index_feed_item_feed_id_pub_date",
+    FeedItem.feed_id,
+    FeedItem.pub_date,
+    FeedItem.id,
+)
+db.Index(
+    "index_feed_item_read_pub_date",
+    FeedItem.read,
+    FeedItem.pub_date,
+    FeedItem.id,
+)
 
 
 class SummarizedArticle(db.Model):
@@ -171,9 +223,11 @@ class SummarizedArticle(db.Model):
     """
 
     id = db.Column(db.Integer, primary_key=True)
-    summary = db.Column(db.Text)
+    summary = db.Column(CompressedText)
     link = db.Column(db.String, unique=True)
-    created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(timezone.utc)
+    )
     pub_date = db.Column(db.DateTime, nullable=True)
     image_link = db.Column(db.String, nullable=True)
     read = db.Column(db.Boolean, default=False, nullable=False)
@@ -230,6 +284,8 @@ class Settings(db.Model):
             feeds are updated.
         clean_after_days (int): The number of days after which unread
             items are cleaned up.
+        archive_expired (bool): Whether cleaned up items are moved to the
+            archive instead of being deleted.
         user_id (int): Foreign key referencing the User model.
         timezone (str): The user's preferred timezone.
         language (str): The user's preferred language.
@@ -253,6 +309,7 @@ class Settings(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     update_interval = db.Column(db.Integer, nullable=False, default=60)
     clean_after_days = db.Column(db.Integer, nullable=False, default=60)
+    archive_expired = db.Column(db.Boolean, nullable=False, default=False)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     timezone = db.Column(db.String(50), nullable=False, default="UTC")
     language = db.Column(db.String(50), nullable=False, default="English")
@@ -284,3 +341,48 @@ class Settings(db.Model):
             settings record.
         """
         return f"Settings(id={self.id}, user_id={self.user_id})"
+
+
+class JobState(db.Model):
+    """
+    Persisted state of a resumable background job.
+
+    Attributes:
+        id (int): Unique identifier for the job state record.
+        name (str): Unique name of the job, e.g. "feed_cleaner:1".
+        cursor (int): The position the job resumes from on its next run.
+        updated_at (datetime): When the state was last saved.
+    """
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False)
+    cursor = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+    @classmethod
+    def get_or_create(cls, name):
+        """Returns the state with the given name, adding it if missing."""
+        state = cls.query.filter_by(name=name).first()
+        if state is None:
+            state = cls(name=name, cursor=0)
+            db.session.add(state)
+        return state
+
+
+class FeedCounter(db.Model):
+    """
+    Denormalized item counts of a feed, maintained by `app.feed_counters`.
+
+    Attributes:
+        feed_id (int): The feed the counts belong to.
+        unread (int): The number of unread items of the feed.
+        total (int): The number of items of the feed.
+    """
+
+    feed_id = db.Column(
+        db.Integer,
+        db.ForeignKey("feed.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    unread = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,428 @@
+"""
+Write-behind buffer for the read and favourite state of feed items.
+
+Marking items as read is acknowledged as soon as the change is in memory
+and in a journal, a small SQLite database of its own in WAL mode that does
+not contend for the main database's write lock. Changes to the same item
+are merged, and a flush thread writes everything pending in one
+transaction every READ_STATE_FLUSH_MS milliseconds, or as soon as
+READ_STATE_FLUSH_ITEMS items are pending. Changes still in the journal are
+replayed after a restart. Only the process serving requests buffers, see
+`start`; every other app writes through.
+
+Until they are flushed, pending changes are applied on top of what the
+database returns: `apply_overlay` for listing rows, `unread_deltas` for
+unread counters. With READ_STATE_FLUSH_MS = 0 changes are written through
+instead.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import defaultdict, namedtuple
+from flask import current_app
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+from app.feed_counters import mark_items_read, mark_items_unread
+from app.models import Feed, FeedItem
+from app.utils import http_cache
+
+# A pending change of one item. `was_read` is the read state in the
+# database when the change was queued, `read` and `favourite` are the new
+# states, or None if unchanged.
+Change = namedtuple(
+    "Change", ["user_id", "feed_id", "was_read", "read", "favourite", "seq"]
+)
+
+STATE_COLUMNS = ("read", "favourite")
+# Items per UPDATE, keeps statements below SQLite's variable limit.
+CHUNK_SIZE = 500
+
+JOURNAL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending (
+    item_id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    feed_id INTEGER NOT NULL,
+    was_read INTEGER NOT NULL,
+    read INTEGER,
+    favourite INTEGER,
+    seq INTEGER NOT NULL
+)
+"""
+
+
+def merge(old, new):
+    """Merges a newer change of an item into an older one."""
+    if old is None:
+        return new
+    return new._replace(
+        was_read=old.was_read,
+        read=old.read if new.read is None else new.read,
+        favourite=old.favourite if new.favourite is None else new.favourite,
+    )
+
+
+class Journal:
+    """The pending changes on disk, so they survive a restart."""
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        # WAL with synchronous=NORMAL survives a crash of the process, an
+        # fsync per change would cost more than the write it replaces.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(JOURNAL_SCHEMA)
+
+    def load(self):
+        return {
+            row[0]: Change(*row[1:])
+            for row in self._connection.execute(
+                "SELECT item_id, user_id, feed_id, was_read, read, "
+                "favourite, seq FROM pending"
+            )
+        }
+
+    def save(self, changes):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pending VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(item_id, *change) for item_id, change in changes.items()],
+            )
+
+    def remove(self, changes):
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM pending WHERE item_id = ? AND seq = ?",
+                [(item_id, change.seq) for item_id, change in changes],
+            )
+
+
+class ReadStateBuffer:
+    """
+    Pending read and favourite changes by item ID. Without a journal and
+    with an interval of 0 every change is flushed before `queue` returns.
+    """
+
+    def __init__(self, app, journal=None, interval=0, max_items=200):
+        self.app = app
+        self.journal = journal
+        self.interval = interval
+        self.max_items = max_items
+        self._pending = journal.load() if journal else {}
+        self._seq = max(
+            (change.seq for change in self._pending.values()), default=0
+        )
+        self._lock = threading.Lock()
+        self._due = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._worker = None
+
+    @property
+    def write_through(self):
+        return self.interval <= 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def overlay(self, user_id):
+        """Returns the pending changes of a user by item ID."""
+        with self._lock:
+            return {
+                item_id: change
+                for item_id, change in self._pending.items()
+                if change.user_id == user_id
+            }
+
+    def queue(self, changes):
+        """
+        Merges changes into the pending ones and makes them durable.
+
+        Args:
+            changes (dict): Change tuples by item ID, `seq` is assigned
+                here.
+        """
+        with self._lock:
+            merged = {}
+            for item_id, change in changes.items():
+                self._seq += 1
+                merged[item_id] = merge(
+                    self._pending.get(item_id), change._replace(seq=self._seq)
+                )
+            if self.journal is not None:
+                self.journal.save(merged)
+            self._pending.update(merged)
+            if len(self._pending) >= self.max_items:
+                self._due.notify()
+        if self.write_through:
+            self.flush()
+        else:
+            # Cached responses must show the change before it is flushed.
+            http_cache.bump()
+            self._start_worker()
+
+    def flush(self):
+        """
+        Writes all pending changes in one transaction. Changes queued while
+        the flush ran stay pending.
+
+        Returns:
+            int: The number of items written, or None if the flush failed.
+        """
+        with self._flush_lock:
+            with self._lock:
+                changes = dict(self._pending)
+            if not changes:
+                return 0
+            try:
+                apply_changes(changes)
+                db.session.commit()
+            except SQLAlchemyError as e:
+                logging.error("Error flushing read state: %s", e)
+                db.session.rollback()
+                return None
+
+            with self._lock:
+                done = [
+                    (item_id, change)
+                    for item_id, change in changes.items()
+                    if self._pending.get(item_id) is change
+                ]
+                for item_id, _ in done:
+                    del self._pending[item_id]
+                if self.journal is not None:
+                    self.journal.remove(done)
+            if not self.write_through:
+                # Responses cached between the commit and the removal above
+                # counted the changes twice.
+                http_cache.bump()
+            return len(changes)
+
+    def start(self):
+        """Starts the flush thread, first flushing replayed changes."""
+        if self._pending:
+            logging.info(
+                "Replaying %d pending read state changes", len(self._pending)
+            )
+        self._start_worker()
+
+    def _start_worker(self):
+        if self.write_through:
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._worker_loop, daemon=True
+                )
+                self._worker.start()
+
+    def _worker_loop(self):
+        while True:
+            with self._lock:
+                self._due.wait_for(lambda: self._pending)
+                # Collects changes for one interval, unless enough are
+                # pending already.
+                self._due.wait_for(
+                    lambda: len(self._pending) >= self.max_items,
+                    timeout=self.interval,
+                )
+            with self.app.app_context():
+                flushed = self.flush()
+            if flushed is None:
+                # Backs off before retrying, e.g. while the database is
+                # locked.
+                with self._lock:
+                    self._due.wait(timeout=self.interval * 10)
+
+
+def apply_changes(changes):
+    """
+    Writes changes to the database, one UPDATE per user, column and value,
+    and updates the unread counters. Does not commit.
+    """
+    groups = defaultdict(list)
+    for item_id, change in changes.items():
+        for column in STATE_COLUMNS:
+            value = getattr(change, column)
+            if value is not None:
+                groups[change.user_id, column, bool(value)].append(item_id)
+
+    for (user_id, column, value), item_ids in groups.items():
+        for start in range(0, len(item_ids), CHUNK_SIZE):
+            stmt = (
+                update(FeedItem)
+                .where(
+                    FeedItem.id.in_(item_ids[start : start + CHUNK_SIZE]),
+                    FeedItem.feed_id.in_(
+                        select(Feed.id).where(Feed.user_id == user_id)
+                    ),
+                    getattr(FeedItem, column).is_not(value),
+                )
+                .values({column: value})
+                .execution_options(synchronize_session=False)
+            )
+            if column != "read":
+                db.session.execute(stmt)
+                continue
+            feed_ids = (
+                db.session.execute(stmt.returning(FeedItem.feed_id))
+                .scalars()
+                .all()
+            )
+            if value:
+                mark_items_read(feed_ids)
+            else:
+                mark_items_unread(feed_ids)
+
+
+def get_buffer():
+    return current_app.extensions.get("read_state")
+
+
+def set_state(user_id, item_ids, read=None, favourite=None):
+    """
+    Queues a new read and/or favourite state for items of a user. Items
+    that do not exist or belong to another user are ignored.
+
+    Args:
+        user_id (int): The owner of the items.
+        item_ids (list[int]): The items to change.
+        read (bool): The new read state, or None to keep it.
+        favourite (bool): The new favourite state, or None to keep it.
+
+    Returns:
+        dict: The number of items whose read state changes, by feed ID.
+    """
+    buffer = get_buffer()
+    pending = buffer.overlay(user_id)
+    rows = db.session.execute(
+        select(FeedItem.id, FeedItem.feed_id, FeedItem.read)
+        .join(Feed, Feed.id == FeedItem.feed_id)
+        .where(FeedItem.id.in_(item_ids), Feed.user_id == user_id)
+    ).all()
+
+    changes = {}
+    changed = defaultdict(int)
+    for item_id, feed_id, was_read in rows:
+        current = pending.get(item_id)
+        if current is not None:
+            was_read = current.was_read
+        effective = was_read
+        if current is not None and current.read is not None:
+            effective = current.read
+        if read is not None and bool(read) != bool(effective):
+            changed[feed_id] += 1
+        changes[item_id] = Change(
+            user_id, feed_id, bool(was_read), read, favourite, 0
+        )
+    if changes:
+        buffer.queue(changes)
+    return dict(changed)
+
+
+def flush():
+    """
+    Writes the pending changes now, e.g. before a bulk UPDATE that must not
+    be overwritten by older changes.
+    """
+    buffer = get_buffer()
+    if buffer is not None:
+        buffer.flush()
+
+
+def apply_overlay(rows, user_id, unread_only=False):
+    """
+    Applies the pending changes of a user to listing rows.
+
+    Args:
+        rows (list[RowMapping]): Rows with `id`, `read` and `favourite`.
+        user_id (int): The user the rows were selected for.
+        unread_only (bool): Drops rows that are read once the changes are
+            applied, for listings of unread items.
+
+    Returns:
+        list: The rows, changed ones as dicts.
+    """
+    buffer = get_buffer()
+    pending = buffer.overlay(user_id) if buffer is not None else None
+    if not pending:
+        return list(rows)
+    result = []
+    for row in rows:
+        change = pending.get(row["id"])
+        if change is not None:
+            row = dict(row)
+            for column in STATE_COLUMNS:
+                value = getattr(change, column)
+                if value is not None and column in row:
+                    row[column] = bool(value)
+        if unread_only and row["read"]:
+            continue
+        result.append(row)
+    return result
+
+
+def hidden_count(user_id):
+    """
+    Returns how many items of a user are pending to be marked as read, the
+    most rows `apply_overlay` can drop from a listing of unread items.
+    """
+    buffer = get_buffer()
+    if buffer is None:
+        return 0
+    return sum(1 for change in buffer.overlay(user_id).values() if change.read)
+
+
+def unread_deltas(user_id):
+    """
+    Returns the change of a user's unread counts by feed ID once the pending
+    changes are written.
+    """
+    buffer = get_buffer()
+    deltas = defaultdict(int)
+    if buffer is None:
+        return deltas
+    for change in buffer.overlay(user_id).values():
+        if change.read is not None:
+            deltas[change.feed_id] += int(change.was_read) - int(change.read)
+    return deltas
+
+
+def init_app(app):
+    """
+    Registers a write-through buffer. `start` replaces it in the process
+    that serves requests, so other apps, e.g. of `flask db upgrade` or the
+    background jobs, neither open the journal nor run a flush thread.
+    """
+    app.extensions["read_state"] = ReadStateBuffer(app)
+
+
+def start(app):
+    """
+    Buffers the read state changes of the application that serves requests
+    and replays the changes a previous run left in the journal. Changes are
+    still written through with READ_STATE_FLUSH_MS = 0.
+
+    Returns:
+        ReadStateBuffer: The buffer of the application.
+    """
+    interval = app.config.get("READ_STATE_FLUSH_MS", 500) / 1000
+    if interval <= 0:
+        return app.extensions["read_state"]
+
+    path = app.config.get("READ_STATE_JOURNAL") or os.path.join(
+        app.instance_path, "read_state_journal.db"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    buffer = ReadStateBuffer(
+        app,
+        Journal(path),
+        interval=interval,
+        max_items=app.config.get("READ_STATE_FLUSH_ITEMS", 200),
+    )
+    app.extensions["read_state"] = buffer
+    buffer.start()
+    return buffer
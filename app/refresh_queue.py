@@ -0,0 +1,152 @@
+"""
+On-demand feed refreshes.
+
+Requests from the API are put on a priority queue that is drained by a
+dedicated worker thread, so a targeted refresh of one feed or one category
+does not wait for the periodic update cycle. Each feed can be refreshed at
+most once per `REFRESH_MIN_INTERVAL` seconds.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, UTC
+from pytz import timezone as pytz_timezone
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.models import Feed, User
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+MAX_TRACKED_JOBS = 100
+
+_queue = queue.PriorityQueue()
+_sequence = itertools.count()
+_jobs = OrderedDict()
+_last_refresh = {}
+_lock = threading.Lock()
+_worker = None
+
+
+def _start_worker():
+    """Starts the refresh worker thread if it is not running yet."""
+    global _worker
+    if _worker is None or not _worker.is_alive():
+        _worker = threading.Thread(target=_worker_loop, daemon=True)
+        _worker.start()
+        logging.info("Refresh worker started")
+
+
+def _worker_loop():
+    while True:
+        _, _, job_id, app = _queue.get()
+        with _lock:
+            job = _jobs.get(job_id)
+        if job is not None:
+            run_refresh_job(app, job)
+        _queue.task_done()
+
+
+def enqueue_refresh(app, user_id, feed_ids, priority=PRIORITY_HIGH):
+    """
+    Queues a refresh of the given feeds.
+
+    Feeds refreshed less than `REFRESH_MIN_INTERVAL` seconds ago are skipped.
+
+    Args:
+        app (Flask): The application the worker runs against.
+        user_id (int): The owner of the feeds.
+        feed_ids (list[int]): The feeds to refresh.
+        priority (int): Lower values are processed first.
+
+    Returns:
+        tuple: The queued job dict (or None when every feed is rate
+        limited) and the list of skipped feed IDs.
+    """
+    min_interval = app.config.get("REFRESH_MIN_INTERVAL", 60)
+    now = time.monotonic()
+
+    with _lock:
+        accepted, skipped = [], []
+        for feed_id in feed_ids:
+            last = _last_refresh.get(feed_id)
+            if last is not None and now - last < min_interval:
+                skipped.append(feed_id)
+            else:
+                accepted.append(feed_id)
+                _last_refresh[feed_id] = now
+
+        if not accepted:
+            return None, skipped
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "user_id": user_id,
+            "feed_ids": accepted,
+            "status": "queued",
+            "new_items": 0,
+            "error": None,
+            "created_at": datetime.now(UTC).isoformat(),
+            "finished_at": None,
+        }
+        _jobs[job["id"]] = job
+        while len(_jobs) > MAX_TRACKED_JOBS:
+            _jobs.popitem(last=False)
+
+    _queue.put((priority, next(_sequence), job["id"], app))
+    _start_worker()
+    logging.info("Refresh job %s queued for feeds %s", job["id"], accepted)
+    return job, skipped
+
+
+def get_job(job_id):
+    """Returns a copy of the job with the given ID, or None."""
+    with _lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job else None
+
+
+def run_refresh_job(app, job):
+    """
+    Refreshes every feed of a job and records the number of new items.
+    """
+    # Imported here because feed_updater builds its own app at import time.
+    from .feed_updater import update_feed
+    from .feed_scheduler import reset_schedule
+
+    with app.app_context():
+        job["status"] = "running"
+        start_time = time.time()
+        try:
+            user = db.session.get(User, job["user_id"])
+            user_timezone = pytz_timezone(user.settings.timezone)
+            for feed_id in job["feed_ids"]:
+                feed = db.session.get(Feed, feed_id)
+                if feed is None:
+                    continue
+                job["new_items"] += update_feed(feed, user, user_timezone) or 0
+            reset_schedule(job["feed_ids"])
+            job["status"] = "done"
+        except SQLAlchemyError as e:
+            logging.error("Database error: %s", e, exc_info=True)
+            db.session.rollback()
+            job["status"] = "failed"
+            job["error"] = str(e)
+        except Exception as e:
+            logging.error("Unhandled exception: %s", e, exc_info=True)
+            job["status"] = "failed"
+            job["error"] = str(e)
+        finally:
+            job["finished_at"] = datetime.now(UTC).isoformat()
+            db.session.remove()
+
+        logging.info(
+            "Refresh job %s finished in %.2f seconds with %d new items",
+            job["id"],
+            time.time() - start_time,
+            job["new_items"],
+        )
@@ -6,7 +6,7 @@ from dateutil import parser
 from flask import Blueprint, flash, jsonify, redirect, request, url_for
 from flask_login import login_required, current_user
 import pytz
-from app.utils.cleaner import clean_summary
+from app.utils.cleaner import clean_summary, summary_fields
 from app.utils.tz import tzinfos
 from app.extensions import db
 from app.models import Category, Feed, FeedItem
@@ -209,6 +209,7 @@ def add_feed():
                     title=entry.title,
                     link=entry.link,
                     summary=summary,
+                    **summary_fields(summary),
                     pub_date=pub_date,
                     creator=creator,
                     feed_id=feed.id,
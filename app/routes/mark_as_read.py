@@ -1,11 +1,58 @@
-from flask import Blueprint, jsonify, redirect, url_for
+from flask import Blueprint, jsonify, redirect, request, url_for
 from flask_login import login_required, current_user
-from sqlalchemy import update, select
+from sqlalchemy import update, select, tuple_
+from app import read_state
+from app.api.v1.feeditems import CURSOR_KIND
 from app.extensions import db
+from app.feed_counters import mark_feeds_read, mark_items_read
 from app.models import Feed, FeedItem, ArticleLink, SummarizedArticle
+from app.utils.cursors import InvalidCursor, decode_cursor
 
 mark_as_read_blueprint = Blueprint("mark_as_read", __name__)
 
+# Upper bound of IDs per batch, keeps the statement below SQLite's variable
+# limit.
+MAX_BATCH_SIZE = 500
+
+
+def mark_unread_items(*conditions):
+    """
+    Marks the unread items of the current user matching `conditions` as read
+    with a single UPDATE, and updates the feed counters from the rows it
+    returned.
+
+    Returns:
+        dict: The number of items marked as read per feed ID.
+    """
+    # Buffered changes must not be written over the result later.
+    read_state.flush()
+    stmt = (
+        update(FeedItem)
+        .where(
+            FeedItem.feed_id.in_(
+                select(Feed.id).where(Feed.user_id == current_user.id)
+            ),
+            FeedItem.read.is_(False),
+            *conditions,
+        )
+        .values(read=True)
+        .returning(FeedItem.feed_id)
+        .execution_options(synchronize_session=False)
+    )
+    changed = mark_items_read(db.session.execute(stmt).scalars().all())
+    db.session.commit()
+    return changed
+
+
+def marked_response(changed):
+    return jsonify(
+        {
+            "status": "success",
+            "marked": sum(changed.values()),
+            "feeds": changed,
+        }
+    )
+
 
 @mark_as_read_blueprint.route("/mark_as_read/<int:item_id>", methods=["POST"])
 @login_required
@@ -23,11 +70,113 @@ def mark_as_read(item_id):
     if item is None:
         return jsonify({"status": "error", "message": "Item not found"}), 404
 
-    item.read = True
-    db.session.commit()
+    read_state.set_state(current_user.id, [item_id], read=True)
     return jsonify({"status": "success"})
 
 
+@mark_as_read_blueprint.route("/mark_as_read/batch", methods=["POST"])
+@login_required
+def mark_as_read_batch():
+    """
+    Marks a list of feed items as read, e.g. the items a client scrolled
+    past. The change is buffered, see `app.read_state`.
+
+    Request body:
+        {"ids": [int, ...]} with at most MAX_BATCH_SIZE IDs.
+
+    Returns:
+        JSON with the number of items that changed from unread to read,
+        in total ("marked") and per feed ID ("feeds"). Items that were
+        already read or belong to another user are not counted.
+    """
+    data = request.get_json(silent=True) or {}
+    ids = data.get("ids")
+    if (
+        not isinstance(ids, list)
+        or not all(type(item_id) is int for item_id in ids)
+        or len(ids) > MAX_BATCH_SIZE
+    ):
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": "ids must be a list of at most "
+                    f"{MAX_BATCH_SIZE} item IDs",
+                }
+            ),
+            400,
+        )
+    if not ids:
+        return marked_response({})
+    return marked_response(
+        read_state.set_state(current_user.id, ids, read=True)
+    )
+
+
+@mark_as_read_blueprint.route("/mark_as_read/range", methods=["POST"])
+@login_required
+def mark_as_read_range():
+    """
+    Marks everything in a listing as read, up to the position of a cursor.
+
+    Request body:
+        cursor (str): The next_cursor of the last page the client loaded;
+            that page and all pages before it are marked. Without a cursor
+            the whole listing is marked.
+        category_id (int): Optional, limits the range to a category.
+        feed_id (int): Optional, limits the range to a feed.
+        max_id (int): Optional, the highest item ID the client has seen, so
+            items stored after the listing was loaded stay unread.
+
+    Returns:
+        JSON with the number of items marked as read, see
+        `mark_as_read_batch`, or 400 for an invalid cursor.
+    """
+    data = request.get_json(silent=True) or {}
+    category_id = data.get("category_id")
+    feed_id = data.get("feed_id")
+    max_id = data.get("max_id")
+    if any(
+        value is not None and type(value) is not int
+        for value in (category_id, feed_id, max_id)
+    ):
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": "category_id, feed_id and max_id must be "
+                    "integers",
+                }
+            ),
+            400,
+        )
+
+    conditions = []
+    if data.get("cursor"):
+        try:
+            anchor = decode_cursor(CURSOR_KIND, data["cursor"], 2)
+        except InvalidCursor:
+            return (
+                jsonify({"status": "error", "message": "Invalid cursor"}),
+                400,
+            )
+        # The listing runs newest first, the loaded pages end at the anchor.
+        conditions.append(
+            tuple_(FeedItem.pub_date, FeedItem.id) >= tuple_(*anchor)
+        )
+    if max_id is not None:
+        conditions.append(FeedItem.id <= max_id)
+    if feed_id is not None:
+        conditions.append(FeedItem.feed_id == feed_id)
+    if category_id is not None:
+        conditions.append(
+            FeedItem.feed_id.in_(
+                select(Feed.id).where(Feed.category_id == category_id)
+            )
+        )
+    return marked_response(mark_unread_items(*conditions))
+
+
 @mark_as_read_blueprint.route("/all/mark_as_read_all", methods=["POST"])
 @mark_as_read_blueprint.route("/mark_as_read_all", methods=["POST"])
 @login_required
@@ -52,7 +201,9 @@ def mark_as_read_all():
         .where(FeedItem.feed_id.in_(select(subquery)))
         .values(read=True)
     )
+    read_state.flush()
     db.session.execute(stmt)
+    mark_feeds_read(select(subquery))
     db.session.commit()
     return redirect(url_for("routes.index"))
 
@@ -85,7 +236,9 @@ def mark_as_read_all_category(cat_id):
         .where(FeedItem.feed_id.in_(select(subquery)))
         .values(read=True)
     )
+    read_state.flush()
     db.session.execute(stmt)
+    mark_feeds_read(select(subquery))
     db.session.commit()
     return redirect(url_for("routes.all_category_items", cat_id=cat_id))
 
@@ -112,7 +265,9 @@ def mark_as_read_all_feed(cat_id, feed_id):
     stmt = (
         update(FeedItem).where(FeedItem.feed_id == feed_id).values(read=True)
     )
+    read_state.flush()
     db.session.execute(stmt)
+    mark_feeds_read([feed_id])
     db.session.commit()
     return redirect(
         url_for("routes.all_feed_items", cat_id=cat_id, feed_id=feed_id)
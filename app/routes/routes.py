@@ -1,8 +1,10 @@
 import pytz
 from flask import Blueprint, redirect, render_template, url_for, flash
 from flask_login import login_required, current_user
+from app import settings_cache
 from app.extensions import db
-from app.models import Category, Feed, Settings
+from app.models import Category, Feed
+from app.utils.read_only import allow_writes
 from app.utils.version import get_version
 
 routes_blueprint = Blueprint("routes", __name__)
@@ -10,9 +12,9 @@ routes_blueprint = Blueprint("routes", __name__)
 
 def get_user_settings(user_id):
     """
-    Retrieve user settings for the given user ID.
+    Retrieve the cached user settings for the given user ID.
     """
-    return Settings.query.filter_by(user_id=user_id).first()
+    return settings_cache.get_settings(user_id)
 
 
 @routes_blueprint.route("/")
@@ -156,6 +158,7 @@ def settings_categories():
 
 @routes_blueprint.route("/settings/reset_last_sync", methods=["GET"])
 @login_required
+@allow_writes
 def reset_last_sync():
     """
     Reset the last sync time for the user.
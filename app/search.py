@@ -0,0 +1,262 @@
+"""
+Full-text search over feed items with SQLite FTS5.
+
+The `feed_item_fts` virtual table indexes the title, creator and the plain
+text of the summary of every item, keyed by the item's ID as rowid. New and
+edited items are indexed after every flush; a trigger removes deleted items,
+so the cleaner's bulk DELETEs keep the index in sync as well.
+
+The index only exists on SQLite. `flask search rebuild` recreates it from
+the feed_item table.
+"""
+
+import logging
+import re
+import click
+from flask.cli import AppGroup
+from sqlalchemy import Boolean, DateTime, event, inspect, select, text
+from app import db
+from app.models import FeedItem
+from app.utils.cleaner import summary_fields
+from app.utils.cursors import decode_cursor, encode_cursor
+
+FTS_TABLE = "feed_item_fts"
+REBUILD_BATCH_SIZE = 1000
+
+CREATE_STATEMENTS = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "title, creator, body, tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete "
+    f"AFTER DELETE ON feed_item BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = old.id; END",
+]
+DROP_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_delete",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# Matches in the title weigh more than in the author or the body.
+RANK = f"bm25({FTS_TABLE}, 10.0, 2.0, 1.0)"
+
+INDEX_ITEM = text(
+    f"INSERT INTO {FTS_TABLE} (rowid, title, creator, body) "
+    "VALUES (:id, :title, :creator, :body)"
+)
+UNINDEX_ITEM = text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id")
+
+
+def is_supported(connection):
+    """Returns True if the database supports the search index."""
+    return connection.dialect.name == "sqlite"
+
+
+def index_row(item_id, title, creator, plain_text, summary):
+    """
+    Returns the parameters for indexing one item. The summary is only parsed
+    for items without a stored plain text.
+    """
+    if plain_text is None:
+        plain_text = summary_fields(summary)["plain_text"]
+    return {
+        "id": item_id,
+        "title": title or "",
+        "creator": creator or "",
+        "body": plain_text,
+    }
+
+
+def create_index(target, connection, **kw):
+    """Creates the FTS table and its delete trigger."""
+    if is_supported(connection):
+        for statement in CREATE_STATEMENTS:
+            connection.exec_driver_sql(statement)
+
+
+def drop_index(target, connection, **kw):
+    """Drops the FTS table and its delete trigger."""
+    if is_supported(connection):
+        for statement in DROP_STATEMENTS:
+            connection.exec_driver_sql(statement)
+
+
+event.listen(FeedItem.__table__, "after_create", create_index)
+event.listen(FeedItem.__table__, "before_drop", drop_index)
+
+INDEXED_ATTRIBUTES = ("title", "creator", "summary", "plain_text")
+
+
+def index_items_after_flush(session, flush_context):
+    """Indexes items that were inserted or edited in a flush."""
+    items = [obj for obj in session.new if isinstance(obj, FeedItem)] + [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, FeedItem)
+        and any(
+            getattr(inspect(obj).attrs, name).history.has_changes()
+            for name in INDEXED_ATTRIBUTES
+        )
+    ]
+    if not items:
+        return
+
+    connection = session.connection()
+    if not is_supported(connection):
+        return
+    connection.execute(UNINDEX_ITEM, [{"id": item.id} for item in items])
+    connection.execute(
+        INDEX_ITEM,
+        [
+            index_row(
+                item.id,
+                item.title,
+                item.creator,
+                item.plain_text,
+                item.summary,
+            )
+            for item in items
+        ],
+    )
+
+
+event.listen(db.session, "after_flush", index_items_after_flush)
+
+
+def rebuild_index(connection, batch_size=REBUILD_BATCH_SIZE):
+    """
+    Drops and recreates the index, then indexes all items in batches.
+
+    Returns:
+        int: The number of indexed items.
+    """
+    drop_index(None, connection)
+    create_index(None, connection)
+    indexed = 0
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(
+                FeedItem.id,
+                FeedItem.title,
+                FeedItem.creator,
+                FeedItem.plain_text,
+                FeedItem.summary,
+            )
+            .where(FeedItem.id > last_id)
+            .order_by(FeedItem.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        connection.execute(INDEX_ITEM, [index_row(*row) for row in rows])
+        indexed += len(rows)
+        last_id = rows[-1][0]
+    return indexed
+
+
+def match_query(query):
+    """
+    Turns free text into an FTS5 query. Every word is quoted, so operators
+    and punctuation in the input cannot cause syntax errors; a trailing `*`
+    keeps its meaning as a prefix search.
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if not re.search(r"\w", word):
+            continue
+        terms.append(
+            '"' + word.replace('"', '""') + '"' + ("*" if prefix else "")
+        )
+    return " ".join(terms)
+
+
+def search_items(
+    user_id, query, category_id=None, feed_id=None, limit=20, cursor=None
+):
+    """
+    Searches the feed items of a user, best matches first.
+
+    Args:
+        user_id (int): The owner of the feeds to search.
+        query (str): Free text; all words must match.
+        category_id (int): Optional category filter.
+        feed_id (int): Optional feed filter.
+        limit (int): The maximum number of results.
+        cursor (str): The `next_cursor` of the previous page.
+
+    Returns:
+        tuple: A list of result rows and the cursor of the next page, or
+        None if this is the last page.
+
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded.
+    """
+    match = match_query(query)
+    if not match:
+        return [], None
+
+    conditions = ["feed.user_id = :user_id"]
+    params = {"match": match, "user_id": user_id, "limit": limit}
+    if category_id is not None:
+        conditions.append("feed.category_id = :category_id")
+        params["category_id"] = category_id
+    if feed_id is not None:
+        conditions.append("feed.id = :feed_id")
+        params["feed_id"] = feed_id
+    if cursor:
+        params["last_rank"], params["last_id"] = decode_cursor(
+            "search", cursor, 2
+        )
+        conditions.append(f"({RANK}, feed_item.id) > (:last_rank, :last_id)")
+
+    rows = (
+        db.session.execute(
+            text(
+                f"SELECT feed_item.id, feed_item.title, feed_item.link, "
+                f"feed_item.pub_date, feed_item.creator, feed_item.read, "
+                f"feed_item.favourite, feed_item.feed_id, "
+                f"feed.title AS feed_title, "
+                f"snippet({FTS_TABLE}, 2, '<mark>', '</mark>', '…', 16) "
+                f"AS snippet, {RANK} AS score "
+                f"FROM {FTS_TABLE} "
+                f"JOIN feed_item ON feed_item.id = {FTS_TABLE}.rowid "
+                f"JOIN feed ON feed.id = feed_item.feed_id "
+                f"WHERE {FTS_TABLE} MATCH :match AND "
+                + " AND ".join(conditions)
+                + " ORDER BY score, feed_item.id LIMIT :limit"
+            ).columns(pub_date=DateTime, read=Boolean, favourite=Boolean),
+            params,
+        )
+        .mappings()
+        .all()
+    )
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor(
+            "search", rows[-1]["score"], rows[-1]["id"]
+        )
+    return rows, next_cursor
+
+
+search_cli = AppGroup("search", help="Manage the full-text search index.")
+
+
+@search_cli.command("rebuild")
+@click.option("--batch-size", default=REBUILD_BATCH_SIZE, show_default=True)
+def rebuild_command(batch_size):
+    """Recreate the full-text search index from all feed items."""
+    with db.engine.begin() as connection:
+        if not is_supported(connection):
+            raise click.ClickException(
+                "Full-text search requires SQLite, not "
+                f"{connection.dialect.name}"
+            )
+        indexed = rebuild_index(connection, batch_size)
+    logging.info("Search index rebuilt with %d items", indexed)
+    click.echo(f"Indexed {indexed} feed items")
+
+
+def init_app(app):
+    """Registers the `flask search` commands."""
+    app.cli.add_command(search_cli)
@@ -0,0 +1,156 @@
+"""
+Caches the settings of each user for request handlers.
+
+Nearly every request needs the user's settings, mostly just the timezone.
+They are loaded once per user into an immutable `CachedSettings` snapshot,
+together with the resolved pytz timezone, and served from memory until they
+change. Every flush that writes a `Settings` row invalidates the snapshot of
+its user, so the settings APIs, registration and the background jobs never
+leave a stale copy behind. Writes that bypass the ORM session are picked up
+after SETTINGS_CACHE_TTL seconds.
+
+The web server and the background jobs create apps of their own in one
+process, so there is one cache per process rather than per app; a write by
+a background job invalidates the snapshot the web server serves.
+"""
+
+import threading
+import time
+from collections import namedtuple
+import pytz
+from sqlalchemy import event, select
+from app import db
+from app.models import Settings
+
+COLUMNS = [column.key for column in Settings.__table__.columns]
+
+CachedSettings = namedtuple("CachedSettings", COLUMNS + ["tz"])
+
+PENDING_KEY = "settings_cache_pending"
+
+
+def resolve_timezone(name):
+    """Returns the pytz timezone called `name`, UTC if it is unknown."""
+    try:
+        return pytz.timezone(name) if name else pytz.utc
+    except pytz.UnknownTimeZoneError:
+        return pytz.utc
+
+
+class SettingsCache:
+    """
+    Snapshots of user settings keyed by user ID.
+
+    Each invalidation bumps a generation counter; a snapshot loaded while
+    the counter changed is returned but not stored, so a concurrent write
+    cannot be overwritten by the older value read before it.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, user_id, load):
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        generation = self._generation
+        snapshot = load(user_id)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[user_id] = (
+                    time.monotonic() + self.ttl,
+                    snapshot,
+                )
+        return snapshot
+
+    def invalidate(self, user_ids=None):
+        with self._lock:
+            self._generation += 1
+            if user_ids is None:
+                self._entries.clear()
+            else:
+                for user_id in user_ids:
+                    self._entries.pop(user_id, None)
+
+
+cache = SettingsCache(300)
+
+
+def load_settings(user_id):
+    """Reads the settings of a user into a `CachedSettings` snapshot."""
+    row = (
+        db.session.execute(
+            select(*Settings.__table__.columns).where(
+                Settings.user_id == user_id
+            )
+        )
+        .mappings()
+        .first()
+    )
+    if row is None:
+        return None
+    return CachedSettings(**row, tz=resolve_timezone(row["timezone"]))
+
+
+def get_settings(user_id):
+    """
+    Returns the cached settings of a user.
+
+    Returns:
+        CachedSettings: A read-only snapshot with every `Settings` column and
+        `tz`, the user's pytz timezone, or None if the user has no settings.
+    """
+    return cache.get(user_id, load_settings)
+
+
+def get_timezone(user_id):
+    """Returns the cached pytz timezone of a user, UTC without settings."""
+    settings = get_settings(user_id)
+    return settings.tz if settings else pytz.utc
+
+
+def invalidate(user_ids=None):
+    """Drops the snapshots of the given users, or of all users if None."""
+    cache.invalidate(user_ids)
+
+
+def collect_after_flush(session, flush_context):
+    """
+    Invalidates the users whose settings were written in a flush, and again
+    after the transaction ends, so a snapshot read from the uncommitted state
+    does not outlive a rollback.
+    """
+    user_ids = {
+        obj.user_id
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Settings)
+    }
+    if user_ids:
+        session.info.setdefault(PENDING_KEY, set()).update(user_ids)
+        invalidate(user_ids)
+
+
+def invalidate_after_transaction(session, *args):
+    """Invalidates the users collected by `collect_after_flush`."""
+    user_ids = session.info.pop(PENDING_KEY, None)
+    if user_ids:
+        invalidate(user_ids)
+
+
+event.listen(db.session, "after_flush", collect_after_flush)
+event.listen(db.session, "after_commit", invalidate_after_transaction)
+event.listen(db.session, "after_soft_rollback", invalidate_after_transaction)
+
+
+def init_app(app):
+    """
+    Registers the process-wide settings cache with an application. Snapshots
+    cached for an earlier app are dropped, it may use another database.
+    """
+    cache.ttl = app.config.get("SETTINGS_CACHE_TTL", 300)
+    cache.invalidate()
+    app.extensions["settings_cache"] = cache
@@ -32,7 +32,12 @@ vulnerable to XSS attacks. Please remove it from \`allowedTags\`.
 Or, to disable this warning, add the \`allowVulnerableTags\` option
 and ensure you are accounting for this risk.
 
-`)});let a=e.nonTextTags||["script","style","textarea","option"],o,c;e.allowedAttributes&&(o={},c={},Pt(e.allowedAttributes,function(d,b){o[b]=[];let h=[];d.forEach(function(w){typeof w=="string"&&w.indexOf("*")>=0?h.push(Us(w).replace(/\\\*/g,".*")):o[b].push(w)}),h.length&&(c[b]=new RegExp("^("+h.join("|")+")$"))}));let f={},v={},y={};Pt(e.allowedClasses,function(d,b){if(o&&(Te(o,b)||(o[b]=[]),o[b].push("class")),f[b]=d,Array.isArray(d)){let h=[];f[b]=[],y[b]=[],d.forEach(function(w){typeof w=="string"&&w.indexOf("*")>=0?h.push(Us(w).replace(/\\\*/g,".*")):w instanceof RegExp?y[b].push(w):f[b].push(w)}),h.length&&(v[b]=new RegExp("^("+h.join("|")+")$"))}});let I={},S;Pt(e.transformTags,function(d,b){let h;typeof d=="function"?h=d:typeof d=="string"&&(h=Dt.simpleTransform(d)),b==="*"?S=h:I[b]=h});let P,m,_,G,D,U,W=!1;ye();let le=new nl.Parser({onopentag:function(d,b){if(e.enforceHtmlBoundary&&d==="html"&&ye(),D){U++;return}let h=new n(d,b);m.push(h);let w=!1,ue=!!h.text,Z;if(Te(I,d)&&(Z=I[d](d,b),h.attribs=b=Z.attribs,Z.text!==void 0&&(h.innerText=Z.text),d!==Z.tagName&&(h.name=d=Z.tagName,G[P]=Z.tagName)),S&&(Z=S(d,b),h.attribs=b=Z.attribs,d!==Z.tagName&&(h.name=d=Z.tagName,G[P]=Z.tagName)),(!s(d)||e.disallowedTagsMode==="recursiveEscape"&&!dl(_)||e.nestingLimit!=null&&P>=e.nestingLimit)&&(w=!0,_[P]=!0,(e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard")&&a.indexOf(d)!==-1&&(D=!0,U=1),_[P]=!0),P++,w){if(e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard")return;i=r,r=""}r+="<"+d,d==="script"&&(e.allowedScriptHostnames||e.allowedScriptDomains)&&(h.innerText=""),(!o||Te(o,d)||o["*"])&&Pt(b,function(j,q){if(!hl.test(q)){delete h.attribs[q];return}if(j===""&&!e.allowedEmptyAttributes.includes(q)&&(e.nonBooleanAttributes.includes(q)||e.nonBooleanAttributes.includes("*"))){delete h.attribs[q];return}let Iu=!1;if(!o||Te(o,d)&&o[d].indexOf(q)!==-1||o["*"]&&o["*"].indexOf(q)!==-1||Te(c,d)&&c[d].test(q)||c["*"]&&c["*"].test(q))Iu=!0;else if(o&&o[d]){for(let L of o[d])if(sl(L)&&L.name&&L.name===q){Iu=!0;let C="";if(L.multiple===!0){let ke=j.split(" ");for(let xe of ke)L.values.indexOf(xe)!==-1&&(C===""?C=xe:C+=" "+xe)}else L.values.indexOf(j)>=0&&(C=j);j=C}}if(Iu){if(e.allowedSchemesAppliedToAttributes.indexOf(q)!==-1&&te(d,j)){delete h.attribs[q];return}if(d==="script"&&q==="src"){let L=!0;try{let C=de(j);if(e.allowedScriptHostnames||e.allowedScriptDomains){let ke=(e.allowedScriptHostnames||[]).find(function(se){return se===C.url.hostname}),xe=(e.allowedScriptDomains||[]).find(function(se){return C.url.hostname===se||C.url.hostname.endsWith(`.${se}`)});L=ke||xe}}catch{L=!1}if(!L){delete h.attribs[q];return}}if(d==="iframe"&&q==="src"){let L=!0;try{let C=de(j);if(C.isRelativeUrl)L=Te(e,"allowIframeRelativeUrls")?e.allowIframeRelativeUrls:!e.allowedIframeHostnames&&!e.allowedIframeDomains;else if(e.allowedIframeHostnames||e.allowedIframeDomains){let ke=(e.allowedIframeHostnames||[]).find(function(se){return se===C.url.hostname}),xe=(e.allowedIframeDomains||[]).find(function(se){return C.url.hostname===se||C.url.hostname.endsWith(`.${se}`)});L=ke||xe}}catch{L=!1}if(!L){delete h.attribs[q];return}}if(q==="srcset")try{let L=al(j);if(L.forEach(function(C){te("srcset",C.url)&&(C.evil=!0)}),L=Fs(L,function(C){return!C.evil}),L.length)j=fl(Fs(L,function(C){return!C.evil})),h.attribs[q]=j;else{delete h.attribs[q];return}}catch{delete h.attribs[q];return}if(q==="class"){let L=f[d],C=f["*"],ke=v[d],xe=y[d],se=y["*"],ma=v["*"],Br=[ke,ma].concat(xe,se).filter(function(ga){return ga});if(L&&C?j=kr(j,Hs(L,C),Br):j=kr(j,L||C,Br),!j.length){delete h.attribs[q];return}}if(q==="style"){if(e.parseStyleAttributes)try{let L=ol(d+" {"+j+"}",{map:!1}),C=Ae(L,e.allowedStyles);if(j=De(C),j.length===0){delete h.attribs[q];return}}catch{typeof window<"u"&&console.warn('Failed to parse "'+d+" {"+j+`}", If you're running this in a browser, we recommend to disable style parsing: options.parseStyleAttributes: false, since this only works in a node environment due to a postcss dependency, More info: https://github.com/apostrophecms/sanitize-html/issues/547`),delete h.attribs[q];return}else if(e.allowedStyles)throw new Error("allowedStyles option cannot be used together with parseStyleAttributes: false.")}r+=" "+q,j&&j.length?r+='="'+F(j,!0)+'"':e.allowedEmptyAttributes.includes(q)&&(r+='=""')}else delete h.attribs[q]}),e.selfClosing.indexOf(d)!==-1?r+=" />":(r+=">",h.innerText&&!ue&&!e.textFilter&&(r+=F(h.innerText),W=!0)),w&&(r=i+F(r),i="")},ontext:function(d){if(D)return;let b=m[m.length-1],h;if(b&&(h=b.tag,d=b.innerText!==void 0?b.innerText:d),e.disallowedTagsMode==="completelyDiscard"&&!s(h))d="";else if((e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard")&&(h==="script"||h==="style"))r+=d;else{let w=F(d,!1);e.textFilter&&!W?r+=e.textFilter(w,h):W||(r+=w)}if(m.length){let w=m[m.length-1];w.text+=d}},onclosetag:function(d,b){if(D)if(U--,!U)D=!1;else return;let h=m.pop();if(!h)return;if(h.tag!==d){m.push(h);return}D=e.enforceHtmlBoundary?d==="html":!1,P--;let w=_[P];if(w){if(delete _[P],e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard"){h.updateParentNodeText();return}i=r,r=""}if(G[P]&&(d=G[P],delete G[P]),e.exclusiveFilter&&e.exclusiveFilter(h)){r=r.substr(0,h.tagPosition);return}if(h.updateParentNodeMediaChildren(),h.updateParentNodeText(),e.selfClosing.indexOf(d)!==-1||b&&!s(d)&&["escape","recursiveEscape"].indexOf(e.disallowedTagsMode)>=0){w&&(r=i,i="");return}r+="</"+d+">",w&&(r=i+F(r),i=""),W=!1}},e.parser);return le.write(t),le.end(),r;function ye(){r="",P=0,m=[],_={},G={},D=!1,U=0}function F(d,b){return typeof d!="string"&&(d=d+""),e.parser.decodeEntities&&(d=d.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;"),b&&(d=d.replace(/"/g,"&quot;"))),d=d.replace(/&(?![a-zA-Z0-9#]{1,20};)/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;"),b&&(d=d.replace(/"/g,"&quot;")),d}function te(d,b){for(b=b.replace(/[\x00-\x20]+/g,"");;){let ue=b.indexOf("<!--");if(ue===-1)break;let Z=b.indexOf("-->",ue+4);if(Z===-1)break;b=b.substring(0,ue)+b.substring(Z+3)}let h=b.match(/^([a-zA-Z][a-zA-Z0-9.\-+]*):/);if(!h)return b.match(/^[/\\]{2}/)?!e.allowProtocolRelative:!1;let w=h[1].toLowerCase();return Te(e.allowedSchemesByTag,d)?e.allowedSchemesByTag[d].indexOf(w)===-1:!e.allowedSchemes||e.allowedSchemes.indexOf(w)===-1}function de(d){if(d=d.replace(/^(\w+:)?\s*[\\/]\s*[\\/]/,"$1//"),d.startsWith("relative:"))throw new Error("relative: exploit attempt");let b="relative://relative-site";for(let ue=0;ue<100;ue++)b+=`/${ue}`;let h=new URL(d,b);return{isRelativeUrl:h&&h.hostname==="relative-site"&&h.protocol==="relative:",url:h}}function Ae(d,b){if(!b)return d;let h=d.nodes[0],w;return b[h.selector]&&b["*"]?w=Hs(b[h.selector],b["*"]):w=b[h.selector]||b["*"],w&&(d.nodes[0].nodes=h.nodes.reduce(at(w),[])),d}function De(d){return d.nodes[0].nodes.reduce(function(b,h){return b.push(`${h.prop}:${h.value}${h.important?" !important":""}`),b},[]).join(";")}function at(d){return function(b,h){return Te(d,h.prop)&&d[h.prop].some(function(ue){return ue.test(h.value)})&&b.push(h),b}}function kr(d,b,h){return b?(d=d.split(/\s+/),d.filter(function(w){return b.indexOf(w)!==-1||h.some(function(ue){return ue.test(w)})}).join(" ")):d}}var pl={decodeEntities:!0};Dt.defaults={allowedTags:["address","article","aside","footer","header","h1","h2","h3","h4","h5","h6","hgroup","main","nav","section","blockquote","dd","div","dl","dt","figcaption","figure","hr","li","main","ol","p","pre","ul","a","abbr","b","bdi","bdo","br","cite","code","data","dfn","em","i","kbd","mark","q","rb","rp","rt","rtc","ruby","s","samp","small","span","strong","sub","sup","time","u","var","wbr","caption","col","colgroup","table","tbody","td","tfoot","th","thead","tr"],nonBooleanAttributes:["abbr","accept","accept-charset","accesskey","action","allow","alt","as","autocapitalize","autocomplete","blocking","charset","cite","class","color","cols","colspan","content","contenteditable","coords","crossorigin","data","datetime","decoding","dir","dirname","download","draggable","enctype","enterkeyhint","fetchpriority","for","form","formaction","formenctype","formmethod","formtarget","headers","height","hidden","high","href","hreflang","http-equiv","id","imagesizes","imagesrcset","inputmode","integrity","is","itemid","itemprop","itemref","itemtype","kind","label","lang","list","loading","low","max","maxlength","media","method","min","minlength","name","nonce","optimum","pattern","ping","placeholder","popover","popovertarget","popovertargetaction","poster","preload","referrerpolicy","rel","rows","rowspan","sandbox","scope","shape","size","sizes","slot","span","spellcheck","src","srcdoc","srclang","srcset","start","step","style","tabindex","target","title","translate","type","usemap","value","width","wrap","onauxclick","onafterprint","onbeforematch","onbeforeprint","onbeforeunload","onbeforetoggle","onblur","oncancel","oncanplay","oncanplaythrough","onchange","onclick","onclose","oncontextlost","oncontextmenu","oncontextrestored","oncopy","oncuechange","oncut","ondblclick","ondrag","ondragend","ondragenter","ondragleave","ondragover","ondragstart","ondrop","ondurationchange","onemptied","onended","onerror","onfocus","onformdata","onhashchange","oninput","oninvalid","onkeydown","onkeypress","onkeyup","onlanguagechange","onload","onloadeddata","onloadedmetadata","onloadstart","onmessage","onmessageerror","onmousedown","onmouseenter","onmouseleave","onmousemove","onmouseout","onmouseover","onmouseup","onoffline","ononline","onpagehide","onpageshow","onpaste","onpause","onplay","onplaying","onpopstate","onprogress","onratechange","onreset","onresize","onrejectionhandled","onscroll","onscrollend","onsecuritypolicyviolation","onseeked","onseeking","onselect","onslotchange","onstalled","onstorage","onsubmit","onsuspend","ontimeupdate","ontoggle","onunhandledrejection","onunload","onvolumechange","onwaiting","onwheel"],disallowedTagsMode:"discard",allowedAttributes:{a:["href","name","target"],img:["src","srcset","alt","title","width","height","loading"]},allowedEmptyAttributes:["alt"],selfClosing:["img","br","hr","area","base","basefont","input","link","meta"],allowedSchemes:["http","https","ftp","mailto","tel"],allowedSchemesByTag:{},allowedSchemesAppliedToAttributes:["href","src","cite"],allowProtocolRelative:!0,enforceHtmlBoundary:!1,parseStyleAttributes:!0};Dt.simpleTransform=function(t,e,u){return u=u===void 0?!0:u,e=e||{},function(r,i){let n;if(u)for(n in e)i[n]=e[n];else i=e;return{tagName:t,attribs:i}}}});function T(t,e){let u=document.createElement("div");u.innerHTML=`
+`)});let a=e.nonTextTags||["script","style","textarea","option"],o,c;e.allowedAttributes&&(o={},c={},Pt(e.allowedAttributes,function(d,b){o[b]=[];let h=[];d.forEach(function(w){typeof w=="string"&&w.indexOf("*")>=0?h.push(Us(w).replace(/\\\*/g,".*")):o[b].push(w)}),h.length&&(c[b]=new RegExp("^("+h.join("|")+")$"))}));let f={},v={},y={};Pt(e.allowedClasses,function(d,b){if(o&&(Te(o,b)||(o[b]=[]),o[b].push("class")),f[b]=d,Array.isArray(d)){let h=[];f[b]=[],y[b]=[],d.forEach(function(w){typeof w=="string"&&w.indexOf("*")>=0?h.push(Us(w).replace(/\\\*/g,".*")):w instanceof RegExp?y[b].push(w):f[b].push(w)}),h.length&&(v[b]=new RegExp("^("+h.join("|")+")$"))}});let I={},S;Pt(e.transformTags,function(d,b){let h;typeof d=="function"?h=d:typeof d=="string"&&(h=Dt.simpleTransform(d)),b==="*"?S=h:I[b]=h});let P,m,_,G,D,U,W=!1;ye();let le=new nl.Parser({onopentag:function(d,b){if(e.enforceHtmlBoundary&&d==="html"&&ye(),D){U++;return}let h=new n(d,b);m.push(h);let w=!1,ue=!!h.text,Z;if(Te(I,d)&&(Z=I[d](d,b),h.attribs=b=Z.attribs,Z.text!==void 0&&(h.innerText=Z.text),d!==Z.tagName&&(h.name=d=Z.tagName,G[P]=Z.tagName)),S&&(Z=S(d,b),h.attribs=b=Z.attribs,d!==Z.tagName&&(h.name=d=Z.tagName,G[P]=Z.tagName)),(!s(d)||e.disallowedTagsMode==="recursiveEscape"&&!dl(_)||e.nestingLimit!=null&&P>=e.nestingLimit)&&(w=!0,_[P]=!0,(e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard")&&a.indexOf(d)!==-1&&(D=!0,U=1),_[P]=!0),P++,w){if(e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard")return;i=r,r=""}r+="<"+d,d==="script"&&(e.allowedScriptHostnames||e.allowedScriptDomains)&&(h.innerText=""),(!o||Te(o,d)||o["*"])&&Pt(b,function(j,q){if(!hl.test(q)){delete h.attribs[q];return}if(j===""&&!e.allowedEmptyAttributes.includes(q)&&(e.nonBooleanAttributes.includes(q)||e.nonBooleanAttributes.includes("*"))){delete h.attribs[q];return}let Iu=!1;if(!o||Te(o,d)&&o[d].indexOf(q)!==-1||o["*"]&&o["*"].indexOf(q)!==-1||Te(c,d)&&c[d].test(q)||c["*"]&&c["*"].test(q))Iu=!0;else if(o&&o[d]){for(let L of o[d])if(sl(L)&&L.name&&L.name===q){Iu=!0;let C="";if(L.multiple===!0){let ke=j.split(" ");for(let xe of ke)L.values.indexOf(xe)!==-1&&(C===""?C=xe:C+=" "+xe)}else L.values.indexOf(j)>=0&&(C=j);j=C}}if(Iu){if(e.allowedSchemesAppliedToAttributes.indexOf(q)!==-1&&te(d,j)){delete h.attribs[q];return}if(d==="script"&&q==="src"){let L=!0;try{let C=de(j);if(e.allowedScriptHostnames||e.allowedScriptDomains){let ke=(e.allowedScriptHostnames||[]).find(function(se){return se===C.url.hostname}),xe=(e.allowedScriptDomains||[]).find(function(se){return C.url.hostname===se||C.url.hostname.endsWith(`.${se}`)});L=ke||xe}}catch{L=!1}if(!L){delete h.attribs[q];return}}if(d==="iframe"&&q==="src"){let L=!0;try{let C=de(j);if(C.isRelativeUrl)L=Te(e,"allowIframeRelativeUrls")?e.allowIframeRelativeUrls:!e.allowedIframeHostnames&&!e.allowedIframeDomains;else if(e.allowedIframeHostnames||e.allowedIframeDomains){let ke=(e.allowedIframeHostnames||[]).find(function(se){return se===C.url.hostname}),xe=(e.allowedIframeDomains||[]).find(function(se){return C.url.hostname===se||C.url.hostname.endsWith(`.${se}`)});L=ke||xe}}catch{L=!1}if(!L){delete h.attribs[q];return}}if(q==="srcset")try{let L=al(j);if(L.forEach(function(C){te("srcset",C.url)&&(C.evil=!0)}),L=Fs(L,function(C){return!C.evil}),L.length)j=fl(Fs(L,function(C){return!C.evil})),h.attribs[q]=j;else{delete h.attribs[q];return}}catch{delete h.attribs[q];return}if(q==="class"){let L=f[d],C=f["*"],ke=v[d],xe=y[d],se=y["*"],ma=v["*"],Br=[ke,ma].concat(xe,se).filter(function(ga){return ga});if(L&&C?j=kr(j,Hs(L,C),Br):j=kr(j,L||C,Br),!j.length){delete h.attribs[q];return}}if(q==="style"){if(e.parseStyleAttributes)try{let L=ol(d+" {"+j+"}",{map:!1}),C=Ae(L,e.allowedStyles);if(j=De(C),j.length===0){delete h.attribs[q];return}}catch{typeof window<"u"&&console.warn('Failed to parse "'+d+" {"+j+`}", If you're running this in a browser, we recommend to disable style parsing: options.parseStyleAttributes: false, since this only works in a node environment due to a postcss dependency, More info: https://github.com/apostrophecms/sanitize-html/issues/547`),delete h.attribs[q];return}else if(e.allowedStyles)throw new Error("allowedStyles option cannot be used together with parseStyleAttributes: false.")}r+=" "+q,j&&j.length?r+='="'+F(j,!0)+'"':e.allowedEmptyAttributes.includes(q)&&(r+='=""')}else delete h.attribs[q]}),e.selfClosing.indexOf(d)!==-1?r+=" />":(r+=">",h.innerText&&!ue&&!e.textFilter&&(r+=F(h.innerText),W=!0)),w&&(r=i+F(r),i="")},ontext:function(d){if(D)return;let b=m[m.length-1],h;if(b&&(h=b.tag,d=b.innerText!==void 0?b.innerText:d),e.disallowedTagsMode==="completelyDiscard"&&!s(h))d="";else if((e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard")&&(h==="script"||h==="style"))r+=d;else{let w=F(d,!1);e.textFilter&&!W?r+=e.textFilter(w,h):W||(r+=w)}if(m.length){let w=m[m.length-1];w.text+=d}},onclosetag:function(d,b){if(D)if(U--,!U)D=!1;else return;let h=m.pop();if(!h)return;if(h.tag!==d){m.push(h);return}D=e.enforceHtmlBoundary?d==="html":!1,P--;let w=_[P];if(w){if(delete _[P],e.disallowedTagsMode==="discard"||e.disallowedTagsMode==="completelyDiscard"){h.updateParentNodeText();return}i=r,r=""}if(G[P]&&(d=G[P],delete G[P]),e.exclusiveFilter&&e.exclusiveFilter(h)){r=r.substr(0,h.tagPosition);return}if(h.updateParentNodeMediaChildren(),h.updateParentNodeText(),e.selfClosing.indexOf(d)!==-1||b&&!s(d)&&["escape","recursiveEscape"].indexOf(e.disallowedTagsMode)>=0){w&&(r=i,i="");return}r+="</"+d+">",w&&(r=i+F(r),i=""),W=!1}},e.parser);return le.write(t),le.end(),r;function ye(){r="",P=0,m=[],_={},G={},D=!1,U=0}function F(d,b){return typeof d!="string"&&(d=d+""),e.parser.decodeEntities&&(d=d.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;"),b&&(d=d.replace(/"/g,"&quot;"))),d=d.replace(/&(?![a-zA-Z0-9#]{1,20};)/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;"),b&&(d=d.replace(/"/g,"&quot;")),d}function te(d,b){for(b=b.replace(/[\x00-\x20]+/g,"");;){let ue=b.indexOf("<!--");if(ue===-1)break;let Z=b.indexOf("-->",ue+4);if(Z===-1)break;b=b.substring(0,ue)+b.substring(Z+3)}let h=b.match(/^([a-zA-Z][a-zA-Z0-9.\-+]*):/);if(!h)return b.match(/^[/\\]{2}/)?!e.allowProtocolRelative:!1;let w=h[1].toLowerCase();return Te(e.allowedSchemesByTag,d)?e.allowedSchemesByTag[d].indexOf(w)===-1:!e.allowedSchemes||e.allowedSchemes.indexOf(w)===-1}function de(d){if(d=d.replace(/^(\w+:)?\s*[\\/]\s*[\\/]/,"$1//"),d.startsWith("relative:"))throw new Error("relative: exploit attempt");let b="relative://relative-site";for(let ue=0;ue<100;ue++)b+=`/${ue}`;let h=new URL(d,b);return{isRelativeUrl:h&&h.hostname==="relative-site"&&h.protocol==="relative:",url:h}}function Ae(d,b){if(!b)return d;let h=d.nodes[0],w;return b[h.selector]&&b["*"]?w=Hs(b[h.selector],b["*"]):w=b[h.selector]||b["*"],w&&(d.nodes[0].nodes=h.nodes.reduce(at(w),[])),d}function De(d){return d.nodes[0].nodes.reduce(function(b,h){return b.push(`${h.prop}:${h.value}${h.important?" !important":""}`),b},[]).join(";")}function at(d){return function(b,h){return Te(d,h.prop)&&d[h.prop].some(function(ue){return ue.test(h.value)})&&b.push(h),b}}function kr(d,b,h){return b?(d=d.split(/\s+/),d.filter(function(w){return b.indexOf(w)!==-1||h.some(function(ue){return ue.test(w)})}).join(" ")):d}}var pl={decodeEntities:!0};Dt.defaults={allowedTags:["address","article","aside","footer","header","h1","h2","h3","h4","h5","h6","hgroup","main","nav","section","blockquote","dd","div","dl","dt","figcaption","figure","hr","li","main","ol","p","pre","ul","a","abbr","b","bdi","bdo","br","cite","code","data","dfn","em","i","kbd","mark","q","rb","rp","rt","rtc","ruby","s","samp","small","span","strong","sub","sup","time","u","var","wbr","caption","col","colgroup","table","tbody","td","tfoot","th","thead","tr"],nonBooleanAttributes:["abbr","accept","accept-charset","accesskey","action","allow","alt","as","autocapitalize","autocomplete","blocking","charset","cite","class","color","cols","colspan","content","contenteditable","coords","crossorigin","data","datetime","decoding","dir","dirname","download","draggable","enctype","enterkeyhint","fetchpriority","for","form","formaction","formenctype","formmethod","formtarget","headers","height","hidden","high","href","hreflang","http-equiv","id","imagesizes","imagesrcset","inputmode","integrity","is","itemid","itemprop","itemref","itemtype","kind","label","lang","list","loading","low","max","maxlength","media","method","min","minlength","name","nonce","optimum","pattern","ping","placeholder","popover","popovertarget","popovertargetaction","poster","preload","referrerpolicy","rel","rows","rowspan","sandbox","scope","shape","size","sizes","slot","span","spellcheck","src","srcdoc","srclang","srcset","start","step","style","tabindex","target","title","translate","type","usemap","value","width","wrap","onauxclick","onafterprint","onbeforematch","onbeforeprint","onbeforeunload","onbeforetoggle","onblur","oncancel","oncanplay","oncanplaythrough","onchange","onclick","onclose","oncontextlost","oncontextmenu","oncontextrestored","oncopy","oncuechange","oncut","ondblclick","ondrag","ondragend","ondragenter","ondragleave","ondragover","ondragstart","ondrop","ondurationchange","onemptied","onended","onerror","onfocus","onformdata","onhashchange","oninput","oninvalid","onkeydown","onkeypress","onkeyup","onlanguagechange","onload","onloadeddata","onloadedmetadata","onloadstart","onmessage","onmessageerror","onmousedown","onmouseenter","onmouseleave","onmousemove","onmouseout","onmouseover","onmouseup","onoffline","ononline","onpagehide","onpageshow","onpaste","onpause","onplay","onplaying","onpopstate","onprogress","onratechange","onreset","onresize","onrejectionhandled","onscroll","onscrollend","onsecuritypolicyviolation","onseeked","onseeking","onselect","onslotchange","onstalled","onstorage","onsubmit","onsuspend","ontimeupdate","ontoggle","onunhandledrejection","onunload","onvolumechange","onwaiting","onwheel"],disallowedTagsMode:"discard",allowedAttributes:{a:["href","name","target"],img:["src","srcset","alt","title","width","height","loading"]},allowedEmptyAttributes:["alt"],selfClosing:["img","br","hr","area","base","basefont","input","link","meta"],allowedSchemes:["http","https","ftp","mailto","tel"],allowedSchemesByTag:{},allowedSchemesAppliedToAttributes:["href","src","cite"],allowProtocolRelative:!0,enforceHtmlBoundary:!1,parseStyleAttributes:!0};Dt.simpleTransform=function(t,e,u){return u=u===void 0?!0:u,e=e||{},function(r,i){let n;if(u)for(n in e)i[n]=e[n];else i=e;return{tagName:t,attribs:i}}}});// src/js/utils/messages.js
+var __utils_messages=(()=>{
+
+function showMessage(message, type) {
+  const messageContainer = document.createElement("div");
+  messageContainer.innerHTML = `
             <div @click="open = false" x-data="{ open: false }" x-init="setTimeout(() => open = true, 100); setTimeout(() => open = false, 10100);" 
                 x-show="open" 
                 x-transition:enter="transition ease-out duration-300 transform"
@@ -43,14 +48,14 @@ and ensure you are accounting for this risk.
                 x-transition:leave-end="opacity-0 translate-x-full"
                 class="fixed inset-0 flex items-end z-50 justify-start px-4 py-6 pointer-events-none sm:p-6 sm:items-start sm:justify-end">
                 
-                <div :class="{'shadow-md bg-red-800 border-2 border-red-900': '${e}' == 'error', ' bg-green-800 border border-green-900': '${e}' == 'success'}"
+                <div :class="{'shadow-md bg-red-800 border-2 border-red-900': '${type}' == 'error', ' bg-green-800 border border-green-900': '${type}' == 'success'}"
                     class="max-w-sm w-full shadow-lg rounded-lg pointer-events-auto">
                     <div class="rounded-lg shadow-xs overflow-hidden">
                         <div class="p-4">
                             <div class="flex items-start">
                                 <div class="ml-3 w-0 flex-1 pt-0.5">
                                     <p class="text-base leading-5 font-medium text-white">
-                                        ${t}
+                                        ${message}
                                     </p>
                                 </div>
                             </div>
@@ -58,57 +63,345 @@ and ensure you are accounting for this risk.
                     </div>
                 </div>
             </div>
-        `,document.body.appendChild(u)}function ze(){fetch("/api/unread-count").then(t=>t.json()).then(t=>{Aa(t.unread_count)}).catch(t=>console.error("Error when getting the number of unread messages: ",t))}function Aa(t){"setAppBadge"in navigator?t>0?navigator.setAppBadge(t).catch(e=>{console.error("Error when installing badge: ",e)}):navigator.clearAppBadge().catch(e=>{console.error("Error when clearing badge: ",e)}):console.error("Badge API not supported")}function jr(){ze(),setInterval(ze,6e4*5)}var ot=!1,Bt=null,Ou=new Set,Be=null,Rt=!0,Lu=!1,Ur=localStorage.getItem("active")?parseInt(localStorage.getItem("active"),10):1,jt=document.getElementById("daily-container");function Hr(){ot=!1,Bt=null,Ou=new Set,Lu=!1}function Fr(t){let e=document.getElementById("all"),u=document.getElementById("unread"),r=document.getElementById("button-bg");t===1?(r.style.left=e.offsetLeft+"px",r.style.width=e.offsetWidth+"px",r.style.height=e.offsetHeight+"px",e.classList.add("text-white"),u.classList.remove("text-white"),localStorage.setItem("active",1),Rt=!1,Be="/api/daily/feed",Hr(),jt.innerHTML="",_u(Be)):t===2&&(r.style.left=u.offsetLeft+"px",r.style.width=u.offsetWidth+"px",r.style.height=u.offsetHeight+"px",u.classList.add("text-white"),e.classList.remove("text-white"),localStorage.setItem("active",2),Rt=!0,Be="/api/daily/feed?unread=true",Hr(),jt.innerHTML="",_u(Be)),r.classList.add("transition-all")}function Vr(){Ur===1?Be="/api/daily/feed":Be="/api/daily/feed?unread=true",window.onload=()=>{Fr(Ur)},window.setActive=Fr,Ca()}function _u(t){Lu||ot||(ot=!0,Bt&&(t+=`?last_item_id=${Bt}`),fetch(t).then(e=>e.json()).then(e=>{Ia(e),ot=!1}).catch(e=>{console.error("Error fetching daily data:",e),T("Failed to fetch the daily data","error"),ot=!1}))}function Ia(t){if(t.forEach(e=>{if(Ou.has(e.id))return;Ou.add(e.id);let u={weekday:"long",year:"numeric",month:"long",day:"numeric",hour:"2-digit",minute:"2-digit"},i=new Date(e.pub_date).toLocaleString("en-GB",u),n=document.createElement("div");n.className="daily-item",n.dataset.id=e.id,n.dataset.read=e.read,n.innerHTML=_a(e,i),jt.appendChild(n)}),t.length>0?Bt=t[t.length-1].id:(Lu=!0,console.log("No more items")),t.length<3&&Rt){let e=document.createElement("div");e.innerHTML=La(),jt.appendChild(e),Rt=!1}}function Oa(t){return t.replace(/[&<>"']/g,function(e){return{"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"}[e]})}function _a(t,e){let u=localStorage.getItem("font-size")?Oa(localStorage.getItem("font-size")):"text-lg";return`
+        `;
+  document.body.appendChild(messageContainer);
+}
+return{showMessage};
+})();
+// src/js/unreadCount.js
+var __unreadCount=(()=>{
+
+function checkUnreadCount() {
+  fetch("/api/unread-count").then((response) => response.json()).then((data) => {
+    updateBadge(data.unread_count);
+  }).catch((error) => console.error("Error when getting the number of unread messages: ", error));
+}
+function updateBadge(count) {
+  if ("setAppBadge" in navigator) {
+    if (count > 0) {
+      navigator.setAppBadge(count).catch((error) => {
+        console.error("Error when installing badge: ", error);
+      });
+    } else {
+      navigator.clearAppBadge().catch((error) => {
+        console.error("Error when clearing badge: ", error);
+      });
+    }
+  } else {
+    console.error("Badge API not supported");
+  }
+}
+let badgeInterval = null;
+function setBadgePolling(enabled) {
+  clearInterval(badgeInterval);
+  badgeInterval = enabled ? setInterval(checkUnreadCount, 6e4 * 5) : null;
+}
+function initBadgeUpdate() {
+  checkUnreadCount();
+  if (badgeInterval === null) {
+    setBadgePolling(true);
+  }
+}
+return{checkUnreadCount,setBadgePolling,initBadgeUpdate};
+})();
+// src/js/daily.js
+var __daily=(()=>{
+var showMessage=__utils_messages.showMessage;
+var checkUnreadCount=__unreadCount.checkUnreadCount;
+let isLoading = false;
+let nextCursor = null;
+let loadedItems = /* @__PURE__ */ new Set();
+let currentUrl = null;
+let displayEOF = true;
+let stopped = false;
+const lsActive = localStorage.getItem("active") ? parseInt(localStorage.getItem("active"), 10) : 1;
+const dailyContainer = document.getElementById("daily-container");
+function resetConstants() {
+  isLoading = false;
+  nextCursor = null;
+  loadedItems = /* @__PURE__ */ new Set();
+  stopped = false;
+}
+function setActive(elId) {
+  const all = document.getElementById("all");
+  const unread = document.getElementById("unread");
+  const bg = document.getElementById("button-bg");
+  if (elId === 1) {
+    bg.style.left = all.offsetLeft + "px";
+    bg.style.width = all.offsetWidth + "px";
+    bg.style.height = all.offsetHeight + "px";
+    all.classList.add("text-white");
+    unread.classList.remove("text-white");
+    localStorage.setItem("active", 1);
+    displayEOF = false;
+    currentUrl = "/api/daily/feed";
+    resetConstants();
+    dailyContainer.innerHTML = "";
+    fetchDailyData(currentUrl);
+  } else if (elId === 2) {
+    bg.style.left = unread.offsetLeft + "px";
+    bg.style.width = unread.offsetWidth + "px";
+    bg.style.height = unread.offsetHeight + "px";
+    unread.classList.add("text-white");
+    all.classList.remove("text-white");
+    localStorage.setItem("active", 2);
+    displayEOF = true;
+    currentUrl = "/api/daily/feed?unread=true";
+    resetConstants();
+    dailyContainer.innerHTML = "";
+    fetchDailyData(currentUrl);
+  }
+  bg.classList.add("transition-all");
+}
+function initDaily() {
+  if (lsActive === 1) {
+    currentUrl = "/api/daily/feed";
+  } else {
+    currentUrl = "/api/daily/feed?unread=true";
+  }
+  window.onload = () => {
+    setActive(lsActive);
+  };
+  window.setActive = setActive;
+  dailyScrollListener();
+}
+function fetchDailyData(url) {
+  if (stopped) {
+    return;
+  }
+  if (isLoading) {
+    return;
+  } else {
+    isLoading = true;
+  }
+  if (nextCursor) {
+    url += `${url.includes("?") ? "&" : "?"}cursor=${encodeURIComponent(nextCursor)}`;
+  }
+  fetch(url).then((response) => response.json()).then((data) => {
+    displayDailyData(data);
+    isLoading = false;
+  }).catch((error) => {
+    console.error("Error fetching daily data:", error);
+    showMessage("Failed to fetch the daily data", "error");
+    isLoading = false;
+  });
+}
+function displayDailyData({ items, next_cursor }) {
+  items.forEach((item) => {
+    if (loadedItems.has(item.id)) {
+      return;
+    }
+    loadedItems.add(item.id);
+    let options = {
+      weekday: "long",
+      year: "numeric",
+      month: "long",
+      day: "numeric",
+      hour: "2-digit",
+      minute: "2-digit"
+    };
+    let pubDate = new Date(item.pub_date);
+    let formattedDate = pubDate.toLocaleString("en-GB", options);
+    const itemElement = document.createElement("div");
+    itemElement.className = "daily-item";
+    itemElement.dataset.id = item.id;
+    itemElement.dataset.read = item.read;
+    itemElement.innerHTML = dailyHTMLTemplate(item, formattedDate);
+    dailyContainer.appendChild(itemElement);
+  });
+  if (next_cursor) {
+    nextCursor = next_cursor;
+  } else {
+    stopped = true;
+    console.log("No more items");
+  }
+  if (items.length < 3 && displayEOF) {
+    const noDataMessage = document.createElement("div");
+    noDataMessage.innerHTML = noMoreItemsTemplate();
+    dailyContainer.appendChild(noDataMessage);
+    displayEOF = false;
+  }
+}
+function escapeHTML(str) {
+  return str.replace(/[&<>"']/g, function(match) {
+    const escapeMap = {
+      "&": "&amp;",
+      "<": "&lt;",
+      ">": "&gt;",
+      '"': "&quot;",
+      "'": "&#39;"
+    };
+    return escapeMap[match];
+  });
+}
+function dailyHTMLTemplate(item, formattedDate) {
+  const fontSize = localStorage.getItem("font-size") ? escapeHTML(localStorage.getItem("font-size")) : "text-lg";
+  return `
         <!-- Article item -->
         <div class="flex flex-col w-full mt-14 animate-itemShow">
             <div class="w-full flex flex-col lg:flex-row">
-                ${t.image!==null?`<div class="flex flex-col mr-6 mb-4 lg:mb-0 pt-2"><img src="${t.image}" class="max-w-[200px] min-w-[200px] rounded-2xl"></div>`:'<div class="flex flex-col mr-6 mb-4 lg:mb-0 pt-2 min-w-[200px] rounded-2xl items-center justify-center text-gray-500"></div>'}
+                ${item.image !== null ? `<div class="flex flex-col mr-6 mb-4 lg:mb-0 pt-2"><img src="${item.image}" class="max-w-[200px] min-w-[200px] rounded-2xl"></div>` : '<div class="flex flex-col mr-6 mb-4 lg:mb-0 pt-2 min-w-[200px] rounded-2xl items-center justify-center text-gray-500"></div>'}
                 <div class="flex w-full flex-col">
-                    <div class="flex flex-col w-full d-content ${u}" ${t.read?'style="color: #c4c4c4;"':""}>
-                            ${t.summary}
+                    <div class="flex flex-col w-full d-content ${fontSize}" ${item.read ? 'style="color: #c4c4c4;"' : ""}>
+                            ${item.summary}
                             </div>
                                                 
                     <div class="flex flex-col w-full">
                         <div class="flex w-full mt-3">
                             <ul class="flex flex-col w-full d-links">
-                                ${t.articles.map(r=>`
+                                ${item.articles.map(
+    (article) => `
                                     <li class="mb-3">
-                                        <a href="${r.link}" class="${t.read?'text-gray-500"':""}" target="_blank">${r.title}</a><br><span class="text-gray-700 uppercase text-xs mb-2">${r.feed_title}</span>
-                                    </li>`).join("")}
+                                        <a href="${article.link}" class="${item.read ? 'text-gray-500"' : ""}" target="_blank">${article.title}</a><br><span class="text-gray-700 uppercase text-xs mb-2">${article.feed_title}</span>
+                                    </li>`
+  ).join("")}
                             </ul>
                         </div>
 
                         <div class="flex w-full mt-3 d-pubdate">
-                            ${e} &nbsp&nbsp&nbsp  &nbsp&nbsp&nbsp
-                            <button class="flex ai-summarize-daily-btn -mt-0.5 hover:text-white relative" data-id="${t.id}"><span class="absolute group">
+                            ${formattedDate} &nbsp&nbsp&nbsp  &nbsp&nbsp&nbsp
+                            <button class="flex ai-summarize-daily-btn -mt-0.5 hover:text-white relative" data-id="${item.id}"><span class="absolute group">
                                 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor" class="h-6 w-6">
                                             <path fill-rule="evenodd" d="M2.625 6.75a1.125 1.125 0 1 1 2.25 0 1.125 1.125 0 0 1-2.25 0Zm4.875 0A.75.75 0 0 1 8.25 6h12a.75.75 0 0 1 0 1.5h-12a.75.75 0 0 1-.75-.75ZM2.625 12a1.125 1.125 0 1 1 2.25 0 1.125 1.125 0 0 1-2.25 0ZM7.5 12a.75.75 0 0 1 .75-.75h12a.75.75 0 0 1 0 1.5h-12A.75.75 0 0 1 7.5 12Zm-4.875 5.25a1.125 1.125 0 1 1 2.25 0 1.125 1.125 0 0 1-2.25 0Zm4.875 0a.75.75 0 0 1 .75-.75h12a.75.75 0 0 1 0 1.5h-12a.75.75 0 0 1-.75-.75Z" clip-rule="evenodd" />
                                 </svg><span class="invisible group-hover:visible relative -top-14 -left-12 px-2 py-1.5 rounded bg-gray-900 text-white text-nowrap">Article Summary</span></span>
                                 
                             </button>
                             <div class="ml-12">
-                            ${t.read?'<span class="absolute group"><svg class="-mt-0.5 w-6 h-6 text-gray-700" xmlns="http://www.w3.org/2000/svg" width="24" height="24" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true" > <path fill-rule="evenodd" d="M2 12C2 6.477 6.477 2 12 2s10 4.477 10 10-4.477 10-10 10S2 17.523 2 12Zm13.707-1.293a1 1 0 0 0-1.414-1.414L11 12.586l-1.793-1.793a1 1 0 0 0-1.414 1.414l2.5 2.5a1 1 0 0 0 1.414 0l4-4Z" clip-rule="evenodd" /></svg><span class="invisible group-hover:visible relative -top-14 -left-10 px-2 py-1.5 rounded bg-gray-900 text-white normal-case text-nowrap">Already Read</span></span>':""}
+                            ${item.read ? '<span class="absolute group"><svg class="-mt-0.5 w-6 h-6 text-gray-700" xmlns="http://www.w3.org/2000/svg" width="24" height="24" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true" > <path fill-rule="evenodd" d="M2 12C2 6.477 6.477 2 12 2s10 4.477 10 10-4.477 10-10 10S2 17.523 2 12Zm13.707-1.293a1 1 0 0 0-1.414-1.414L11 12.586l-1.793-1.793a1 1 0 0 0-1.414 1.414l2.5 2.5a1 1 0 0 0 1.414 0l4-4Z" clip-rule="evenodd" /></svg><span class="invisible group-hover:visible relative -top-14 -left-10 px-2 py-1.5 rounded bg-gray-900 text-white normal-case text-nowrap">Already Read</span></span>' : ""}
                             </div>
                         </div>
                     </div>
                 </div>
             </div>
         </div> 
-    `}function La(){return`
+    `;
+}
+function noMoreItemsTemplate() {
+  return `
         <div class="flex justify-center items-center h-64 mb-[100%] text-gray-500 text-base">
         There are no more unread items.
         </div>
-    `}function Ca(){window.addEventListener("scroll",()=>{window.innerHeight+window.scrollY>=document.body.offsetHeight-document.body.offsetHeight/2&&_u(Be),Na()})}function Na(){document.querySelectorAll(".daily-item").forEach(e=>{if(!(e.dataset.read==="true")&&Ma(e)){let r=e.dataset.id;qa(r),e.dataset.read="true"}})}function qa(t){fetch(`/mark_as_read/daily/${t}`,{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"}}).then(e=>{e.ok?ze():console.error(`Error marking summarized article ${t} as read`)}).catch(e=>{console.error(`Error marking summarized article ${t} as read`,e),T("Error marking article as read","error")})}function Ma(t){let e=t.getBoundingClientRect();return e.top>=0&&e.left>=0&&e.bottom<=(window.innerHeight||document.documentElement.clientHeight)&&e.right<=(window.innerWidth||document.documentElement.clientWidth)}var Nu=!1,ct=null,Cu=new Set,zr=null;window.pauseUpdates=qu;window.resumeUpdates=Ut;window.updateFeed=ka;window.deleteFeed=Ra;window.updateFeedCategory=Ba;function Pa(t,e){if(t.size!==e.size)return!1;for(let u of t){let r=Array.from(e).find(i=>i.id===u.id);if(!r||JSON.stringify(u.feeds)!==JSON.stringify(r.feeds))return!1}return!0}function qu(){Nu=!0,clearInterval(ct),ct=null}function Ut(){Nu=!1,$e(),ct===null&&(ct=setInterval($e,5e3))}async function ve(t=!1){t&&(Cu=new Set);try{let u=await(await fetch("/api/categories_and_blogs")).json(),r=document.getElementById("categories_and_blogs"),i=new Set(u.categories_and_blogs);Pa(i,Cu)||(r.innerHTML="",u.categories_and_blogs.forEach(n=>{if(n.feeds.length>0){let s=`<p class="text-base mt-6 mb-1 font-medium text-gray-200"><a href="/category/${n.id}">${n.name}</a></p>`;n.feeds.forEach(a=>{let o=`/category/${n.id}/feed/${a.feed.id}`,c=`/category/${n.id}/feed/${a.feed.id}/all`,f=window.location.pathname===o||window.location.pathname===c,v=`<div x-data="{ open: false, editMode: false, title: '${a.feed.title}', menuOpen: false }" class="">
+    `;
+}
+function dailyScrollListener() {
+  window.addEventListener("scroll", () => {
+    if (window.innerHeight + window.scrollY >= document.body.offsetHeight - document.body.offsetHeight / 2) {
+      fetchDailyData(currentUrl);
+    }
+    markVisibleUnreadSummarizedArticlesAsRead();
+  });
+}
+function markVisibleUnreadSummarizedArticlesAsRead() {
+  const dailyItems = document.querySelectorAll(".daily-item");
+  dailyItems.forEach((article) => {
+    const isRead = article.dataset.read === "true";
+    if (!isRead && isElementInViewport(article)) {
+      const articleId = article.dataset.id;
+      markSummarizedArticleAsRead(articleId);
+      article.dataset.read = "true";
+    }
+  });
+}
+function markSummarizedArticleAsRead(articleId) {
+  fetch(`/mark_as_read/daily/${articleId}`, {
+    method: "POST",
+    credentials: "include",
+    headers: {
+      "Content-Type": "application/json"
+    }
+  }).then((response) => {
+    if (response.ok) {
+      checkUnreadCount();
+    } else {
+      console.error(`Error marking summarized article ${articleId} as read`);
+    }
+  }).catch((error) => {
+    console.error(`Error marking summarized article ${articleId} as read`, error);
+    showMessage("Error marking article as read", "error");
+  });
+}
+function isElementInViewport(el) {
+  const rect = el.getBoundingClientRect();
+  return rect.top >= 0 && rect.left >= 0 && rect.bottom <= (window.innerHeight || document.documentElement.clientHeight) && rect.right <= (window.innerWidth || document.documentElement.clientWidth);
+}
+return{initDaily};
+})();
+// src/js/feedList.js
+var __feedList=(()=>{
+var showMessage=__utils_messages.showMessage;
+const POLL_INTERVAL = 5e3;
+const LIVE_INTERVAL = 6e4;
+let pauseUpdate = false;
+let updateInterval = null;
+let liveUpdates = false;
+let currentFeedsSet = /* @__PURE__ */ new Set();
+let currentLastSync = null;
+window.pauseUpdates = pauseUpdates;
+window.resumeUpdates = resumeUpdates;
+window.updateFeed = updateFeed;
+window.deleteFeed = deleteFeed;
+window.updateFeedCategory = updateFeedCategory;
+function areSetsEqual(setA, setB) {
+  if (setA.size !== setB.size)
+    return false;
+  for (let objA of setA) {
+    const objB = Array.from(setB).find((o) => o.id === objA.id);
+    if (!objB || JSON.stringify(objA.feeds) !== JSON.stringify(objB.feeds)) {
+      return false;
+    }
+  }
+  return true;
+}
+function pauseUpdates() {
+  pauseUpdate = true;
+  clearInterval(updateInterval);
+  updateInterval = null;
+}
+function resumeUpdates() {
+  pauseUpdate = false;
+  updateFeedListData();
+  if (updateInterval === null) {
+    updateInterval = setInterval(updateFeedListData, liveUpdates ? LIVE_INTERVAL : POLL_INTERVAL);
+  }
+}
+function setLiveUpdates(enabled) {
+  if (enabled === liveUpdates)
+    return;
+  liveUpdates = enabled;
+  if (updateInterval !== null) {
+    clearInterval(updateInterval);
+    updateInterval = setInterval(updateFeedListData, liveUpdates ? LIVE_INTERVAL : POLL_INTERVAL);
+  }
+}
+async function fetchCategoriesAndBlogs(clean = false) {
+  if (clean) {
+    currentFeedsSet = /* @__PURE__ */ new Set();
+  }
+  try {
+    const response = await fetch("/api/categories_and_blogs");
+    const data = await response.json();
+    const container = document.getElementById("categories_and_blogs");
+    const dataSet = new Set(data.categories_and_blogs);
+    if (!areSetsEqual(dataSet, currentFeedsSet)) {
+      container.innerHTML = "";
+      data.categories_and_blogs.forEach((category) => {
+        if (category.feeds.length > 0) {
+          let categoryHTML = `<p class="text-base mt-6 mb-1 font-medium text-gray-200"><a href="/category/${category.id}">${category.name}</a></p>`;
+          category.feeds.forEach((feedData) => {
+            let feedPath = `/category/${category.id}/feed/${feedData.feed.id}`;
+            let feedPathAll = `/category/${category.id}/feed/${feedData.feed.id}/all`;
+            let isActiveFeed = window.location.pathname === feedPath || window.location.pathname === feedPathAll;
+            let feedHTML = `<div x-data="{ open: false, editMode: false, title: '${feedData.feed.title}', menuOpen: false }" class="">
                                 <div class="flex w-full" @mouseover="open = true" @mouseout="open = false">
                                     <div class="flex flex-row w-full">
-                                        <div :class="{ 'active-feed': ${f}, 'block text-sm mt-1 mb-1 pt-1 pr-2 text-gray-400 flex-grow': !${f} }">
-                                            <a x-show="!editMode" class="hover:text-white" href="${o}">${a.feed.title.length>28?a.feed.title.substring(0,25)+"...":a.feed.title}</a>                    
+                                        <div :class="{ 'active-feed': ${isActiveFeed}, 'block text-sm mt-1 mb-1 pt-1 pr-2 text-gray-400 flex-grow': !${isActiveFeed} }">
+                                            <a x-show="!editMode" class="hover:text-white" href="${feedPath}">${feedData.feed.title.length > 28 ? feedData.feed.title.substring(0, 25) + "..." : feedData.feed.title}</a>                    
                                             
-                                            <input id='input-${a.feed.id}' 
+                                            <input id='input-${feedData.feed.id}' 
                                             x-show="editMode" 
                                             x-model="title" 
                                             x-ref="input" @keydown.enter="editMode = false; 
-                                            updateFeed('${a.feed.id}', title).then(() => resumeUpdates());" @keydown.escape="editMode = false; resumeUpdates()" @blur="editMode = false; resumeUpdates()" class="bg-gray-800 text-white px-2 py-1 flex -m-0.5 w-full rounded" x-init="$watch('editMode', value => { if (value) setTimeout(() => $refs.input.focus(), 50) })" />
+                                            updateFeed('${feedData.feed.id}', title).then(() => resumeUpdates());" @keydown.escape="editMode = false; resumeUpdates()" @blur="editMode = false; resumeUpdates()" class="bg-gray-800 text-white px-2 py-1 flex -m-0.5 w-full rounded" x-init="$watch('editMode', value => { if (value) setTimeout(() => $refs.input.focus(), 50) })" />
 
                                         </div>
                                         <div class="relative inline-block text-left" x-show="open && !editMode">
@@ -116,7 +409,7 @@ and ensure you are accounting for this risk.
                                                 <span class="mt-1">...</span>
                                             </button>
                                         </div>
-                                        ${a.unread_count>0?`<div class="flex pt-1 pb-1 px-2 mt-2 max-h-8 items-center justify-center text-xs font-bold rounded-md bg-gray-900 ml-auto">${a.unread_count}</div>`:""}
+                                        ${feedData.unread_count > 0 ? `<div class="flex pt-1 pb-1 px-2 mt-2 max-h-8 items-center justify-center text-xs font-bold rounded-md bg-gray-900 ml-auto">${feedData.unread_count}</div>` : ""}
                                     </div>
                                 </div>
                                 <div x-show="menuOpen" @click.away="menuOpen = false; resumeUpdates()"
@@ -130,21 +423,260 @@ and ensure you are accounting for this risk.
                                     <div class="flex-col w-full">
                                         <div class="flex w-full">
                                             <a @click="editMode = true; menuOpen = false; pauseUpdates()" class="block px-6 py-2 text-sm text-gray-300 rounded-lg bg-stone-800 hover:bg-gray-900 hover:text-white cursor-pointer">Rename</a>
-                                            <a @click="deleteFeed('${a.feed.id}')" class="block ml-auto px-8 py-2 text-sm text-red-700 rounded-lg bg-stone-800 hover:bg-gray-900 hover:text-red-600 cursor-pointer">Delete</a>
+                                            <a @click="deleteFeed('${feedData.feed.id}')" class="block ml-auto px-8 py-2 text-sm text-red-700 rounded-lg bg-stone-800 hover:bg-gray-900 hover:text-red-600 cursor-pointer">Delete</a>
                                         </div>
                                         <div class="w-full flex-grow mt-2 mb-1">
-                                            <select id="ns-select" @change="updateFeedCategory('${a.feed.id}', $event.target.value)" class="block w-full px-6 py-2 text-sm text-gray-300 rounded-lg bg-stone-800 hover:bg-gray-900 hover:text-white cursor-pointer">
+                                            <select id="ns-select" @change="updateFeedCategory('${feedData.feed.id}', $event.target.value)" class="block w-full px-6 py-2 text-sm text-gray-300 rounded-lg bg-stone-800 hover:bg-gray-900 hover:text-white cursor-pointer">
                                                 <option value="" disabled selected>Change category</option>
-                                                ${u.categories_and_blogs.map(y=>`<option value="${y.id}">${y.name}</option>`).join("")}
+                                                ${data.categories_and_blogs.map(
+              (category2) => `<option value="${category2.id}">${category2.name}</option>`
+            ).join("")}
                                             </select>
                                         </div>
                                     </div>
                                 </div>
-                            </div>`;s+=v}),r.innerHTML+=s}}),Cu=i)}catch(e){console.error("Error fetching categories and blogs:",e)}}async function Da(){try{let e=await(await fetch("/api/last_sync")).json();e.last_sync!=zr&&(document.getElementById("last_sync").innerText=e.last_sync,zr=e.last_sync)}catch(t){console.error("Error fetching last sync time:",t)}}async function ka(t,e){try{let u=await fetch(`/api/feeds/${t}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({title:e})});if(!u.ok){let r=await u.json();throw new Error(r.error||"Error updating feed")}document.querySelector(`a[href$="/feed/${t}"]`).textContent=e,T("Feed has been successfully renamed","success")}catch(u){T(u.message,"error")}}async function Ba(t,e){try{qu();let u=await fetch(`/api/feeds/${t}/category`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({category_id:e})});if(!u.ok){let r=await u.json();throw new Error(r.error||"Error updating feed category")}await ve(),T("Feed category updated successfully","success")}catch(u){T(u.message,"error")}finally{Ut()}}async function Ra(t){try{let e=await fetch(`/api/feeds/${t}`,{method:"DELETE"});if(!e.ok){let u=await e.json();throw new Error(u.error||"Error when deleting feed")}await ve(),T("Feed deleted successfully","success")}catch(e){T(e.message,"error")}}function ja(){document.querySelectorAll(".menu").length>0&&(document.querySelectorAll("[x-data]").forEach(t=>{t.__x.$data.menuOpen=!1}),Ut())}function $r(){window.addEventListener("focus",Ut),window.addEventListener("blur",qu),document.addEventListener("visibilitychange",$e),document.addEventListener("click",function(t){t.target.closest(".menu")||ja()})}function Gr(){ct=setInterval($e,5e3)}async function $e(){!document.hidden&&!Nu&&(await ve(),await Da())}function Wr(){document.getElementById("create-category-link").addEventListener("click",function(t){t.preventDefault(),document.getElementById("create-category-link").style.display="none",document.getElementById("category-select").style.display="none",document.getElementById("new-category-input").style.display="block",document.getElementById("choose-category-link").style.display="flex"}),document.getElementById("choose-category-link").addEventListener("click",function(t){t.preventDefault(),document.getElementById("create-category-link").style.display="flex",document.getElementById("category-select").style.display="block",document.getElementById("new-category-input").style.display="none",document.getElementById("choose-category-link").style.display="none"}),document.getElementById("submit-button").addEventListener("click",async function(t){t.preventDefault(),document.getElementById("loading-spinner").style.display="block",document.querySelector(".add-feed-text").style.display="none";let e=document.getElementById("new-category-input"),u=document.getElementById("category-select"),r=document.getElementById("category");e.style.display==="block"&&e.value.trim()!==""?r.value=e.value.trim():r.value=u.options[u.selectedIndex].text;let i=document.getElementById("add_feed"),n=new FormData(i);try{let a=await(await fetch("/add_feed",{method:"POST",body:n})).json();document.getElementById("loading-spinner").style.display="none",document.querySelector(".add-feed-text").style.display="block",a.success?window.location.href="/":document.getElementById("error").innerText=a.error}catch(s){document.getElementById("loading-spinner").style.display="none",document.querySelector(".add-feed-text").style.display="block",document.getElementById("error").innerText="An error occurred while submitting the form.",console.error("Error:",s)}}),document.addEventListener("DOMContentLoaded",async()=>{let t=document.getElementById("modal-add");t.classList.remove("hidden"),t.classList.add("flex");let e=document.getElementById("category-select");try{(await(await fetch("/api/categories_and_blogs")).json()).categories_and_blogs.forEach(i=>{let n=document.createElement("option");n.value=i.id,n.text=i.name,e.appendChild(n)})}catch(u){console.error("Error getting categories:",u)}})}var $s=Ta(zs(),1);function Gs(t){return t=(0,$s.default)(t,{allowedTags:[],allowedAttributes:{}}),t=t.replace(/<li>(.*?)<\/li>/g,`- $1
-`),t=t.replace(/<\/ul>/g,`
-`).replace(/<ul>/g,""),t=t.replace(/<p>(.*?)<\/p>/g,`$1
+                            </div>`;
+            categoryHTML += feedHTML;
+          });
+          container.innerHTML += categoryHTML;
+        }
+      });
+      currentFeedsSet = dataSet;
+    }
+  } catch (error) {
+    console.error("Error fetching categories and blogs:", error);
+  }
+}
+async function fetchLastSync() {
+  try {
+    const response = await fetch("/api/last_sync");
+    const data = await response.json();
+    if (data.last_sync != currentLastSync) {
+      document.getElementById("last_sync").innerText = data.last_sync;
+      currentLastSync = data.last_sync;
+    }
+  } catch (error) {
+    console.error("Error fetching last sync time:", error);
+  }
+}
+async function updateFeed(feedId, title) {
+  try {
+    const response = await fetch(`/api/feeds/${feedId}`, {
+      method: "PUT",
+      headers: {
+        "Content-Type": "application/json"
+      },
+      body: JSON.stringify({ title })
+    });
+    if (!response.ok) {
+      const errorData = await response.json();
+      throw new Error(errorData.error || "Error updating feed");
+    }
+    document.querySelector(`a[href$="/feed/${feedId}"]`).textContent = title;
+    showMessage("Feed has been successfully renamed", "success");
+  } catch (error) {
+    showMessage(error.message, "error");
+  }
+}
+async function updateFeedCategory(feedId, categoryId) {
+  try {
+    pauseUpdates();
+    const response = await fetch(`/api/feeds/${feedId}/category`, {
+      method: "PUT",
+      headers: {
+        "Content-Type": "application/json"
+      },
+      body: JSON.stringify({ category_id: categoryId })
+    });
+    if (!response.ok) {
+      const errorData = await response.json();
+      throw new Error(errorData.error || "Error updating feed category");
+    }
+    await fetchCategoriesAndBlogs();
+    showMessage("Feed category updated successfully", "success");
+  } catch (error) {
+    showMessage(error.message, "error");
+  } finally {
+    resumeUpdates();
+  }
+}
+async function deleteFeed(feedId) {
+  try {
+    const response = await fetch(`/api/feeds/${feedId}`, {
+      method: "DELETE"
+    });
+    if (!response.ok) {
+      const errorData = await response.json();
+      throw new Error(errorData.error || "Error when deleting feed");
+    }
+    await fetchCategoriesAndBlogs();
+    showMessage("Feed deleted successfully", "success");
+  } catch (error) {
+    showMessage(error.message, "error");
+  }
+}
+function closeAllMenus() {
+  if (document.querySelectorAll(".menu").length > 0) {
+    document.querySelectorAll("[x-data]").forEach((el) => {
+      el.__x.$data.menuOpen = false;
+    });
+    resumeUpdates();
+  }
+}
+function initFeedListListeners() {
+  window.addEventListener("focus", resumeUpdates);
+  window.addEventListener("blur", pauseUpdates);
+  document.addEventListener("visibilitychange", updateFeedListData);
+  document.addEventListener("click", function(event) {
+    const isClickInsideMenu = event.target.closest(".menu");
+    if (!isClickInsideMenu) {
+      closeAllMenus();
+    }
+  });
+}
+function initSetInterval() {
+  updateInterval = setInterval(updateFeedListData, liveUpdates ? LIVE_INTERVAL : POLL_INTERVAL);
+}
+async function updateFeedListData() {
+  if (!document.hidden && !pauseUpdate) {
+    await fetchCategoriesAndBlogs();
+    await fetchLastSync();
+  }
+}
+return{pauseUpdates,resumeUpdates,setLiveUpdates,fetchCategoriesAndBlogs,fetchLastSync,initFeedListListeners,initSetInterval,updateFeedListData};
+})();
+// src/js/addFeedModal.js
+var __addFeedModal=(()=>{
 
-`),t}function Lr(){document.addEventListener("click",function(t){let e=t.target.closest(".ai-summarize-btn, .ai-summarize-daily-btn"),u=t.target.closest(".copy-btn");if(e){let r,i=!1,n,s,a,o;if(e.classList.contains("ai-summarize-daily-btn")){r=e.dataset.id;let _=e.closest(".daily-item");n=_.querySelector(".d-content"),a=_,i=!0}else{let _=e.closest(".feed-item");a=_.querySelector(".item-title"),s=_.querySelector(".item-title a").href,r=_.dataset.id,n=_.querySelector(".feed-content"),o=_.querySelector("#exp-hidden"),o&&(o.setAttribute("x-data","{expanded: true}"),o.style.maxHeight="none")}let c=a.getBoundingClientRect().top+window.scrollY,v=window.innerHeight*(20/100),y=c-v;window.scrollTo({top:y,behavior:"smooth"});let I=500,S=n.innerHTML;n.innerHTML=`
+function initAddfeedModal() {
+  document.getElementById("create-category-link").addEventListener("click", function(event) {
+    event.preventDefault();
+    document.getElementById("create-category-link").style.display = "none";
+    document.getElementById("category-select").style.display = "none";
+    document.getElementById("new-category-input").style.display = "block";
+    document.getElementById("choose-category-link").style.display = "flex";
+  });
+  document.getElementById("choose-category-link").addEventListener("click", function(event) {
+    event.preventDefault();
+    document.getElementById("create-category-link").style.display = "flex";
+    document.getElementById("category-select").style.display = "block";
+    document.getElementById("new-category-input").style.display = "none";
+    document.getElementById("choose-category-link").style.display = "none";
+  });
+  document.getElementById("submit-button").addEventListener("click", async function(event) {
+    event.preventDefault();
+    document.getElementById("loading-spinner").style.display = "block";
+    document.querySelector(".add-feed-text").style.display = "none";
+    const newCategoryInput = document.getElementById("new-category-input");
+    const categorySelect = document.getElementById("category-select");
+    const categoryField = document.getElementById("category");
+    if (newCategoryInput.style.display === "block" && newCategoryInput.value.trim() !== "") {
+      categoryField.value = newCategoryInput.value.trim();
+    } else {
+      categoryField.value = categorySelect.options[categorySelect.selectedIndex].text;
+    }
+    const form = document.getElementById("add_feed");
+    const formData = new FormData(form);
+    try {
+      const response = await fetch("/add_feed", {
+        method: "POST",
+        body: formData
+      });
+      const data = await response.json();
+      document.getElementById("loading-spinner").style.display = "none";
+      document.querySelector(".add-feed-text").style.display = "block";
+      if (data.success) {
+        window.location.href = "/";
+      } else {
+        document.getElementById("error").innerText = data.error;
+      }
+    } catch (error) {
+      document.getElementById("loading-spinner").style.display = "none";
+      document.querySelector(".add-feed-text").style.display = "block";
+      document.getElementById("error").innerText = "An error occurred while submitting the form.";
+      console.error("Error:", error);
+    }
+  });
+  document.addEventListener("DOMContentLoaded", async () => {
+    const addFeedButton = document.getElementById("modal-add");
+    addFeedButton.classList.remove("hidden");
+    addFeedButton.classList.add("flex");
+    const categorySelect = document.getElementById("category-select");
+    try {
+      const response = await fetch("/api/categories_and_blogs");
+      const data = await response.json();
+      data.categories_and_blogs.forEach((category) => {
+        const option = document.createElement("option");
+        option.value = category.id;
+        option.text = category.name;
+        categorySelect.appendChild(option);
+      });
+    } catch (error) {
+      console.error("Error getting categories:", error);
+    }
+  });
+}
+return{initAddfeedModal};
+})();
+// src/js/utils/htmlToMD.js
+var __utils_htmlToMD=(()=>{
+var sanitizeHtml=Ta(zs(),1).default;
+function htmlToMarkdown(html) {
+  html = sanitizeHtml(html, {
+    allowedTags: [],
+    allowedAttributes: {}
+  });
+  html = html.replace(/<li>(.*?)<\/li>/g, "- $1\n");
+  html = html.replace(/<\/ul>/g, "\n").replace(/<ul>/g, "");
+  html = html.replace(/<p>(.*?)<\/p>/g, "$1\n\n");
+  return html;
+}
+return{htmlToMarkdown};
+})();
+// src/js/utils/summary.js
+var __utils_summary=(()=>{
+var showMessage=__utils_messages.showMessage;
+var htmlToMarkdown=__utils_htmlToMD.htmlToMarkdown;
+function summarizeEnetListener() {
+  document.addEventListener("click", function(event) {
+    const summarizeBtn = event.target.closest(".ai-summarize-btn, .ai-summarize-daily-btn");
+    const copyBtn = event.target.closest(".copy-btn");
+    if (summarizeBtn) {
+      let articleId;
+      let isDaily = false;
+      let feedContent;
+      let postUrl;
+      let itemTitle;
+      let expHidden;
+      if (summarizeBtn.classList.contains("ai-summarize-daily-btn")) {
+        articleId = summarizeBtn.dataset.id;
+        const dailyItem = summarizeBtn.closest(".daily-item");
+        feedContent = dailyItem.querySelector(".d-content");
+        itemTitle = dailyItem;
+        isDaily = true;
+      } else {
+        const feedItem = summarizeBtn.closest(".feed-item");
+        itemTitle = feedItem.querySelector(".item-title");
+        postUrl = feedItem.querySelector(".item-title a").href;
+        articleId = feedItem.dataset.id;
+        feedContent = feedItem.querySelector(".feed-content");
+        expHidden = feedItem.querySelector("#exp-hidden");
+        if (expHidden) {
+          expHidden.setAttribute("x-data", "{expanded: true}");
+          expHidden.style.maxHeight = "none";
+        }
+      }
+      const itemPosition = itemTitle.getBoundingClientRect().top + window.scrollY;
+      const offsetPercentage = 20;
+      const offsetPixels = window.innerHeight * (offsetPercentage / 100);
+      const offsetPosition = itemPosition - offsetPixels;
+      window.scrollTo({
+        top: offsetPosition,
+        behavior: "smooth"
+      });
+      const scrollDuration = 500;
+      const originalContent = feedContent.innerHTML;
+      feedContent.innerHTML = `
             <div class="space-y-4 w-full">
                 <div class="line"></div>
                 <div class="line short"></div>
@@ -158,11 +690,54 @@ and ensure you are accounting for this risk.
                 <div class="line"></div>
                 <div class="line short"></div>
                 <div class="line"></div>
-            </div>`;let P=i?`/api/daily/summarize/${r}`:"/api/summarize",m=i?{}:{url:s};setTimeout(()=>{fetch(P,{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"},body:JSON.stringify(m)}).then(_=>_.json()).then(_=>{if(_.status==="error"){if(_.error.includes("Failed to get text")){n.innerHTML=S,T("Failed to get article text from the URL.","error");return}T('Error summarizing the text. Check Groq API in <a class="underline" href="/settings">Settings</a>.',"error"),n.innerHTML=S}else n.innerHTML=`
+            </div>`;
+      const summarizeUrl = isDaily ? `/api/daily/summarize/${articleId}` : "/api/summarize";
+      const requestBody = isDaily ? {} : { url: postUrl };
+      setTimeout(() => {
+        fetch(summarizeUrl, {
+          method: "POST",
+          credentials: "include",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify(requestBody)
+        }).then((response) => response.json()).then((data) => {
+          if (data.status === "error") {
+            if (data.error.includes("Failed to get text")) {
+              feedContent.innerHTML = originalContent;
+              showMessage("Failed to get article text from the URL.", "error");
+              return;
+            }
+            showMessage(
+              'Error summarizing the text. Check Groq API in <a class="underline" href="/settings">Settings</a>.',
+              "error"
+            );
+            feedContent.innerHTML = originalContent;
+          } else {
+            feedContent.innerHTML = `
                         <div class="w-full animate-itemShow">
-                            <div id="summary-text">${_.summary}</div>
-                        ${bl()}
-                        </div>`}).catch(_=>{T("Error summarizing the text","error"),console.error("Error:",_),n.innerHTML=S})},I)}if(u){let r=u.parentElement.parentElement.querySelector("#summary-text"),i=Gs(r.innerHTML);navigator.clipboard.writeText(i).then(()=>{T("The text has been copied to clipboard.","success")}).catch(n=>{console.error("Error copying text: ",n),T("Error copying text","error")})}})}var bl=()=>`
+                            <div id="summary-text">${data.summary}</div>
+                        ${buttonTemplate()}
+                        </div>`;
+          }
+        }).catch((error) => {
+          showMessage("Error summarizing the text", "error");
+          console.error("Error:", error);
+          feedContent.innerHTML = originalContent;
+        });
+      }, scrollDuration);
+    }
+    if (copyBtn) {
+      const summaryElement = copyBtn.parentElement.parentElement.querySelector("#summary-text");
+      const summaryText = htmlToMarkdown(summaryElement.innerHTML);
+      navigator.clipboard.writeText(summaryText).then(() => {
+        showMessage("The text has been copied to clipboard.", "success");
+      }).catch((error) => {
+        console.error("Error copying text: ", error);
+        showMessage("Error copying text", "error");
+      });
+    }
+  });
+}
+const buttonTemplate = () => `
     <div class="w-fit mt-4 mb-4 ml-auto ">
 
         <button class="relative copy-btn flex ml-auto hover:text-stone-700 group">
@@ -176,12 +751,92 @@ and ensure you are accounting for this risk.
         </button>
         
         
-    </div>`;function Ws(t){let e=window.location.pathname,r="/api/feeditems";if(e==="/"||e==="")r+="";else if(e.includes("/category/")){let i=e.split("/"),n=i[i.indexOf("category")+1];if(e.includes("/feed/")){let s=i[i.indexOf("feed")+1];r+=`/${n}/${s}`}else r+=`/${n}`}return e.endsWith("/all")&&(r+="/all"),`${r}?limit=5${t?`&last_item_id=${t}`:""}`}var st=!1,Zs=null,Js=!1,Qs=new Set;function Ys(){window.addEventListener("scroll",yl)}function Cr(){let t=document.getElementById("feed-container");if(st||Js)return;st=!0;let e=Ws(Zs);fetch(e).then(u=>u.json()).then(u=>{u.length>0&&(u.forEach(r=>{let i=document.createElement("div");i.classList.add("feed-item","animate-itemShow"),i.dataset.read=r.read,i.dataset.id=r.id;let n={weekday:"long",year:"numeric",month:"long",day:"numeric",hour:"2-digit",minute:"2-digit"},a=new Date(r.pub_date).toLocaleString("en-GB",n),o=r.creator!==null?r.creator:"";i.innerHTML=`
-                            <div class="tb-feed-name">${r.feed_title}</div>
-                            <h1 class="item-title"><a class="hover:text-blue-200" target="_blank" rel="noopener noreferrer" href="${r.link}">${r.title}</a></h1>
+    </div>`;
+return{summarizeEnetListener};
+})();
+// src/js/utils/getApiPath.js
+var __utils_getApiPath=(()=>{
+
+const limit = 5;
+function getApiPath(cursor) {
+  const path = window.location.pathname;
+  const basePath = "/api/feeditems";
+  let apiPath = basePath;
+  if (path === "/" || path === "") {
+    apiPath += "";
+  } else if (path.includes("/category/")) {
+    const parts = path.split("/");
+    const catId = parts[parts.indexOf("category") + 1];
+    if (path.includes("/feed/")) {
+      const feedId = parts[parts.indexOf("feed") + 1];
+      apiPath += `/${catId}/${feedId}`;
+    } else {
+      apiPath += `/${catId}`;
+    }
+  }
+  if (path.endsWith("/all")) {
+    apiPath += "/all";
+  }
+  return `${apiPath}?limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""}`;
+}
+return{getApiPath};
+})();
+// src/js/feedItemsList.js
+var __feedItemsList=(()=>{
+var getApiPath=__utils_getApiPath.getApiPath;
+var fetchCategoriesAndBlogs=__feedList.fetchCategoriesAndBlogs;
+var checkUnreadCount=__unreadCount.checkUnreadCount;
+let loading = false;
+let nextCursor = null;
+let EOF = false;
+const readPosts = /* @__PURE__ */ new Set();
+const pendingReads = /* @__PURE__ */ new Set();
+const MARK_READ_DELAY = 1e3;
+let markReadTimer = null;
+function reloadFeedList() {
+  loading = false;
+  nextCursor = null;
+  EOF = false;
+  readPosts.clear();
+  document.getElementById("feed-container").innerHTML = "";
+  loadMoreItems();
+}
+function feedListEventListeners() {
+  window.addEventListener("scroll", handleScroll);
+  window.addEventListener("pagehide", flushReadPosts);
+}
+function loadMoreItems() {
+  const feedContainer = document.getElementById("feed-container");
+  if (loading)
+    return;
+  if (EOF)
+    return;
+  loading = true;
+  const apiPath = getApiPath(nextCursor);
+  fetch(apiPath).then((response) => response.json()).then(({ items, next_cursor }) => {
+    if (items.length > 0) {
+      items.forEach((item) => {
+        const itemElement = document.createElement("div");
+        itemElement.classList.add("feed-item", "animate-itemShow");
+        itemElement.dataset.read = item.read;
+        itemElement.dataset.id = item.id;
+        let options = {
+          weekday: "long",
+          year: "numeric",
+          month: "long",
+          day: "numeric",
+          hour: "2-digit",
+          minute: "2-digit"
+        };
+        let pubDate = new Date(item.pub_date);
+        let formattedDate = pubDate.toLocaleString("en-GB", options);
+        let creatorContent = item.creator !== null ? item.creator : "";
+        itemElement.innerHTML = `
+                            <div class="tb-feed-name">${item.feed_title}</div>
+                            <h1 class="item-title"><a class="hover:text-blue-200" target="_blank" rel="noopener noreferrer" href="${item.link}">${item.title}</a></h1>
                             <div class="flex-col md:flex-row flex">
-                                <div class="tb-feed-date">${a}</div> 
-                                <div class="tb-feed-author">${o}</div>
+                                <div class="tb-feed-date">${formattedDate}</div> 
+                                <div class="tb-feed-author">${creatorContent}</div>
                             </div>
                             <div id="exp-hidden" x-data="{ expanded: false }" class="feed-content relative" :class="{ 'overflow-hidden': !expanded, 'max-h-none overflow-visible': expanded }">
                                 <script>
@@ -195,7 +850,7 @@ and ensure you are accounting for this risk.
                                         }
                                     })();
                                 <\/script>
-                                ${r.summary}
+                                ${item.summary}
                                 <div class="absolute bottom-0 left-0 w-full h-60 bg-gradient-to-t from-slate-800 via-slate-800/90 to-slate-800/0 pointer-events-none" x-show="!expanded"></div>
                                 <button class="absolute bottom-0 left-0 w-full text-center py-2 font-bold text-white transition-colors focus:outline-none" x-show="!expanded" @click="expanded = true">
                                     <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor" class="size-11 w-15 h-15 ml-auto mr-auto shadow-2xl shadow-stone-950 bg-black transition duration-50 hover:bg-stone-700 mb-4 p-3 rounded-full gradient-arrow">
@@ -216,35 +871,720 @@ and ensure you are accounting for this risk.
                                     </button>
                                 </div>
                             </div>
-                        `,t.appendChild(i),ml(i)}),Zs=u[u.length-1].id,st=!1),u.length===1||u.length===2?(Xs(t),st=!1):u.length===0&&(Xs(t),st=!1,Js=!0)}).catch(u=>{console.error("Error fetching the feed items:",u),st=!1})}function Xs(t){if(document.getElementById("empty"))return;let e=window.location.pathname.includes("/all")?"There's nothing here.":"There are no more unread items.",u=document.createElement("div");u.id="empty",u.className="empty-message",u.innerHTML=`
+                        `;
+        feedContainer.appendChild(itemElement);
+        handleOverflow(itemElement);
+      });
+      nextCursor = next_cursor;
+      loading = false;
+    }
+    if (items.length === 1 || items.length === 2) {
+      emptyMessage(feedContainer);
+      loading = false;
+    }
+    if (!next_cursor) {
+      emptyMessage(feedContainer);
+      loading = false;
+      EOF = true;
+    }
+  }).catch((error) => {
+    console.error("Error fetching the feed items:", error);
+    loading = false;
+  });
+}
+function emptyMessage(feedContainer) {
+  if (document.getElementById("empty")) {
+    return;
+  }
+  const message = window.location.pathname.includes("/all") ? "There's nothing here." : "There are no more unread items.";
+  const itemElement = document.createElement("div");
+  itemElement.id = "empty";
+  itemElement.className = "empty-message";
+  itemElement.innerHTML = `
                 <div class="w-full text-center ml-auto mb-[50%] mr-auto mt-[20%] text-gray-600">
-                  ${e}<br><img src="/static/imgs/cup.png" width="100px" class="ml-auto mr-auto mt-10">
-                </div>`,t.appendChild(u)}function ml(t){let e=t.querySelector(".feed-content"),u=window.innerHeight;if(t.offsetHeight>u*.8){e.style.maxHeight=`${u*.8}px`,e.style.overflow="hidden";let i=e.querySelector(".bg-gradient-to-t"),n=e.querySelector("button");i.classList.remove("hidden"),n.classList.remove("hidden"),n.addEventListener("click",()=>{e.style.maxHeight="none",e.style.overflow="visible",i.classList.add("hidden"),n.classList.add("hidden"),Ks()})}else{let i=e.querySelector(".bg-gradient-to-t"),n=e.querySelector("button");i&&i.classList.add("hidden"),n&&n.classList.add("hidden")}}function Ks(){let t=document.querySelectorAll(".feed-item"),e=window.innerHeight;t.forEach(u=>{if(u.dataset.read==="true")return;let r=u.getBoundingClientRect(),i=u.dataset.id,n=u.dataset.read==="true";r.bottom<=e*.7&&!n&&(gl(i),u.dataset.read="true")})}function gl(t){Qs.has(t)||fetch(`/mark_as_read/${t}`,{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"}}).then(e=>{e.ok?(Qs.add(t),ze(),ve()):console.error("Error marking post as read:",e.statusText)}).catch(e=>{console.error("Error marking post as read:",e)})}function yl(){let{scrollTop:t,scrollHeight:e,clientHeight:u}=document.documentElement;t+u>=e*.7&&Cr(),Ks()}var xl=document.getElementById("btnDefault"),vl=document.getElementById("btnAll");function wu(){let t=window.location.pathname,e=document.getElementById("btnDefault"),u=document.getElementById("btnAll");t.includes("/all")?(e.className="not-active-unread",u.className="active-all"):(e.className="active-unread",u.className="not-active-all")}function wl(){let t=window.location.pathname,e=ea(t,!1);t!==e?fetch("/api/settings",{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"},body:JSON.stringify({unread:!0})}).then(()=>{localStorage.setItem("lastChoice","unread"),setTimeout(()=>{window.location.href=e},100)}):wu()}function El(){let t=window.location.pathname,e=ea(t,!0);t!==e?fetch("/api/settings",{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"},body:JSON.stringify({unread:!1})}).then(()=>{localStorage.setItem("lastChoice","all"),setTimeout(()=>{window.location.href=e},100)}):wu()}function ea(t,e){let u=t.split("/").filter(r=>r);if(e)u.includes("all")||u.push("all");else{let r=u.indexOf("all");r>-1&&u.splice(r,1)}return"/"+u.join("/")}function ta(){xl.addEventListener("click",wl),vl.addEventListener("click",El)}var ua=document.getElementById("update-interval"),ra=document.getElementById("clean-after"),ia=document.getElementById("timezone"),na=document.getElementById("language"),sa=document.getElementById("groq-api-key"),Sl=document.getElementById("check-groq-api-key"),Nr=document.getElementById("translate"),Tl=document.getElementById("change_password"),Al=document.getElementById("new_password"),Il=document.getElementById("confirm_password"),Ol=document.getElementById("save-settings"),aa=document.getElementById("font-size");function oa(){fetch("/api/settings",{method:"GET",credentials:"include",headers:{"Content-Type":"application/json"}}).then(t=>t.json()).then(t=>{ua.value=t.update_interval,ra.value=t.clean_after_days,ia.value=t.timezone,na.value=t.language,sa.value=t.groq_api_key,Nr.checked=t.translate,Nr.dispatchEvent(new Event("change")),aa.value=localStorage.getItem("font-size")||"text-lg"}).catch(t=>{console.error("Error fetching settings:",t),T("Failed to load settings","error")})}function ca(){return localStorage.setItem("font-size",aa.value),new Promise((t,e)=>{let u=ua.value,r=ra.value,i=ia.value,n=na.value,s=Nr.checked,a=sa.value,o={update_interval:u,clean_after_days:r,timezone:i,language:n,translate:s};/^[*]+$/.test(a)||(o.groq_api_key=a),fetch("/api/settings",{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"},body:JSON.stringify(o)}).then(c=>c.json()).then(c=>{T("Settings saved successfully","success"),t(c)}).catch(c=>{console.error("Error saving settings:",c),T("Failed to save settings","error"),e(c)})})}function _l(){ca().then(()=>fetch("/api/groq/check",{credentials:"include",headers:{"Content-Type":"application/json"},method:"GET"})).then(t=>t.json()).then(t=>{t.status==="success"?T("API key is valid","success"):T("API key is invalid","error")}).catch(t=>{console.error("Error checking API key:",t),T(`Failed to check API key ${t}`,"error")})}function Ll(){let t=Al.value,e=Il.value;fetch("/api/settings/change_password",{method:"POST",credentials:"include",headers:{"Content-Type":"application/json"},body:JSON.stringify({new_password:t,confirm_password:e})}).then(u=>u.json()).then(u=>{u.status==="success"?T("Password changed successfully","success"):T(u.error,"error")}).catch(u=>{console.error("Error changing password:",u),T("Failed to change password","error")})}function la(){Sl.addEventListener("click",_l),Tl.addEventListener("click",Ll),Ol.addEventListener("click",ca)}function da(){function t(){let u=navigator.userAgent.toLowerCase();return u.includes("safari")&&!u.includes("chrome")&&!u.includes("android")}function e(){return!window.navigator.standalone}t()&&e()&&(document.getElementById("web-app-message").innerText='You can create a Safari web app and open it as an application on your device (on macOS Sonoma and later or iOS 11.3 and later). Click the share button and select "Add to Dock" or "Add to Home Screen".')}async function kt(){try{let e=await(await fetch("/api/categories_and_blogs")).json(),u=document.getElementById("cat-list");u.innerHTML="",e.categories_and_blogs.forEach(r=>{let i="";r.name!=="Unnamed"&&(i=`
-                <button id="delete-${r.id}" class="text-sm px-3 text-red-700 hover:text-red-800 focus:outline-none ml-auto">
+                  ${message}<br><img src="/static/imgs/cup.png" width="100px" class="ml-auto mr-auto mt-10">
+                </div>`;
+  feedContainer.appendChild(itemElement);
+}
+function handleOverflow(item) {
+  const content = item.querySelector(".feed-content");
+  const windowHeight = window.innerHeight;
+  const itemHeight = item.offsetHeight;
+  if (itemHeight > windowHeight * 0.8) {
+    content.style.maxHeight = `${windowHeight * 0.8}px`;
+    content.style.overflow = "hidden";
+    const gradient = content.querySelector(".bg-gradient-to-t");
+    const button = content.querySelector("button");
+    gradient.classList.remove("hidden");
+    button.classList.remove("hidden");
+    button.addEventListener("click", () => {
+      content.style.maxHeight = "none";
+      content.style.overflow = "visible";
+      gradient.classList.add("hidden");
+      button.classList.add("hidden");
+      checkPostsVisibility();
+    });
+  } else {
+    const gradient = content.querySelector(".bg-gradient-to-t");
+    const button = content.querySelector("button");
+    if (gradient) {
+      gradient.classList.add("hidden");
+    }
+    if (button) {
+      button.classList.add("hidden");
+    }
+  }
+}
+function checkPostsVisibility() {
+  const feedItems = document.querySelectorAll(".feed-item");
+  const windowHeight = window.innerHeight;
+  feedItems.forEach((item) => {
+    if (item.dataset.read === "true") {
+      return;
+    }
+    const rect = item.getBoundingClientRect();
+    const postId = item.dataset.id;
+    const isRead = item.dataset.read === "true";
+    if (rect.bottom <= windowHeight * 0.7 && !isRead) {
+      markAsRead(postId);
+      item.dataset.read = "true";
+    }
+  });
+}
+function markAsRead(postId) {
+  if (!readPosts.has(postId)) {
+    readPosts.add(postId);
+    pendingReads.add(Number(postId));
+    if (markReadTimer === null) {
+      markReadTimer = setTimeout(flushReadPosts, MARK_READ_DELAY);
+    }
+  }
+}
+function flushReadPosts() {
+  clearTimeout(markReadTimer);
+  markReadTimer = null;
+  if (pendingReads.size === 0) {
+    return;
+  }
+  const ids = Array.from(pendingReads);
+  pendingReads.clear();
+  fetch("/mark_as_read/batch", {
+    method: "POST",
+    credentials: "include",
+    // Lets the request finish when the page is closed.
+    keepalive: true,
+    headers: {
+      "Content-Type": "application/json"
+    },
+    body: JSON.stringify({ ids })
+  }).then((response) => {
+    if (response.ok) {
+      checkUnreadCount();
+      fetchCategoriesAndBlogs();
+    } else {
+      console.error("Error marking posts as read:", response.statusText);
+      ids.forEach((id) => readPosts.delete(String(id)));
+    }
+  }).catch((error) => {
+    console.error("Error marking posts as read:", error);
+    ids.forEach((id) => readPosts.delete(String(id)));
+  });
+}
+function handleScroll() {
+  const { scrollTop, scrollHeight, clientHeight } = document.documentElement;
+  if (scrollTop + clientHeight >= scrollHeight * 0.7) {
+    loadMoreItems();
+  }
+  checkPostsVisibility();
+}
+return{reloadFeedList,feedListEventListeners,loadMoreItems};
+})();
+// src/js/navigation.js
+var __navigation=(()=>{
+
+const btnDefault = document.getElementById("btnDefault");
+const btnAll = document.getElementById("btnAll");
+function setButtonStyles() {
+  const currentPath = window.location.pathname;
+  const btnDefault2 = document.getElementById("btnDefault");
+  const btnAll2 = document.getElementById("btnAll");
+  if (currentPath.includes("/all")) {
+    btnDefault2.className = "not-active-unread";
+    btnAll2.className = "active-all";
+  } else {
+    btnDefault2.className = "active-unread";
+    btnAll2.className = "not-active-all";
+  }
+}
+function navigateDefault() {
+  const currentPath = window.location.pathname;
+  const newPath = modifyPath(currentPath, false);
+  if (currentPath !== newPath) {
+    fetch("/api/settings", {
+      method: "POST",
+      credentials: "include",
+      headers: {
+        "Content-Type": "application/json"
+      },
+      body: JSON.stringify({
+        unread: true
+      })
+    }).then(() => {
+      localStorage.setItem("lastChoice", "unread");
+      setTimeout(() => {
+        window.location.href = newPath;
+      }, 100);
+    });
+  } else {
+    setButtonStyles();
+  }
+}
+function navigateAll() {
+  const currentPath = window.location.pathname;
+  const newPath = modifyPath(currentPath, true);
+  if (currentPath !== newPath) {
+    fetch("/api/settings", {
+      method: "POST",
+      credentials: "include",
+      headers: {
+        "Content-Type": "application/json"
+      },
+      body: JSON.stringify({
+        unread: false
+      })
+    }).then(() => {
+      localStorage.setItem("lastChoice", "all");
+      setTimeout(() => {
+        window.location.href = newPath;
+      }, 100);
+    });
+  } else {
+    setButtonStyles();
+  }
+}
+function modifyPath(path, all) {
+  const segments = path.split("/").filter((segment) => segment);
+  if (all) {
+    if (!segments.includes("all")) {
+      segments.push("all");
+    }
+  } else {
+    const allIndex = segments.indexOf("all");
+    if (allIndex > -1) {
+      segments.splice(allIndex, 1);
+    }
+  }
+  return "/" + segments.join("/");
+}
+function navigationEventListeners() {
+  btnDefault.addEventListener("click", navigateDefault);
+  btnAll.addEventListener("click", navigateAll);
+}
+return{setButtonStyles,navigationEventListeners};
+})();
+// src/js/settings.js
+var __settings=(()=>{
+var showMessage=__utils_messages.showMessage;
+const updateIntervalInput = document.getElementById("update-interval");
+const cleanAfterInput = document.getElementById("clean-after");
+const timezoneSelect = document.getElementById("timezone");
+const languageSelect = document.getElementById("language");
+const groqApiKeyInput = document.getElementById("groq-api-key");
+const checkGroqApiKeyButton = document.getElementById("check-groq-api-key");
+const translateToggle = document.getElementById("translate");
+const changePasswordButton = document.getElementById("change_password");
+const newPasswordInput = document.getElementById("new_password");
+const confirmPasswordInput = document.getElementById("confirm_password");
+const saveSettingsButton = document.getElementById("save-settings");
+const fontSizeSelect = document.getElementById("font-size");
+function getUserSettings() {
+  fetch("/api/settings", {
+    method: "GET",
+    credentials: "include",
+    headers: {
+      "Content-Type": "application/json"
+    }
+  }).then((response) => response.json()).then((data) => {
+    updateIntervalInput.value = data.update_interval;
+    cleanAfterInput.value = data.clean_after_days;
+    timezoneSelect.value = data.timezone;
+    languageSelect.value = data.language;
+    groqApiKeyInput.value = data.groq_api_key;
+    translateToggle.checked = data.translate;
+    translateToggle.dispatchEvent(new Event("change"));
+    fontSizeSelect.value = localStorage.getItem("font-size") || "text-lg";
+  }).catch((error) => {
+    console.error("Error fetching settings:", error);
+    showMessage("Failed to load settings", "error");
+  });
+}
+function saveUserSettings() {
+  localStorage.setItem("font-size", fontSizeSelect.value);
+  return new Promise((resolve, reject) => {
+    const updateInterval = updateIntervalInput.value;
+    const cleanAfterDays = cleanAfterInput.value;
+    const timezone = timezoneSelect.value;
+    const language = languageSelect.value;
+    const translate = translateToggle.checked;
+    let groqApiKey = groqApiKeyInput.value;
+    let settings = {
+      update_interval: updateInterval,
+      clean_after_days: cleanAfterDays,
+      timezone,
+      language,
+      translate
+    };
+    if (!/^[*]+$/.test(groqApiKey)) {
+      settings.groq_api_key = groqApiKey;
+    }
+    fetch("/api/settings", {
+      method: "POST",
+      credentials: "include",
+      headers: {
+        "Content-Type": "application/json"
+      },
+      body: JSON.stringify(settings)
+    }).then((response) => response.json()).then((data) => {
+      showMessage("Settings saved successfully", "success");
+      resolve(data);
+    }).catch((error) => {
+      console.error("Error saving settings:", error);
+      showMessage("Failed to save settings", "error");
+      reject(error);
+    });
+  });
+}
+function checkGroqApiKey() {
+  saveUserSettings().then(() => {
+    return fetch("/api/groq/check", {
+      credentials: "include",
+      headers: {
+        "Content-Type": "application/json"
+      },
+      method: "GET"
+    });
+  }).then((response) => response.json()).then((data) => {
+    if (data.status === "success") {
+      showMessage("API key is valid", "success");
+    } else {
+      showMessage("API key is invalid", "error");
+    }
+  }).catch((error) => {
+    console.error("Error checking API key:", error);
+    showMessage(`Failed to check API key ${error}`, "error");
+  });
+}
+function changePassword() {
+  const newPassword = newPasswordInput.value;
+  const confirmPassword = confirmPasswordInput.value;
+  fetch("/api/settings/change_password", {
+    method: "POST",
+    credentials: "include",
+    headers: {
+      "Content-Type": "application/json"
+    },
+    body: JSON.stringify({
+      new_password: newPassword,
+      confirm_password: confirmPassword
+    })
+  }).then((response) => response.json()).then((data) => {
+    if (data.status === "success") {
+      showMessage("Password changed successfully", "success");
+    } else {
+      showMessage(data.error, "error");
+    }
+  }).catch((error) => {
+    console.error("Error changing password:", error);
+    showMessage("Failed to change password", "error");
+  });
+}
+function settingEventListeners() {
+  checkGroqApiKeyButton.addEventListener("click", checkGroqApiKey);
+  changePasswordButton.addEventListener("click", changePassword);
+  saveSettingsButton.addEventListener("click", saveUserSettings);
+}
+function safariDetector() {
+  function isSafari() {
+    const userAgent = navigator.userAgent.toLowerCase();
+    return userAgent.includes("safari") && !userAgent.includes("chrome") && !userAgent.includes("android");
+  }
+  function isNotWebApp() {
+    return !window.navigator.standalone;
+  }
+  if (isSafari() && isNotWebApp()) {
+    document.getElementById("web-app-message").innerText = 'You can create a Safari web app and open it as an application on your device (on macOS Sonoma and later or iOS 11.3 and later). Click the share button and select "Add to Dock" or "Add to Home Screen".';
+  }
+}
+return{getUserSettings,settingEventListeners,safariDetector};
+})();
+// src/js/settingsManageCat.js
+var __settingsManageCat=(()=>{
+var showMessage=__utils_messages.showMessage;
+var fetchCategoriesAndBlogs=__feedList.fetchCategoriesAndBlogs;
+async function fetchAndRenderCategories() {
+  try {
+    const response = await fetch("/api/categories_and_blogs");
+    const data = await response.json();
+    const container = document.getElementById("cat-list");
+    container.innerHTML = "";
+    data.categories_and_blogs.forEach((category) => {
+      let deleteButtonHTML = "";
+      if (category.name !== "Unnamed") {
+        deleteButtonHTML = `
+                <button id="delete-${category.id}" class="text-sm px-3 text-red-700 hover:text-red-800 focus:outline-none ml-auto">
                     <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor" class="size-6">
                         <path fill-rule="evenodd" d="M16.5 4.478v.227a48.816 48.816 0 0 1 3.878.512.75.75 0 1 1-.256 1.478l-.209-.035-1.005 13.07a3 3 0 0 1-2.991 2.77H8.084a3 3 0 0 1-2.991-2.77L4.087 6.66l-.209.035a.75.75 0 0 1-.256-1.478A48.567 48.567 0 0 1 7.5 4.705v-.227c0-1.564 1.213-2.9 2.816-2.951a52.662 52.662 0 0 1 3.369 0c1.603.051 2.815 1.387 2.815 2.951Zm-6.136-1.452a51.196 51.196 0 0 1 3.273 0C14.39 3.05 15 3.684 15 4.478v.113a49.488 49.488 0 0 0-6 0v-.113c0-.794.609-1.428 1.364-1.452Zm-.355 5.945a.75.75 0 1 0-1.5.058l.347 9a.75.75 0 1 0 1.499-.058l-.346-9Zm5.48.058a.75.75 0 1 0-1.498-.058l-.347 9a.75.75 0 0 0 1.5.058l.345-9Z" clip-rule="evenodd" />
                     </svg>
-                </button>`);let n=`
-                <div x-data="{ editMode: false, newName: '${r.name}', timeout: null }" class="flex w-full border-b border-gray-900 ">
-                    <span x-show="!editMode" class="block text-base w-full mt-4 mb-2 pb-2 pt-2 px-3 font-medium text-gray-200 cursor-pointer" @click="if('${r.name}' !== 'Unnamed') { editMode = true; requestAnimationFrame(() => { $refs.input.focus(); }); }">${r.name}</span>
-
-                    <input x-show="editMode" x-model="newName" x-ref="input" @keydown.enter="saveCategory(${r.id}, newName); editMode = false" type="text" class="text-base flex w-full mt-4 mb-2 pb-2 pt-2 px-3 mr-1 font-medium text-gray-200 bg-slate-900 rounded-lg border-0 focus:outline-none" @blur="timeout = setTimeout(() => editMode = false, 100)" x-init="$watch('editMode', value => { if (value) setTimeout(() => $refs.input.focus(), 50) })" />
-
-                    <button x-show="editMode" @click="clearTimeout(timeout); saveCategory(${r.id}, newName); editMode = false" class="ml-2 mr-2 mt-4 mb-2 px-3 py-1 h-10 font-semibold text-sm bg-blue-600 hover:bg-blue-700 text-white rounded-md focus:outline-none">Save</button>
-                    ${i}
-                </div>`;u.innerHTML+=n}),e.categories_and_blogs.forEach(r=>{r.name!=="Unnamed"&&document.getElementById(`delete-${r.id}`).addEventListener("click",async()=>{try{let i=await fetch(`/api/settings/categories/delete/${r.id}`,{method:"DELETE"});i.ok?(kt(),ve(!0),T("Category deleted successfully","success")):console.error("Error deleting category:",await i.text())}catch(i){console.error("Error deleting category:",i)}})})}catch(t){T("Error fetching categories and blogs","error"),console.error("Error fetching categories and blogs:",t)}}async function fa(){let t=document.getElementById("new-category"),e=t.value;if(!e){T("Category name is required","error");return}let u=await fetch("/api/settings/categories/add",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({name:e})}),r=await u.json();if(!u.ok){T("Error: "+r.error,"error");return}t.value="",T("Category added successfully","success"),kt(),ve(!0)}window.saveCategory=async(t,e)=>{let u=await fetch(`/api/settings/categories/rename/${t}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({new_name:e})}),r=await u.json();if(!u.ok){T("Error: "+r.error,"error");return}T("Category renamed successfully","success"),kt(),ve(!0)};function ha(){document.getElementById("add-new-category").addEventListener("click",fa),document.getElementById("new-category").addEventListener("keydown",async t=>{t.key==="Enter"&&fa()})}var Pe=document.getElementById("active"),Su=document.getElementById("title-compare"),Eu=document.getElementById("other-settings"),Tu=document.getElementById("translate"),Au=document.getElementById("process-read"),qr=document.getElementById("hours-summary"),Mr=document.getElementById("sync-at-hours"),Pr=document.getElementById("sync-at-minutes"),Cl=document.getElementById("save-settings");function Nl(t){let e=t.split(" ")[0].split(":"),u=e[0],r=e[1];Mr.value=u,Pr.value=r}function ql(t){let e=document.getElementById("feed-list");e.innerHTML="",t.feeds.forEach(u=>{let r=document.createElement("div"),i="feed-"+u.id,n=22,s=u.title.length>n?u.title.substring(0,n)+"...":u.title;r.innerHTML=`
-        <label class="flex min-w-60 mr-6 p-4 border rounded-lg font-bold mb-4 ${u.daily_enabled?"border-green-800 text-white bg-green-800":" text-gray-500 border-gray-700"}">
-        <input type="checkbox" class="mr-2 hidden" id="${i}" name="myCheckbox" ${u.active?"checked":""} />
-        ${s} 
+                </button>`;
+      }
+      let categoryHTML = `
+                <div x-data="{ editMode: false, newName: '${category.name}', timeout: null }" class="flex w-full border-b border-gray-900 ">
+                    <span x-show="!editMode" class="block text-base w-full mt-4 mb-2 pb-2 pt-2 px-3 font-medium text-gray-200 cursor-pointer" @click="if('${category.name}' !== 'Unnamed') { editMode = true; requestAnimationFrame(() => { $refs.input.focus(); }); }">${category.name}</span>
+
+                    <input x-show="editMode" x-model="newName" x-ref="input" @keydown.enter="saveCategory(${category.id}, newName); editMode = false" type="text" class="text-base flex w-full mt-4 mb-2 pb-2 pt-2 px-3 mr-1 font-medium text-gray-200 bg-slate-900 rounded-lg border-0 focus:outline-none" @blur="timeout = setTimeout(() => editMode = false, 100)" x-init="$watch('editMode', value => { if (value) setTimeout(() => $refs.input.focus(), 50) })" />
+
+                    <button x-show="editMode" @click="clearTimeout(timeout); saveCategory(${category.id}, newName); editMode = false" class="ml-2 mr-2 mt-4 mb-2 px-3 py-1 h-10 font-semibold text-sm bg-blue-600 hover:bg-blue-700 text-white rounded-md focus:outline-none">Save</button>
+                    ${deleteButtonHTML}
+                </div>`;
+      container.innerHTML += categoryHTML;
+    });
+    data.categories_and_blogs.forEach((category) => {
+      if (category.name !== "Unnamed") {
+        document.getElementById(`delete-${category.id}`).addEventListener("click", async () => {
+          try {
+            const response2 = await fetch(`/api/settings/categories/delete/${category.id}`, {
+              method: "DELETE"
+            });
+            if (response2.ok) {
+              fetchAndRenderCategories();
+              fetchCategoriesAndBlogs(true);
+              showMessage("Category deleted successfully", "success");
+            } else {
+              console.error("Error deleting category:", await response2.text());
+            }
+          } catch (error) {
+            console.error("Error deleting category:", error);
+          }
+        });
+      }
+    });
+  } catch (error) {
+    showMessage("Error fetching categories and blogs", "error");
+    console.error("Error fetching categories and blogs:", error);
+  }
+}
+async function addCategory() {
+  const categoryNameInput = document.getElementById("new-category");
+  const categoryName = categoryNameInput.value;
+  if (!categoryName) {
+    showMessage("Category name is required", "error");
+    return;
+  }
+  const response = await fetch("/api/settings/categories/add", {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json"
+    },
+    body: JSON.stringify({ name: categoryName })
+  });
+  const data = await response.json();
+  if (!response.ok) {
+    showMessage("Error: " + data.error, "error");
+    return;
+  }
+  categoryNameInput.value = "";
+  showMessage("Category added successfully", "success");
+  fetchAndRenderCategories();
+  fetchCategoriesAndBlogs(true);
+}
+window.saveCategory = async (categoryId, newName) => {
+  const response = await fetch(`/api/settings/categories/rename/${categoryId}`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json"
+    },
+    body: JSON.stringify({ new_name: newName })
+  });
+  const data = await response.json();
+  if (!response.ok) {
+    showMessage("Error: " + data.error, "error");
+    return;
+  }
+  showMessage("Category renamed successfully", "success");
+  fetchAndRenderCategories();
+  fetchCategoriesAndBlogs(true);
+};
+function initCategoryListeners() {
+  document.getElementById("add-new-category").addEventListener("click", addCategory);
+  document.getElementById("new-category").addEventListener("keydown", async (event) => {
+    if (event.key === "Enter") {
+      addCategory();
+    }
+  });
+}
+return{fetchAndRenderCategories,initCategoryListeners};
+})();
+// src/js/settingsDaily.js
+var __settingsDaily=(()=>{
+var showMessage=__utils_messages.showMessage;
+const active = document.getElementById("active");
+const compareTitles = document.getElementById("title-compare");
+const otherSettings = document.getElementById("other-settings");
+const translate = document.getElementById("translate");
+const processRead = document.getElementById("process-read");
+const hoursSummary = document.getElementById("hours-summary");
+const syncAtHours = document.getElementById("sync-at-hours");
+const syncAtMinutes = document.getElementById("sync-at-minutes");
+const save = document.getElementById("save-settings");
+function convertTime(data) {
+  const timeParts = data.split(" ")[0].split(":");
+  const localHours = timeParts[0];
+  const localMinutes = timeParts[1];
+  syncAtHours.value = localHours;
+  syncAtMinutes.value = localMinutes;
+}
+function feedList(data) {
+  const feedList2 = document.getElementById("feed-list");
+  feedList2.innerHTML = "";
+  data.feeds.forEach((feed) => {
+    const option = document.createElement("div");
+    const feedId = "feed-" + feed.id;
+    const maxLength = 22;
+    const title = feed.title.length > maxLength ? feed.title.substring(0, maxLength) + "..." : feed.title;
+    option.innerHTML = `
+        <label class="flex min-w-60 mr-6 p-4 border rounded-lg font-bold mb-4 ${feed.daily_enabled ? "border-green-800 text-white bg-green-800" : " text-gray-500 border-gray-700"}">
+        <input type="checkbox" class="mr-2 hidden" id="${feedId}" name="myCheckbox" ${feed.active ? "checked" : ""} />
+        ${title} 
         </label>
-        `;let a=r.querySelector(`#${i}`);a.addEventListener("change",o=>{let c=a.parentElement;o.target.checked?(c.classList.add("border-green-800","text-white","bg-green-800"),fetch("/api/settings/daily/feed",{method:"PUT",headers:{"Content-Type":"application/json"},credentials:"include",body:JSON.stringify({id:u.id,dailyEnabled:!0})}).catch(console.error())):(c.classList.remove("border-green-800","text-white","bg-green-800"),c.classList.add("text-gray-500","border-gray-700"),fetch("/api/settings/daily/feed",{method:"PUT",headers:{"Content-Type":"application/json"},credentials:"include",body:JSON.stringify({id:u.id,dailyEnabled:!1})}).catch(console.error()))}),e.appendChild(r)})}function Dr(){fetch("/api/settings/daily",{method:"GET",credentials:"include"}).then(t=>t.json()).then(t=>(qr.value=t.hours_summary,Au.checked=t.process_read,Au.dispatchEvent(new Event("change")),Tu.checked=t.translate,Tu.dispatchEvent(new Event("change")),Su.checked=t.compare_titles,Su.dispatchEvent(new Event("change")),Pe.checked=t.active,Pe.dispatchEvent(new Event("change")),Nl(t.daily_sync_at),ql(t),t)).catch(t=>{console.log("Error: ",t),T("Error fetching daily settings","error")})}function Ml(){let t={hours_summary:qr.value,process_read:Au.checked,translate:Tu.checked,compare_titles:Su.checked,active:Pe.checked,sync_at:`${Mr.value}:${Pr.value}:00`};fetch("/api/settings/daily",{method:"POST",headers:{"Content-Type":"application/json"},credentials:"include",body:JSON.stringify(t)}).then(e=>e.json()).then(()=>{Dr()}).catch(e=>{console.log("Error: ",e),T("Error disabling daily settings","error")})}function Pl(){let t={hours_summary:qr.value,process_read:Au.checked,translate:Tu.checked,compare_titles:Su.checked,active:Pe.checked,sync_at:`${Mr.value}:${Pr.value}:00`};fetch("/api/settings/daily",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(t),credentials:"include"}).then(e=>e.json()).then(()=>{T("Daily settings saved successfully","success"),Dr()}).catch(e=>{console.log("Error: ",e),T("Error saving daily settings","error")})}function Dl(){Pe.addEventListener("change",()=>{Pe.checked?(Eu.classList.remove("hidden"),Eu.classList.add("flex","flex-col")):(Eu.classList.remove("flex","flex-col"),Eu.classList.add("hidden"))}),Pe.addEventListener("click",()=>{Pe.checked||Ml()}),Cl.addEventListener("click",()=>{Pl()})}function pa(){Dl(),Dr()}function ba(){let t=null;window.addEventListener("touchstart",e=>{t=e.touches[0].clientY}),window.addEventListener("touchend",e=>{e.changedTouches[0].clientY-t>200&&window.scrollY<50&&location.reload()})}$e();$r();Gr();window.location.pathname==="/daily"&&(Vr(),Lr());(window.location.pathname.endsWith("/")||window.location.pathname.endsWith("/all")||window.location.pathname.includes("/category"))&&(Cr(),wu(),ta(),Lr(),Ys());if(window.location.pathname.endsWith("/categories")){async function t(){await kt()}t(),ha()}window.location.pathname.endsWith("/settings")&&(oa(),la(),da());window.location.pathname.endsWith("settings/daily")&&pa();Wr();jr();ba();})();
-/*! Bundled license information:
-
-is-plain-object/dist/is-plain-object.js:
-  (*!
-   * is-plain-object <https://github.com/jonschlinkert/is-plain-object>
-   *
-   * Copyright (c) 2014-2017, Jon Schlinkert.
-   * Released under the MIT License.
-   *)
-*/
+        `;
+    const checkbox = option.querySelector(`#${feedId}`);
+    checkbox.addEventListener("change", (event) => {
+      const parentLabel = checkbox.parentElement;
+      if (event.target.checked) {
+        parentLabel.classList.add("border-green-800", "text-white", "bg-green-800");
+        fetch("/api/settings/daily/feed", {
+          method: "PUT",
+          headers: { "Content-Type": "application/json" },
+          credentials: "include",
+          body: JSON.stringify({ id: feed.id, dailyEnabled: true })
+        }).catch(console.error());
+      } else {
+        parentLabel.classList.remove("border-green-800", "text-white", "bg-green-800");
+        parentLabel.classList.add("text-gray-500", "border-gray-700");
+        fetch("/api/settings/daily/feed", {
+          method: "PUT",
+          headers: { "Content-Type": "application/json" },
+          credentials: "include",
+          body: JSON.stringify({ id: feed.id, dailyEnabled: false })
+        }).catch(console.error());
+      }
+    });
+    feedList2.appendChild(option);
+  });
+}
+function getDailySettings() {
+  fetch("/api/settings/daily", {
+    method: "GET",
+    credentials: "include"
+  }).then((response) => response.json()).then((data) => {
+    hoursSummary.value = data.hours_summary;
+    processRead.checked = data.process_read;
+    processRead.dispatchEvent(new Event("change"));
+    translate.checked = data.translate;
+    translate.dispatchEvent(new Event("change"));
+    compareTitles.checked = data.compare_titles;
+    compareTitles.dispatchEvent(new Event("change"));
+    active.checked = data.active;
+    active.dispatchEvent(new Event("change"));
+    convertTime(data.daily_sync_at);
+    feedList(data);
+    return data;
+  }).catch((err) => {
+    console.log("Error: ", err);
+    showMessage("Error fetching daily settings", "error");
+  });
+}
+function disableDaily() {
+  const data = {
+    hours_summary: hoursSummary.value,
+    process_read: processRead.checked,
+    translate: translate.checked,
+    compare_titles: compareTitles.checked,
+    active: active.checked,
+    sync_at: `${syncAtHours.value}:${syncAtMinutes.value}:00`
+  };
+  fetch("/api/settings/daily", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    credentials: "include",
+    body: JSON.stringify(data)
+  }).then((response) => response.json()).then(() => {
+    getDailySettings();
+  }).catch((err) => {
+    console.log("Error: ", err);
+    showMessage("Error disabling daily settings", "error");
+  });
+}
+function postDailySettings() {
+  const data = {
+    hours_summary: hoursSummary.value,
+    process_read: processRead.checked,
+    translate: translate.checked,
+    compare_titles: compareTitles.checked,
+    active: active.checked,
+    sync_at: `${syncAtHours.value}:${syncAtMinutes.value}:00`
+  };
+  fetch("/api/settings/daily", {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json"
+    },
+    body: JSON.stringify(data),
+    credentials: "include"
+  }).then((response) => response.json()).then(() => {
+    showMessage("Daily settings saved successfully", "success");
+    getDailySettings();
+  }).catch((err) => {
+    console.log("Error: ", err);
+    showMessage("Error saving daily settings", "error");
+  });
+}
+function eventListeners() {
+  active.addEventListener("change", () => {
+    if (active.checked) {
+      otherSettings.classList.remove("hidden");
+      otherSettings.classList.add("flex", "flex-col");
+    } else {
+      otherSettings.classList.remove("flex", "flex-col");
+      otherSettings.classList.add("hidden");
+    }
+  });
+  active.addEventListener("click", () => {
+    if (!active.checked) {
+      disableDaily();
+    }
+  });
+  save.addEventListener("click", () => {
+    postDailySettings();
+  });
+}
+function initDailySettings() {
+  eventListeners();
+  getDailySettings();
+}
+return{initDailySettings};
+})();
+// src/js/utils/swipes.js
+var __utils_swipes=(()=>{
+
+function swipeToReload() {
+  let startY = null;
+  window.addEventListener("touchstart", (event) => {
+    startY = event.touches[0].clientY;
+  });
+  window.addEventListener("touchend", (event) => {
+    const endY = event.changedTouches[0].clientY;
+    const distance = endY - startY;
+    if (distance > 200 && window.scrollY < 50) {
+      location.reload();
+    }
+  });
+}
+return{swipeToReload};
+})();
+// src/js/events.js
+var __events=(()=>{
+var setLiveUpdates=__feedList.setLiveUpdates;
+var updateFeedListData=__feedList.updateFeedListData;
+var fetchLastSync=__feedList.fetchLastSync;
+var checkUnreadCount=__unreadCount.checkUnreadCount;
+var setBadgePolling=__unreadCount.setBadgePolling;
+var showMessage=__utils_messages.showMessage;
+const REFRESH_DELAY = 1e3;
+let refreshTimer = null;
+function scheduleRefresh() {
+  if (refreshTimer !== null)
+    return;
+  refreshTimer = setTimeout(() => {
+    refreshTimer = null;
+    updateFeedListData();
+    checkUnreadCount();
+  }, REFRESH_DELAY);
+}
+function setLive(enabled) {
+  setLiveUpdates(enabled);
+  setBadgePolling(!enabled);
+}
+function initLiveEvents() {
+  if (!("EventSource" in window))
+    return;
+  const source = new EventSource("/api/events");
+  source.addEventListener("open", () => {
+    setLive(true);
+    scheduleRefresh();
+  });
+  source.addEventListener("error", () => setLive(false));
+  source.addEventListener("unread", scheduleRefresh);
+  source.addEventListener("items", scheduleRefresh);
+  source.addEventListener("resync", scheduleRefresh);
+  source.addEventListener("last_sync", fetchLastSync);
+  source.addEventListener("daily", () => showMessage("Daily has been updated", "success"));
+}
+return{initLiveEvents};
+})();
+// src/js/index.js
+var __index=(()=>{
+var initDaily=__daily.initDaily;
+var updateFeedListData=__feedList.updateFeedListData;
+var initFeedListListeners=__feedList.initFeedListListeners;
+var initSetInterval=__feedList.initSetInterval;
+var initAddfeedModal=__addFeedModal.initAddfeedModal;
+var summarizeEventListener=__utils_summary.summarizeEnetListener;
+var loadMoreItems=__feedItemsList.loadMoreItems;
+var feedListEventListeners=__feedItemsList.feedListEventListeners;
+var setButtonStyles=__navigation.setButtonStyles;
+var navigationEventListeners=__navigation.navigationEventListeners;
+var initBadgeUpdate=__unreadCount.initBadgeUpdate;
+var getUserSettings=__settings.getUserSettings;
+var settingsEventListeners=__settings.settingEventListeners;
+var safariDetector=__settings.safariDetector;
+var fetchAndRenderCategories=__settingsManageCat.fetchAndRenderCategories;
+var initCategoryListeners=__settingsManageCat.initCategoryListeners;
+var initDailySettings=__settingsDaily.initDailySettings;
+var swipeToReload=__utils_swipes.swipeToReload;
+var initLiveEvents=__events.initLiveEvents;
+updateFeedListData();
+initFeedListListeners();
+initSetInterval();
+if (window.location.pathname === "/daily") {
+  initDaily();
+  summarizeEventListener();
+}
+if (window.location.pathname.endsWith("/") || window.location.pathname.endsWith("/all") || window.location.pathname.includes("/category")) {
+  loadMoreItems();
+  setButtonStyles();
+  navigationEventListeners();
+  summarizeEventListener();
+  feedListEventListeners();
+}
+if (window.location.pathname.endsWith("/categories")) {
+  async function initCat() {
+    await fetchAndRenderCategories();
+  }
+  initCat();
+  initCategoryListeners();
+}
+if (window.location.pathname.endsWith("/settings")) {
+  getUserSettings();
+  settingsEventListeners();
+  safariDetector();
+}
+if (window.location.pathname.endsWith("settings/daily")) {
+  initDailySettings();
+}
+initAddfeedModal();
+initBadgeUpdate();
+initLiveEvents();
+swipeToReload();
+return{};
+})();})();
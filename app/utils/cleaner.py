@@ -1,7 +1,11 @@
 import logging
+import re
 from urllib.parse import urlparse, urlunparse
 from bs4 import BeautifulSoup, Comment
 
+# Length of the excerpt stored next to the summary of a feed item
+EXCERPT_LENGTH = 280
+
 # Global constants for allowed tags and attributes
 ALLOWED_TAGS = [
     "iframe",
@@ -253,3 +257,39 @@ def clean_summary(summary):
     cleaned_summary = str(soup)
 
     return cleaned_summary
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """
+    Shortens plain text to at most `length` characters, cutting at a word
+    boundary and appending an ellipsis.
+    """
+    if len(text) <= length:
+        return text
+    cut = text[:length]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def summary_fields(summary):
+    """
+    Derives the fields stored next to a cleaned summary, so readers do not
+    need to parse its HTML again.
+
+    Args:
+        summary (str): The cleaned summary HTML.
+
+    Returns:
+        dict: The plain_text, excerpt, first_image and word_count of the
+        summary, ready to be passed to FeedItem.
+    """
+    soup = BeautifulSoup(summary or "", "html.parser")
+    plain_text = re.sub(r"\s+", " ", soup.get_text(" ", strip=True))
+    image = soup.find("img", src=True)
+    return {
+        "plain_text": plain_text,
+        "excerpt": make_excerpt(plain_text),
+        "first_image": image["src"] if image else None,
+        "word_count": len(plain_text.split()),
+    }
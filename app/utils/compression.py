@@ -0,0 +1,116 @@
+"""
+Transparent compression of large text columns.
+
+Values are stored as a version byte followed by the payload:
+
+    0x00    UTF-8 text, stored as is
+    0x01    zlib compressed UTF-8 text
+    0x02    zstd compressed UTF-8 text (needs the zstandard package)
+
+The codec for new values is chosen with the SUMMARY_COMPRESSION setting
+("zlib", "zstd" or "none"). Every stored value names its own codec, so
+changing the setting never breaks reading older rows. Short values and
+values that do not get smaller are stored as is.
+"""
+
+import zlib
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover, zstd is optional
+    zstandard = None
+
+RAW = 0
+ZLIB = 1
+ZSTD = 2
+
+CODECS = {"none": RAW, "zlib": ZLIB, "zstd": ZSTD}
+
+# Below this size the compression header outweighs the savings.
+MIN_SIZE = 128
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+_codec = ZLIB
+
+
+def configure(name):
+    """
+    Selects the codec used for new values.
+
+    Raises:
+        ValueError: If the codec is unknown or zstd is not installed.
+    """
+    global _codec
+    name = (name or "none").lower()
+    if name not in CODECS:
+        raise ValueError(
+            f"Invalid SUMMARY_COMPRESSION {name!r}, "
+            f"expected one of {sorted(CODECS)}"
+        )
+    if CODECS[name] == ZSTD and zstandard is None:
+        raise ValueError("SUMMARY_COMPRESSION zstd needs `zstandard`")
+    _codec = CODECS[name]
+
+
+def compress(text, codec=None):
+    """Encodes text as a versioned, possibly compressed value."""
+    if text is None:
+        return None
+    data = text.encode("utf-8")
+    codec = _codec if codec is None else codec
+    if codec != RAW and len(data) >= MIN_SIZE:
+        if codec == ZLIB:
+            packed = zlib.compress(data, ZLIB_LEVEL)
+        else:
+            packed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        if len(packed) < len(data):
+            return bytes([codec]) + packed
+    return bytes([RAW]) + data
+
+
+def decompress(value):
+    """
+    Decodes a value created by `compress`. Plain strings, left by SQLite
+    from before the column was compressed, are returned unchanged.
+
+    Raises:
+        ValueError: If the version byte is unknown.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not value:
+        return ""
+    version, payload = value[0], value[1:]
+    if version == RAW:
+        return payload.decode("utf-8")
+    if version == ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if version == ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd compressed value, install `zstandard`")
+        return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    raise ValueError(f"Unknown compression version {version}")
+
+
+class CompressedText(TypeDecorator):
+    """
+    A text column stored with `compress` and read with `decompress`.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return compress(value)
+
+    def process_result_value(self, value, dialect):
+        return decompress(value)
+
+
+def init_app(app):
+    """Applies the SUMMARY_COMPRESSION setting of the application."""
+    configure(app.config.get("SUMMARY_COMPRESSION", "zlib"))
@@ -0,0 +1,66 @@
+"""
+This module creates and reads the opaque cursors of keyset-paginated
+listings.
+
+A cursor carries the sort key of the last row of a page, e.g.
+`(pub_date, id)`, so the next page is a single range query that does not
+need to look the row up again and still works after it has been deleted.
+Cursors are signed with the application's secret key and a per-listing salt,
+so clients cannot forge sort keys or reuse a cursor in another listing.
+"""
+
+from datetime import datetime
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor is malformed, forged or from another listing."""
+
+
+def _serializer(kind):
+    return URLSafeSerializer(current_app.secret_key, salt=f"cursor:{kind}")
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(kind, *key):
+    """
+    Returns a signed cursor for the sort key of the last row of a page.
+
+    Args:
+        kind (str): The listing the cursor belongs to.
+        *key: The sort key values (datetimes, numbers, strings or None).
+    """
+    return _serializer(kind).dumps([_encode_value(value) for value in key])
+
+
+def decode_cursor(kind, cursor, size):
+    """
+    Returns the sort key of a cursor created by `encode_cursor`.
+
+    Args:
+        kind (str): The listing the cursor must belong to.
+        cursor (str): The cursor sent by the client.
+        size (int): The expected number of key values.
+
+    Raises:
+        InvalidCursor: If the cursor cannot be verified or decoded.
+    """
+    try:
+        key = _serializer(kind).loads(cursor)
+        if not isinstance(key, list) or len(key) != size:
+            raise ValueError(f"Expected {size} key values")
+        return tuple(_decode_value(value) for value in key)
+    except (BadSignature, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
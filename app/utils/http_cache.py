@@ -0,0 +1,180 @@
+"""
+This module lets polled JSON endpoints answer conditional requests with
+`304 Not Modified`.
+
+A process-wide data version is bumped after every commit that changed
+feeds, items, counters, categories, settings or users, whether through the
+ORM or a bulk statement. Views decorated with `conditional` derive a weak
+ETag from the version, the user and the request URL, so a poll whose
+If-None-Match still matches is answered before the view runs a single
+query. Responses are sent with `Cache-Control: private, no-cache`: the
+browser keeps them, but revalidates on every use. `VersionedMemo` keeps
+computed payloads on the server under the same rule.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from flask import current_app, make_response, request
+from flask_login import current_user
+from sqlalchemy import event
+
+# Changes to these tables never show up in a cached response.
+UNTRACKED_TABLES = {"job_state"}
+CHANGED = "http_cache_changed"
+CACHE_CONTROL = "private, no-cache"
+
+# A new process must not hand out the ETags of a previous one.
+_boot = os.urandom(4).hex()
+_version = 0
+_modified = datetime.now(timezone.utc).replace(microsecond=0)
+_lock = threading.Lock()
+
+
+def data_version():
+    """Returns the current data version and when it last changed."""
+    return _version, _modified
+
+
+def bump():
+    """Marks all cached responses as stale."""
+    global _version, _modified
+    with _lock:
+        _version += 1
+        _modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _tracked(table):
+    return getattr(table, "name", None) not in UNTRACKED_TABLES
+
+
+def flag_flush(session, flush_context):
+    """Flags the session if a flush wrote a tracked row."""
+    if any(
+        _tracked(getattr(obj, "__table__", None))
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info[CHANGED] = True
+
+
+def flag_bulk_statement(orm_execute_state):
+    """Flags the session if it runs a bulk INSERT, UPDATE or DELETE."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ) and _tracked(getattr(orm_execute_state.statement, "table", None)):
+        orm_execute_state.session.info[CHANGED] = True
+
+
+def flag(session):
+    """
+    Flags the session for writes made through its connection, which the
+    ORM hooks above do not see.
+    """
+    session.info[CHANGED] = True
+
+
+def bump_after_commit(session):
+    """Bumps the data version once the flagged changes are visible."""
+    if session.info.pop(CHANGED, False):
+        bump()
+
+
+def clear_after_rollback(session, previous_transaction):
+    session.info.pop(CHANGED, None)
+
+
+class VersionedMemo:
+    """
+    Values computed per key, reused until the data version changes or for
+    at most `ttl` seconds. A value computed while the version changed is
+    returned but not kept.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, key, compute, ttl):
+        version = _version
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version and entry[1] > now:
+            return entry[2]
+        value = compute()
+        if version == _version:
+            self._entries[key] = (version, now + ttl, value)
+        return value
+
+
+def make_etag(version):
+    """Returns the ETag of the current request at a data version."""
+    key = f"{_boot}:{version}:{current_user.get_id()}:{request.full_path}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def is_not_modified(etag, last_modified):
+    """
+    Checks the validators of the request. If-Modified-Since only counts
+    without If-None-Match, as it has a resolution of one second.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    since = request.if_modified_since
+    return since is not None and last_modified <= since
+
+
+def set_validators(response, etag, last_modified):
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.vary.add("Cookie")
+    return response
+
+
+def conditional(view):
+    """
+    Answers GET requests to a view with 304 while the data version, the
+    user and the URL are unchanged.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method != "GET":
+            return view(*args, **kwargs)
+        version, last_modified = data_version()
+        etag = make_etag(version)
+        if is_not_modified(etag, last_modified):
+            response = current_app.response_class(status=304)
+            return set_validators(response, etag, last_modified)
+
+        response = make_response(view(*args, **kwargs))
+        # A commit while the view ran may not be part of its response.
+        if response.status_code == 200 and version == _version:
+            set_validators(response, etag, last_modified)
+        return response
+
+    return wrapper
+
+
+def revalidate(response):
+    """
+    Sets a weak ETag computed from the body, for responses that change
+    without a data change, like relative times. Saves the transfer, not the
+    work.
+    """
+    response.add_etag(weak=True)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.vary.add("Cookie")
+    return response.make_conditional(request)
+
+
+def init_app(app, db):
+    """Registers the hooks that maintain the data version."""
+    event.listen(db.session, "after_flush", flag_flush)
+    event.listen(db.session, "do_orm_execute", flag_bulk_statement)
+    event.listen(db.session, "after_commit", bump_after_commit)
+    event.listen(db.session, "after_soft_rollback", clear_after_rollback)
@@ -0,0 +1,194 @@
+"""
+This module compresses responses for clients that accept it.
+
+Dynamic responses (JSON, HTML) are compressed after the view ran, with the
+first of the COMPRESS_ALGORITHMS the client accepts ("br" needs the brotli
+package). Responses smaller than COMPRESS_MIN_SIZE bytes, of a type outside
+COMPRESS_MIMETYPES, without a body or already encoded are sent as is.
+
+Static files are never compressed per request. `precompress` writes `.gz`
+and `.br` copies next to the build output, and the static view sends such a
+copy when the client accepts its encoding:
+
+    python -m app.utils.http_compression app/static/js/bundle.js \
+        app/static/css/bundle.css
+"""
+
+import gzip
+import mimetypes
+import os
+import sys
+from functools import wraps
+from flask import request, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover, brotli is optional
+    brotli = None
+
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+VARY = "Accept-Encoding"
+
+
+def available(algorithms):
+    """Drops the algorithms that are unknown or not installed."""
+    return [
+        algorithm
+        for algorithm in algorithms
+        if algorithm == "gzip" or (algorithm == "br" and brotli is not None)
+    ]
+
+
+def negotiate(algorithms):
+    """Returns the first of `algorithms` the client accepts, or None."""
+    for algorithm in algorithms:
+        if request.accept_encodings[algorithm]:
+            return algorithm
+    return None
+
+
+def compress(data, algorithm, gzip_level=4, brotli_quality=4):
+    """Compresses `data` with "gzip" or "br"."""
+    if algorithm == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    # mtime=0 keeps the output, and with it precompressed files, stable.
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def is_compressible(response, content_types, min_size):
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in content_types
+    ):
+        return False
+    return response.calculate_content_length() >= min_size
+
+
+def compress_response(response, algorithm, gzip_level, brotli_quality):
+    """Replaces the body of a response with its compressed form."""
+    response.set_data(
+        compress(response.get_data(), algorithm, gzip_level, brotli_quality)
+    )
+    response.headers["Content-Encoding"] = algorithm
+    response.vary.add(VARY)
+    # A strong validator must change with the encoding, a weak one may not.
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def static_view(app, algorithms):
+    """
+    Wraps the static view to send a precompressed copy of a file when the
+    client accepts its encoding, and the file itself otherwise.
+    """
+    original = app.view_functions["static"]
+
+    def precompressed(filename):
+        # Copies older than the file are left over from a previous build.
+        path = safe_join(app.static_folder, filename)
+        if not path or not os.path.isfile(path):
+            return []
+        modified = os.path.getmtime(path)
+        return [
+            algorithm
+            for algorithm in algorithms
+            if os.path.isfile(path + SUFFIXES[algorithm])
+            and os.path.getmtime(path + SUFFIXES[algorithm]) >= modified
+        ]
+
+    @wraps(original)
+    def static(filename):
+        encodings = precompressed(filename)
+        algorithm = negotiate(encodings)
+        if algorithm is None:
+            response = original(filename=filename)
+        else:
+            response = send_from_directory(
+                app.static_folder,
+                filename + SUFFIXES[algorithm],
+                mimetype=mimetypes.guess_type(filename)[0],
+            )
+            response.headers["Content-Encoding"] = algorithm
+        if encodings:
+            response.vary.add(VARY)
+        return response
+
+    return static
+
+
+def precompress(paths, gzip_level=9, brotli_quality=11):
+    """
+    Writes `.gz` (and with brotli installed `.br`) copies of files.
+
+    Returns:
+        list[tuple]: (path, original size, {suffix: compressed size}).
+    """
+    report = []
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        sizes = {}
+        for algorithm in available(["gzip", "br"]):
+            packed = compress(data, algorithm, gzip_level, brotli_quality)
+            with open(path + SUFFIXES[algorithm], "wb") as f:
+                f.write(packed)
+            sizes[SUFFIXES[algorithm]] = len(packed)
+        report.append((path, len(data), sizes))
+    return report
+
+
+def init_app(app):
+    """Registers response compression and the precompressed static view."""
+    algorithms = available(
+        [
+            algorithm.strip()
+            for algorithm in app.config.get(
+                "COMPRESS_ALGORITHMS", "br,gzip"
+            ).split(",")
+            if algorithm.strip()
+        ]
+    )
+    if not algorithms:
+        return
+    content_types = set(app.config.get("COMPRESS_MIMETYPES", []))
+    min_size = app.config.get("COMPRESS_MIN_SIZE", 1024)
+    gzip_level = app.config.get("COMPRESS_GZIP_LEVEL", 4)
+    brotli_quality = app.config.get("COMPRESS_BROTLI_QUALITY", 4)
+
+    if "static" in app.view_functions:
+        app.view_functions["static"] = static_view(app, algorithms)
+
+    @app.after_request
+    def compress_after_request(response):
+        if not is_compressible(response, content_types, min_size):
+            return response
+        response.vary.add(VARY)
+        algorithm = negotiate(algorithms)
+        if algorithm is None:
+            return response
+        return compress_response(
+            response, algorithm, gzip_level, brotli_quality
+        )
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(f"Usage: python -m {__spec__.name} FILE...")
+    for path, size, sizes in precompress(sys.argv[1:]):
+        print(
+            f"{path}: {size} bytes, "
+            + ", ".join(
+                f"{suffix} {packed}" for suffix, packed in sizes.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
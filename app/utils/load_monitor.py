@@ -0,0 +1,62 @@
+"""
+This module keeps a rolling window of recent web request latencies so that
+background jobs can back off while the web tier is busy.
+"""
+
+import threading
+import time
+from collections import deque
+from flask import g
+
+WINDOW_SECONDS = 60
+MAX_SAMPLES = 1000
+
+_samples = deque(maxlen=MAX_SAMPLES)
+_lock = threading.Lock()
+
+
+def record_request(duration):
+    """
+    Records the duration of a finished request.
+
+    Args:
+        duration (float): The request duration in seconds.
+    """
+    with _lock:
+        _samples.append((time.monotonic(), duration))
+
+
+def recent_latency(percentile=0.95):
+    """
+    Returns the given percentile of request latencies in the last
+    `WINDOW_SECONDS` seconds, or 0.0 if there were no requests.
+    """
+    cutoff = time.monotonic() - WINDOW_SECONDS
+    with _lock:
+        durations = sorted(d for t, d in _samples if t >= cutoff)
+    if not durations:
+        return 0.0
+    index = min(int(len(durations) * percentile), len(durations) - 1)
+    return durations[index]
+
+
+def is_busy(threshold):
+    """
+    Returns True if recent request latency is above `threshold` seconds.
+    """
+    return recent_latency() > threshold
+
+
+def init_app(app):
+    """Registers request hooks that record the latency of every request."""
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started_at = time.perf_counter()
+
+    @app.after_request
+    def record_request_latency(response):
+        started_at = g.pop("request_started_at", None)
+        if started_at is not None:
+            record_request(time.perf_counter() - started_at)
+        return response
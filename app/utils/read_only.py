@@ -0,0 +1,64 @@
+"""
+This module runs the database session of safe (GET, HEAD, OPTIONS) requests
+in a read-only scope.
+
+Within the scope autoflush is off, so reading never flushes pending changes,
+and a `before_flush` guard raises `ReadOnlySessionError` as soon as anything
+tries to write. A read therefore never takes the SQLite write lock and never
+waits for the background writer. The few views that write on GET are marked
+with `allow_writes`.
+"""
+
+from flask import request
+from sqlalchemy import event
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+READ_ONLY = "read_only"
+SAVED_AUTOFLUSH = "read_only_saved_autoflush"
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a read-only request tries to write to the database."""
+
+
+def allow_writes(view):
+    """Marks a view that may write to the database on GET requests."""
+    view.allows_writes = True
+    return view
+
+
+def guard_flush(session, flush_context, instances):
+    """Fails the flush of a read-only session that has pending changes."""
+    if session.info.get(READ_ONLY) and (
+        session.new or session.dirty or session.deleted
+    ):
+        raise ReadOnlySessionError(
+            f"{request.method} {request.path} tried to write to the "
+            f"database: new={list(session.new)} dirty={list(session.dirty)} "
+            f"deleted={list(session.deleted)}"
+        )
+
+
+def init_app(app, db):
+    """Registers the read-only scope for safe requests."""
+    event.listen(db.session, "before_flush", guard_flush)
+
+    @app.before_request
+    def start_read_only_scope():
+        if request.method not in SAFE_METHODS:
+            return
+        view = app.view_functions.get(request.endpoint)
+        if view is None or getattr(view, "allows_writes", False):
+            return
+        session = db.session()
+        session.info[READ_ONLY] = True
+        session.info[SAVED_AUTOFLUSH] = session.autoflush
+        session.autoflush = False
+
+    @app.teardown_request
+    def end_read_only_scope(exc):
+        # The session outlives the request when the app context was pushed
+        # outside of it, as in the tests.
+        session = db.session()
+        if session.info.pop(READ_ONLY, False):
+            session.autoflush = session.info.pop(SAVED_AUTOFLUSH)
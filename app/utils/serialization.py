@@ -1,31 +1,32 @@
 """
-This module contains a function for serializing an item object into a
-dictionary, including additional information like feed title and publication
-date.
+This module contains a function for serializing a feed item listing row into
+a dictionary, including the feed title and the publication date in the
+user's timezone.
 """
 
 import pytz
 
 
-def serialize_item(item, user_timezone):
+def serialize_row(row, user_timezone):
     """
-    Serializes an item object into a dictionary, including additional
-    information like feed title and publication date.
+    Serializes a listing row into a dictionary. The row is a read-only result
+    mapping (the columns of `FeedItem.to_dict` plus `feed_title`), so no ORM
+    object is loaded or modified.
 
     Args:
-        item (Item): The item object to be serialized. user_timezone
-        (timezone): The timezone to be used for converting the publication
-        date.
+        row (RowMapping): The listing row to be serialized.
+        user_timezone (timezone): The timezone to be used for converting the
+        publication date.
 
     Returns:
         dict: A dictionary containing the serialized item data.
     """
-    item_dict = item.to_dict()
-    item_dict["feed_title"] = item.feed.title
-    if item.pub_date:
-        item.pub_date = item.pub_date.replace(tzinfo=pytz.utc).astimezone(
-            user_timezone
+    item_dict = dict(row)
+    if row["pub_date"]:
+        item_dict["pub_date"] = (
+            row["pub_date"]
+            .replace(tzinfo=pytz.utc)
+            .astimezone(user_timezone)
+            .isoformat()
         )
-        item_dict["pub_date"] = item.pub_date.isoformat()
-
     return item_dict
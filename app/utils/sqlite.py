@@ -0,0 +1,102 @@
+"""
+This module applies SQLite specific settings to every new database
+connection.
+
+The connection profile is read from the SQLITE_* settings in `config.Config`:
+
+    SQLITE_JOURNAL_MODE   journal_mode, WAL lets readers run next to the
+                          background writer
+    SQLITE_SYNCHRONOUS    synchronous, NORMAL is safe in WAL mode
+    SQLITE_BUSY_TIMEOUT   milliseconds to wait for a lock before failing
+    SQLITE_MMAP_SIZE      bytes of the database file to memory-map
+    SQLITE_CACHE_SIZE     page cache size, negative values are KiB
+    SQLITE_TEMP_STORE     where temporary tables and indexes live
+"""
+
+from sqlalchemy import event
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def _choice(value, choices, name):
+    value = str(value).upper()
+    if value not in choices:
+        raise ValueError(
+            f"Invalid {name} {value!r}, expected one of {sorted(choices)}"
+        )
+    return value
+
+
+def connection_pragmas(config):
+    """
+    Builds the list of PRAGMA statements for the configured profile.
+
+    Args:
+        config (dict): The application configuration.
+
+    Returns:
+        list[str]: PRAGMA statements in the order they are applied.
+
+    Raises:
+        ValueError: If a setting has an invalid value.
+    """
+    # auto_vacuum only takes effect on a database without tables (or after a
+    # VACUUM), so for new databases the free pages left behind by deleted
+    # rows can be returned with `PRAGMA incremental_vacuum`.
+    pragmas = ["PRAGMA auto_vacuum=INCREMENTAL"]
+
+    journal_mode = config.get("SQLITE_JOURNAL_MODE")
+    if journal_mode:
+        pragmas.append(
+            "PRAGMA journal_mode="
+            + _choice(journal_mode, JOURNAL_MODES, "SQLITE_JOURNAL_MODE")
+        )
+    synchronous = config.get("SQLITE_SYNCHRONOUS")
+    if synchronous:
+        pragmas.append(
+            "PRAGMA synchronous="
+            + _choice(synchronous, SYNCHRONOUS_MODES, "SQLITE_SYNCHRONOUS")
+        )
+    temp_store = config.get("SQLITE_TEMP_STORE")
+    if temp_store:
+        pragmas.append(
+            "PRAGMA temp_store="
+            + _choice(temp_store, TEMP_STORES, "SQLITE_TEMP_STORE")
+        )
+    for name, key in (
+        ("busy_timeout", "SQLITE_BUSY_TIMEOUT"),
+        ("mmap_size", "SQLITE_MMAP_SIZE"),
+        ("cache_size", "SQLITE_CACHE_SIZE"),
+    ):
+        value = config.get(key)
+        if value is not None:
+            pragmas.append(f"PRAGMA {name}={int(value)}")
+    return pragmas
+
+
+def pragma_listener(pragmas):
+    """
+    Returns a `connect` event listener that applies `pragmas` to a freshly
+    opened SQLite connection.
+    """
+
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in pragmas:
+            cursor.execute(statement)
+        cursor.close()
+
+    return set_sqlite_pragmas
+
+
+def init_app(app, db):
+    """Registers the connect hook on the application's SQLite engine."""
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            event.listen(
+                db.engine,
+                "connect",
+                pragma_listener(connection_pragmas(app.config)),
+            )
@@ -0,0 +1,142 @@
+"""
+Measures the full-text search index on a synthetic database.
+
+A temporary SQLite database is filled with `--items` feed items whose
+titles and summaries are drawn from a fixed vocabulary, the index is rebuilt
+the way `flask search rebuild` does it, and then common, rare and prefix
+queries are run through `app.search.search_items`, including `--pages` pages
+of cursor pagination.
+
+Usage:
+    python benchmarks/fts_search.py [--items N] [--pages P]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+from config import Config  # noqa: E402
+from app import db  # noqa: E402
+from app.models import Feed, FeedItem, User  # noqa: E402
+from app.search import rebuild_index, search_items  # noqa: E402
+from app.utils.sqlite import connection_pragmas, pragma_listener  # noqa
+
+FEEDS = 50
+PAGE_SIZE = 20
+WORDS = [f"word{i}" for i in range(5000)]
+QUERIES = ["word1", "word1 word2", "word4999", "word12*", "nomatch"]
+
+
+def make_app(path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    db.init_app(app)
+    with app.app_context():
+        sqlite_config = {
+            key: getattr(Config, key)
+            for key in dir(Config)
+            if key.startswith("SQLITE_")
+        }
+        event.listen(
+            db.engine,
+            "connect",
+            pragma_listener(connection_pragmas(sqlite_config)),
+        )
+    return app
+
+
+def sentence(length):
+    # A skewed distribution, so low numbered words are common and high
+    # numbered words are rare.
+    return " ".join(
+        WORDS[min(int(random.expovariate(1 / 300)), len(WORDS) - 1)]
+        for _ in range(length)
+    )
+
+
+def ingest(items, batch):
+    connection = db.session.connection()
+    user_id = connection.execute(
+        insert(User.__table__).values(username="bench", password="x")
+    ).inserted_primary_key[0]
+    feed_ids = [
+        connection.execute(
+            insert(Feed.__table__).values(
+                user_id=user_id, url=f"https://example.com/feed/{i}"
+            )
+        ).inserted_primary_key[0]
+        for i in range(FEEDS)
+    ]
+    now = datetime.now()
+    for start in range(0, items, batch):
+        connection.execute(
+            insert(FeedItem.__table__),
+            [
+                {
+                    "feed_id": random.choice(feed_ids),
+                    "title": sentence(8),
+                    "link": f"https://example.com/item/{i}",
+                    "summary": f"<p>{sentence(60)}</p>",
+                    "pub_date": now - timedelta(minutes=i),
+                    "read": False,
+                    "favourite": False,
+                }
+                for i in range(start, min(start + batch, items))
+            ],
+        )
+    db.session.commit()
+    return user_id
+
+
+def timed(function, *args, **kwargs):
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = make_app(os.path.join(directory, "bench.db"))
+        with app.app_context():
+            db.create_all()
+            user_id, seconds = timed(ingest, args.items, args.batch)
+            print(f"ingest   {args.items / seconds:9.0f} items/s")
+
+            with db.engine.begin() as connection:
+                indexed, seconds = timed(rebuild_index, connection)
+            print(f"rebuild  {indexed / seconds:9.0f} items/s")
+
+            for query in QUERIES:
+                (rows, cursor), seconds = timed(
+                    search_items, user_id, query, limit=PAGE_SIZE
+                )
+                pages = 1
+                started = time.perf_counter()
+                while cursor and pages < args.pages:
+                    rows, cursor = search_items(
+                        user_id, query, limit=PAGE_SIZE, cursor=cursor
+                    )
+                    pages += 1
+                paging = (time.perf_counter() - started) / max(pages - 1, 1)
+                print(
+                    f"{query!r:16} first page {seconds * 1000:8.2f} ms  "
+                    f"next pages {paging * 1000:8.2f} ms/page"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Compares marking scrolled-past items as read one request at a time with the
+batch endpoint, written through and buffered by `app.read_state`.
+
+The application runs against a temporary SQLite database with one feed of
+`--items` unread items. Each run marks all of them as read, once with one
+POST /mark_as_read/<id> per item and once with a single POST
+/mark_as_read/batch, and resets them in between. Requests, statements on
+the main database and median time per run are reported; for the buffer
+also the flush that writes the changes afterwards.
+
+Usage:
+    python benchmarks/mark_as_read.py [--items N] [--runs R]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, update  # noqa: E402
+
+
+def populate(db, models, items):
+    user = models.User(username="bench", password="x")
+    db.session.add(user)
+    db.session.commit()
+    feed = models.Feed(
+        title="Bench", url="https://example.com/feed", user_id=user.id
+    )
+    db.session.add(feed)
+    db.session.commit()
+    now = datetime.now()
+    db.session.add_all(
+        models.FeedItem(
+            feed_id=feed.id,
+            title=f"Item {i}",
+            link=f"https://example.com/{i}",
+            pub_date=now - timedelta(minutes=i),
+        )
+        for i in range(items)
+    )
+    db.session.commit()
+    return user.id, [item.id for item in models.FeedItem.query.all()]
+
+
+def measure(db, run, runs, reset):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    timings = []
+    requests = 0
+    for _ in range(runs):
+        reset()
+        event.listen(db.engine, "before_cursor_execute", count)
+        started = time.perf_counter()
+        requests += run()
+        timings.append(time.perf_counter() - started)
+        event.remove(db.engine, "before_cursor_execute", count)
+    return (
+        requests // runs,
+        len(statements) // runs,
+        statistics.median(timings),
+    )
+
+
+def one_by_one(client, item_ids):
+    for item_id in item_ids:
+        client.post(f"/mark_as_read/{item_id}")
+    return len(item_ids)
+
+
+def batch(client, item_ids):
+    client.post("/mark_as_read/batch", json={"ids": item_ids})
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The testing config reads its database URL at import time.
+        os.environ["TEST_DATABASE_URL"] = (
+            f"sqlite:///{os.path.join(directory, 'mark_as_read.db')}"
+        )
+        from app import create_app, db, models, read_state
+        from app.feed_counters import recount
+
+        app = create_app("testing")
+        with app.app_context():
+            db.create_all()
+            user_id, item_ids = populate(db, models, args.items)
+            client = app.test_client()
+            with client.session_transaction() as session:
+                session["_user_id"] = str(user_id)
+
+            def reset():
+                db.session.execute(update(models.FeedItem).values(read=False))
+                recount(db.session.connection())
+                db.session.commit()
+
+            # The buffer only flushes when asked to.
+            buffered = read_state.ReadStateBuffer(
+                app,
+                read_state.Journal(os.path.join(directory, "journal.db")),
+                interval=3600,
+                max_items=args.items + 1,
+            )
+            print(f"{args.items} items, median of {args.runs} runs")
+            for mode, buffer in (
+                ("write-through", read_state.ReadStateBuffer(app)),
+                ("buffered", buffered),
+            ):
+                app.extensions["read_state"] = buffer
+                for name, send in (
+                    ("one by one", one_by_one),
+                    ("batch", batch),
+                ):
+                    requests, statements, seconds = measure(
+                        db,
+                        lambda: send(client, item_ids),
+                        args.runs,
+                        reset,
+                    )
+                    print(
+                        f"{mode:13} {name:10} {requests:5} requests "
+                        f"{statements:6} statements {seconds * 1e3:9.1f} ms"
+                    )
+
+            def fill():
+                reset()
+                one_by_one(client, item_ids)
+
+            _, statements, seconds = measure(
+                db, lambda: buffered.flush() and 0, args.runs, fill
+            )
+            print(
+                f"{'buffered':13} {'flush':10} {0:5} requests "
+                f"{statements:6} statements {seconds * 1e3:9.1f} ms"
+            )
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
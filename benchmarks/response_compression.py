@@ -0,0 +1,109 @@
+"""
+Measures response compression on a typical page of feed items.
+
+A page of `--page-size` items with summaries shaped like feed HTML (see
+`summary_compression.py`) is served as JSON through a Flask app with
+`app.utils.http_compression` registered, once per encoding the client can
+ask for. For each encoding the transferred size, the server time per
+response and the estimated time to last byte on a few link speeds are
+reported; the estimate is server time plus transfer time.
+
+Usage:
+    python benchmarks/response_compression.py [--page-size N] [--runs R]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify  # noqa: E402
+from config import Config  # noqa: E402
+from app.utils import http_compression  # noqa: E402
+from summary_compression import summary  # noqa: E402
+
+LINKS_MBIT = (2, 10, 50)
+
+
+def make_page(size):
+    return [
+        {
+            "id": 100000 - i,
+            "title": f"Item {i} of a typical feed with a longer headline",
+            "link": f"https://example.com/articles/{random.randint(0, 10**6)}",
+            "summary": summary(),
+            "excerpt": None,
+            "first_image": None,
+            "word_count": None,
+            "pub_date": "2024-05-01T12:00:00+02:00",
+            "creator": "Jane Doe",
+            "read": False,
+            "favourite": False,
+            "feed_id": 7,
+            "feed_title": "Example Feed",
+        }
+        for i in range(size)
+    ]
+
+
+def make_app(page):
+    app = Flask(__name__)
+    for key in dir(Config):
+        if key.startswith("COMPRESS_"):
+            app.config[key] = getattr(Config, key)
+    http_compression.init_app(app)
+
+    @app.route("/items")
+    def items():
+        return jsonify({"items": page, "next_cursor": None})
+
+    return app
+
+
+def measure(client, accept_encoding, runs):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = client.get("/items", headers=headers)
+        timings.append(time.perf_counter() - started)
+    return len(response.data), statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(1)
+    client = make_app(make_page(args.page_size)).test_client()
+    encodings = [None] + http_compression.available(["gzip", "br"])
+
+    results = {
+        encoding: measure(client, encoding, args.runs)
+        for encoding in encodings
+    }
+    identity_size, identity_time = results[None]
+    print(f"Page of {args.page_size} items, median of {args.runs} requests")
+    print(
+        f"{'encoding':9} {'bytes':>9} {'saved':>7} {'server':>9}  "
+        + "  ".join(f"{f'TTLB@{mbit}Mbit':>13}" for mbit in LINKS_MBIT)
+    )
+    for encoding, (size, seconds) in results.items():
+        ttlb = [seconds + size * 8 / (mbit * 1e6) for mbit in LINKS_MBIT]
+        print(
+            f"{encoding or 'identity':9} {size:9} "
+            f"{1 - size / identity_size:7.1%} {seconds * 1e3:7.2f}ms  "
+            + "  ".join(f"{t * 1e3:11.1f}ms" for t in ttlb)
+        )
+    if http_compression.brotli is None:
+        print("br skipped, install `brotli` to compare it")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Compares the sidebar (categories_and_blogs) queries before and after they
+were merged into one.
+
+A temporary SQLite database gets `--categories` categories and `--feeds`
+feeds with unread counters for one user, plus the same again for a second
+user. The old per-category loop and `app.api.v1.api_info.sidebar` then
+build the sidebar `--runs` times each; queries and median time per build
+are reported, and for the memoized endpoint the time of a memo hit.
+
+Usage:
+    python benchmarks/sidebar_query.py [--categories C] [--feeds F]
+        [--runs R]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+from sqlalchemy import event, insert, select  # noqa: E402
+from app import db  # noqa: E402
+from app.api.v1.api_info import sidebar  # noqa: E402
+from app.models import Category, Feed, FeedCounter, User  # noqa: E402
+from app.utils.http_cache import VersionedMemo  # noqa: E402
+
+
+def make_app(path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    db.init_app(app)
+    return app
+
+
+def populate(connection, categories, feeds):
+    user_ids = []
+    for n in range(2):
+        user_id = connection.execute(
+            insert(User.__table__).values(username=f"bench{n}", password="x")
+        ).inserted_primary_key[0]
+        category_ids = [
+            connection.execute(
+                insert(Category.__table__).values(
+                    name=f"Category {i}", user_id=user_id
+                )
+            ).inserted_primary_key[0]
+            for i in range(categories)
+        ]
+        for i in range(feeds):
+            feed_id = connection.execute(
+                insert(Feed.__table__).values(
+                    title=f"Feed {i}",
+                    url=f"https://example.com/{n}/{i}",
+                    user_id=user_id,
+                    category_id=random.choice(category_ids),
+                    daily_enabled=True,
+                )
+            ).inserted_primary_key[0]
+            connection.execute(
+                insert(FeedCounter.__table__).values(
+                    feed_id=feed_id, unread=random.randint(0, 50), total=100
+                )
+            )
+        user_ids.append(user_id)
+    return user_ids[0]
+
+
+def legacy_sidebar(user_id):
+    """The per-category loop the endpoint used before."""
+    categories = Category.query.all()
+    data = []
+    unread_counts = dict(
+        db.session.execute(
+            select(FeedCounter.feed_id, FeedCounter.unread)
+            .join(Feed, Feed.id == FeedCounter.feed_id)
+            .where(Feed.user_id == user_id)
+        ).all()
+    )
+    for cat in categories:
+        feeds = Feed.query.filter_by(category_id=cat.id).all()
+        data.append(
+            {
+                "id": cat.id,
+                "name": cat.name,
+                "feeds": [
+                    {
+                        "feed": feed.to_dict(),
+                        "unread_count": unread_counts.get(feed.id, 0),
+                    }
+                    for feed in feeds
+                ],
+            }
+        )
+    return data
+
+
+def measure(build, user_id, runs):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    timings = []
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        for _ in range(runs):
+            db.session.expunge_all()
+            started = time.perf_counter()
+            build(user_id)
+            timings.append(time.perf_counter() - started)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    return len(statements) // runs, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--feeds", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as directory:
+        app = make_app(os.path.join(directory, "sidebar.db"))
+        with app.app_context():
+            db.create_all()
+            with db.engine.begin() as connection:
+                user_id = populate(connection, args.categories, args.feeds)
+
+            print(
+                f"{args.categories} categories and {args.feeds} feeds per "
+                f"user, 2 users, median of {args.runs} builds"
+            )
+            memo = VersionedMemo()
+            for name, build in (
+                ("per category", legacy_sidebar),
+                ("single query", sidebar),
+                (
+                    "memo hit",
+                    lambda user_id: memo.get(
+                        user_id, lambda: sidebar(user_id), 60
+                    ),
+                ),
+            ):
+                queries, seconds = measure(build, user_id, args.runs)
+                print(
+                    f"{name:13} {queries:5} queries  "
+                    f"{seconds * 1e3:9.3f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Measures listing query latency while a background writer ingests items,
+once with SQLite's default connection settings and once with the profile
+from `config.Config` (WAL, synchronous=NORMAL, busy_timeout, mmap, cache).
+
+Usage:
+    python benchmarks/sqlite_concurrency.py [--items N] [--seconds S]
+        [--readers R] [--batch B]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert, select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from config import Config  # noqa: E402
+from app import db  # noqa: E402
+from app.models import Feed, FeedItem, User  # noqa: E402
+from app.utils.sqlite import connection_pragmas, pragma_listener  # noqa: E402
+
+PROFILES = {
+    "default": {},
+    "tuned": {
+        key: getattr(Config, key)
+        for key in dir(Config)
+        if key.startswith("SQLITE_")
+    },
+}
+
+
+def item_rows(feed_id, count, start):
+    now = datetime.now()
+    return [
+        {
+            "feed_id": feed_id,
+            "title": f"Item {start + i}",
+            "link": f"https://example.com/{start + i}",
+            "summary": "<p>" + "lorem ipsum " * 80 + "</p>",
+            "pub_date": now - timedelta(minutes=random.randint(0, 10**6)),
+            "read": random.random() < 0.5,
+            "favourite": False,
+        }
+        for i in range(count)
+    ]
+
+
+def make_engine(path, profile):
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(
+        engine, "connect", pragma_listener(connection_pragmas(profile))
+    )
+    return engine
+
+
+def seed(engine, items):
+    db.metadata.create_all(engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(
+            insert(User.__table__).values(username="bench", password="x")
+        ).inserted_primary_key[0]
+        feed_id = connection.execute(
+            insert(Feed.__table__).values(
+                user_id=user_id, url="https://example.com/feed"
+            )
+        ).inserted_primary_key[0]
+        for start in range(0, items, 5000):
+            connection.execute(
+                insert(FeedItem.__table__),
+                item_rows(feed_id, min(5000, items - start), start),
+            )
+    return feed_id
+
+
+def run_profile(name, profile, args):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(os.path.join(directory, "bench.db"), profile)
+        feed_id = seed(engine, args.items)
+        stop = threading.Event()
+        latencies = []
+        stats = {"reads": 0, "read_errors": 0, "writes": 0, "write_errors": 0}
+        lock = threading.Lock()
+        listing = (
+            select(FeedItem.id, FeedItem.title, FeedItem.pub_date)
+            .where(FeedItem.feed_id == feed_id, FeedItem.read.is_(False))
+            .order_by(FeedItem.pub_date.desc(), FeedItem.id.desc())
+            .limit(50)
+        )
+
+        def reader():
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    with engine.connect() as connection:
+                        connection.execute(listing).all()
+                except OperationalError:
+                    with lock:
+                        stats["read_errors"] += 1
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+                    stats["reads"] += 1
+
+        def writer():
+            start = args.items
+            while not stop.is_set():
+                try:
+                    with engine.begin() as connection:
+                        connection.execute(
+                            insert(FeedItem.__table__),
+                            item_rows(feed_id, args.batch, start),
+                        )
+                    start += args.batch
+                    stats["writes"] += args.batch
+                except OperationalError:
+                    stats["write_errors"] += 1
+
+        threads = [threading.Thread(target=writer)] + [
+            threading.Thread(target=reader) for _ in range(args.readers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    latencies.sort()
+
+    def percentile(p):
+        return (
+            latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+        )
+
+    print(
+        f"{name:8} reads/s {stats['reads'] / args.seconds:8.0f}  "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms  "
+        f"p95 {percentile(0.95):7.2f} ms  "
+        f"p99 {percentile(0.99):7.2f} ms  "
+        f"max {latencies[-1] * 1000:8.2f} ms  "
+        f"read errors {stats['read_errors']}  "
+        f"ingested/s {stats['writes'] / args.seconds:8.0f}  "
+        f"write errors {stats['write_errors']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=200)
+    args = parser.parse_args()
+
+    for name, profile in PROFILES.items():
+        run_profile(name, profile, args)
+
+
+if __name__ == "__main__":
+    main()
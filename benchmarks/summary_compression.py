@@ -0,0 +1,152 @@
+"""
+Compares database size and read performance with and without compressed
+summaries.
+
+For every codec a temporary SQLite database is filled with `--items` feed
+items whose summaries look like typical feed HTML (paragraphs, links,
+images, 0.5-8 KiB), then `--reads` random items are loaded through the ORM
+column type the way the listings load them, with a page cache of
+`--cache-kib` KiB so most reads have to go to the file.
+
+Usage:
+    python benchmarks/summary_compression.py [--items N] [--reads R]
+        [--cache-kib K]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert, select  # noqa: E402
+from app import db  # noqa: E402
+from app.models import Feed, FeedItem, User  # noqa: E402
+from app.utils import compression  # noqa: E402
+
+WORDS = (
+    "the of and to in is that for it as was with be by on not he this are "
+    "or his from at which but have an they you were her she there been one "
+    "all we their has would when if so no will more out up into do any "
+    "about what can said who them some could him time than other new two "
+    "may only most over also after did many before must through back years "
+    "where much your way well down should because each just those people "
+    "government company market report data users update release security"
+).split()
+
+
+def paragraph():
+    words = [random.choice(WORDS) for _ in range(random.randint(30, 120))]
+    if random.random() < 0.3:
+        i = random.randrange(len(words))
+        words[i] = (
+            f'<a href="https://example.com/{random.randint(0, 10**6)}">'
+            f"{words[i]}</a>"
+        )
+    return "<p>" + " ".join(words).capitalize() + ".</p>"
+
+
+def summary():
+    html = ""
+    if random.random() < 0.6:
+        html += (
+            f'<img src="https://cdn.example.com/img/'
+            f'{random.randint(0, 10**9)}.jpg" alt="">'
+        )
+    target = random.randint(512, 8192)
+    while len(html) < target:
+        html += paragraph()
+    return html
+
+
+def make_engine(path, cache_kib):
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def set_cache(dbapi_connection, connection_record):
+        dbapi_connection.execute(f"PRAGMA cache_size=-{cache_kib}")
+        dbapi_connection.execute("PRAGMA mmap_size=0")
+
+    return engine
+
+
+def ingest(engine, summaries, batch=500):
+    db.metadata.create_all(engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(
+            insert(User.__table__).values(username="bench", password="x")
+        ).inserted_primary_key[0]
+        feed_id = connection.execute(
+            insert(Feed.__table__).values(
+                user_id=user_id, url="https://example.com/feed"
+            )
+        ).inserted_primary_key[0]
+        for start in range(0, len(summaries), batch):
+            connection.execute(
+                insert(FeedItem.__table__),
+                [
+                    {
+                        "feed_id": feed_id,
+                        "title": f"Item {i}",
+                        "link": f"https://example.com/item/{i}",
+                        "summary": summaries[i],
+                        "read": False,
+                        "favourite": False,
+                    }
+                    for i in range(start, min(start + batch, len(summaries)))
+                ],
+            )
+
+
+def random_reads(engine, items, reads):
+    ids = [random.randint(1, items) for _ in range(reads)]
+    started = time.perf_counter()
+    with engine.connect() as connection:
+        for item_id in ids:
+            connection.execute(
+                select(FeedItem.summary).where(FeedItem.id == item_id)
+            ).scalar()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--cache-kib", type=int, default=2048)
+    args = parser.parse_args()
+
+    random.seed(1)
+    summaries = [summary() for _ in range(args.items)]
+    raw_bytes = sum(len(s.encode("utf-8")) for s in summaries)
+    print(f"{args.items} summaries, {raw_bytes / 2**20:.1f} MiB of HTML")
+
+    codecs = ["none", "zlib"] + (["zstd"] if compression.zstandard else [])
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in codecs:
+            compression.configure(codec)
+            path = os.path.join(directory, f"{codec}.db")
+            engine = make_engine(path, args.cache_kib)
+            ingest(engine, summaries)
+            with engine.connect() as connection:
+                page_size = connection.exec_driver_sql(
+                    "PRAGMA page_size"
+                ).scalar()
+                pages = connection.exec_driver_sql(
+                    "PRAGMA page_count"
+                ).scalar()
+            seconds = random_reads(engine, args.items, args.reads)
+            cache_share = min(1.0, args.cache_kib * 1024 / (pages * page_size))
+            print(
+                f"{codec:5} size {os.path.getsize(path) / 2**20:8.1f} MiB  "
+                f"pages {pages:8}  cache covers {cache_share:6.1%}  "
+                f"random read {seconds / args.reads * 1e6:7.1f} us/item"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
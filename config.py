@@ -3,24 +3,108 @@ from datetime import timedelta
 from app.utils.secret_key import secret_key
 
 
+def database_uri(uri):
+    """
+    Normalizes a database URI. PostgreSQL URIs use the psycopg (3) driver,
+    including the `postgres://` form many hosting providers hand out.
+    """
+    for prefix in ("postgres://", "postgresql://"):
+        if uri.startswith(prefix):
+            return "postgresql+psycopg://" + uri[len(prefix) :]
+    return uri
+
+
+def engine_options(uri):
+    """
+    Returns the SQLAlchemy engine options for `uri`. Connection pooling for
+    server databases is tuned with the DB_POOL_* environment variables;
+    SQLite keeps SQLAlchemy's defaults.
+    """
+    if uri.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", 10)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_pre_ping": True,
+    }
+
+
 class Config:
     SECRET_KEY = secret_key()
-    SQLALCHEMY_DATABASE_URI = "sqlite:///main.db"
+    SQLALCHEMY_DATABASE_URI = database_uri(
+        os.getenv("DATABASE_URL", "sqlite:///main.db")
+    )
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", 5000))
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", -64 * 1024))
+    SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
     FLASK_HOST = os.getenv("FLASK_RUN_HOST", "0.0.0.0")
     FLASK_PORT = int(os.getenv("FLASK_RUN_PORT", 8000))
     LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
     LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
     FLASK_DEBUG = os.getenv("FLASK_DEBUG", "False")
+    REFRESH_MIN_INTERVAL = int(os.getenv("REFRESH_MIN_INTERVAL", 60))
+    FEED_SCHEDULER_TICK = int(os.getenv("FEED_SCHEDULER_TICK", 60))
+    FEED_SCHEDULER_JITTER = int(os.getenv("FEED_SCHEDULER_JITTER", 30))
+    CLEANER_CHUNK_SIZE = int(os.getenv("CLEANER_CHUNK_SIZE", 500))
+    CLEANER_INTERVAL_MINUTES = int(os.getenv("CLEANER_INTERVAL_MINUTES", 10))
+    CLEANER_TIME_BUDGET = float(os.getenv("CLEANER_TIME_BUDGET", 2.0))
+    CLEANER_ROW_BUDGET = int(os.getenv("CLEANER_ROW_BUDGET", 5000))
+    CLEANER_MAX_CHUNK_SECONDS = float(
+        os.getenv("CLEANER_MAX_CHUNK_SECONDS", 0.5)
+    )
+    CLEANER_BUSY_LATENCY = float(os.getenv("CLEANER_BUSY_LATENCY", 1.0))
+    MAINTENANCE_INTERVAL_MINUTES = int(
+        os.getenv("MAINTENANCE_INTERVAL_MINUTES", 60)
+    )
+    MAINTENANCE_VACUUM_PAGES = int(os.getenv("MAINTENANCE_VACUUM_PAGES", 1000))
+    MAINTENANCE_ANALYZE_HOURS = int(os.getenv("MAINTENANCE_ANALYZE_HOURS", 24))
+    ARCHIVE_DIR = os.getenv("ARCHIVE_DIR")
+    SUMMARY_COMPRESSION = os.getenv("SUMMARY_COMPRESSION", "zlib")
+    SETTINGS_CACHE_TTL = int(os.getenv("SETTINGS_CACHE_TTL", 300))
+    SIDEBAR_CACHE_TTL = int(os.getenv("SIDEBAR_CACHE_TTL", 10))
+    EVENTS_KEEPALIVE = int(os.getenv("EVENTS_KEEPALIVE", 15))
+    # Every open event stream holds one of the WAITRESS_THREADS.
+    EVENTS_MAX_STREAMS = int(os.getenv("EVENTS_MAX_STREAMS", 4))
+    WAITRESS_THREADS = int(os.getenv("WAITRESS_THREADS", 8))
+    # 0 writes read state changes through instead of buffering them.
+    READ_STATE_FLUSH_MS = int(os.getenv("READ_STATE_FLUSH_MS", 500))
+    READ_STATE_FLUSH_ITEMS = int(os.getenv("READ_STATE_FLUSH_ITEMS", 200))
+    # Defaults to read_state_journal.db in the instance folder.
+    READ_STATE_JOURNAL = os.getenv("READ_STATE_JOURNAL")
+    COMPRESS_ALGORITHMS = os.getenv("COMPRESS_ALGORITHMS", "br,gzip")
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    COMPRESS_MIMETYPES = os.getenv(
+        "COMPRESS_MIMETYPES",
+        "application/json,text/html,text/css,text/javascript,"
+        "application/javascript,text/plain,image/svg+xml",
+    ).split(",")
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 4))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", 4))
+    COUNTER_RECONCILE_MINUTES = int(os.getenv("COUNTER_RECONCILE_MINUTES", 60))
+    DAILY_RETENTION_DAYS = int(os.getenv("DAILY_RETENTION_DAYS", 90))
+    DAILY_ORPHAN_GRACE_MINUTES = int(
+        os.getenv("DAILY_ORPHAN_GRACE_MINUTES", 60)
+    )
 
 
 class TestingConfig(Config):
     TESTING = True
     FLASK_HOST = "localhost"
     FLASK_PORT = 5000
-    SQLALCHEMY_DATABASE_URI = "sqlite:///test.db"
+    SQLALCHEMY_DATABASE_URI = database_uri(
+        os.getenv("TEST_DATABASE_URL", "sqlite:///test.db")
+    )
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = "default_secret_key"
     LOG_LEVEL = "DEBUG"
     LOG_FILE = "logs/debug_app.log"
+    READ_STATE_FLUSH_MS = 0
@@ -20,6 +20,16 @@ def app():
         db.drop_all()
 
 
+@pytest.fixture
+def sqlite_only(app):
+    """
+    Skips a test when the suite runs against a server database, see
+    TEST_DATABASE_URL.
+    """
+    if db.engine.dialect.name != "sqlite":
+        pytest.skip("SQLite specific test")
+
+
 @pytest.fixture
 def client(app):
     print("Setting up the client fixture")
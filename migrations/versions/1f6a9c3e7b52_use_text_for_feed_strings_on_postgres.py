@@ -0,0 +1,51 @@
+"""use TEXT for feed strings on PostgreSQL
+
+Revision ID: 1f6a9c3e7b52
+Revises: e83b6d40a1f5
+Create Date: 2026-10-19 13:40:08.127554
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1f6a9c3e7b52'
+down_revision = 'e83b6d40a1f5'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ('feed', 'title', 200),
+    ('feed', 'url', 200),
+    ('feed_item', 'title', 200),
+    ('feed_item', 'link', 200),
+    ('feed_item', 'creator', 200),
+    ('feed_item', 'guid', 500),
+]
+
+
+def upgrade():
+    # SQLite does not enforce VARCHAR lengths, only server databases need
+    # the wider type.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, length in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=length),
+            type_=sa.Text(),
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, length in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Text(),
+            type_=sa.String(length=length),
+        )
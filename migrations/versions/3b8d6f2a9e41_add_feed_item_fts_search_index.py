@@ -0,0 +1,74 @@
+"""add feed_item_fts search index
+
+Revision ID: 3b8d6f2a9e41
+Revises: 5e7f1a9b2c84
+Create Date: 2026-10-19 17:02:45.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from bs4 import BeautifulSoup
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8d6f2a9e41'
+down_revision = '5e7f1a9b2c84'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    # FTS5 is SQLite specific, other databases have no search index.
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS feed_item_fts USING fts5("
+        "title, creator, body, tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS feed_item_fts_delete "
+        "AFTER DELETE ON feed_item BEGIN "
+        "DELETE FROM feed_item_fts WHERE rowid = old.id; END"
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, title, creator, summary FROM feed_item "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(
+                "INSERT INTO feed_item_fts (rowid, title, creator, body) "
+                "VALUES (:id, :title, :creator, :body)"
+            ),
+            [
+                {
+                    'id': item_id,
+                    'title': title or '',
+                    'creator': creator or '',
+                    'body': BeautifulSoup(
+                        summary or '', 'html.parser'
+                    ).get_text(' ', strip=True),
+                }
+                for item_id, title, creator, summary in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS feed_item_fts_delete")
+    op.execute("DROP TABLE IF EXISTS feed_item_fts")
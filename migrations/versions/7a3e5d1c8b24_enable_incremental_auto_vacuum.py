@@ -0,0 +1,34 @@
+"""enable incremental auto_vacuum
+
+Revision ID: 7a3e5d1c8b24
+Revises: 4b1f7c2d9e10
+Create Date: 2026-10-19 10:03:17.482911
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a3e5d1c8b24'
+down_revision = '4b1f7c2d9e10'
+branch_labels = None
+depends_on = None
+
+
+def set_auto_vacuum(mode):
+    # auto_vacuum can only be changed on an existing database by rebuilding
+    # the file with VACUUM, which is not allowed inside a transaction.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    with op.get_context().autocommit_block():
+        op.execute(f"PRAGMA auto_vacuum={mode}")
+        op.execute("VACUUM")
+
+
+def upgrade():
+    set_auto_vacuum("INCREMENTAL")
+
+
+def downgrade():
+    set_auto_vacuum("NONE")
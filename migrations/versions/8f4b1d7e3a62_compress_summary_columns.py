@@ -0,0 +1,95 @@
+"""compress summary columns
+
+Revision ID: 8f4b1d7e3a62
+Revises: 6c2e9a4d7f15
+Create Date: 2026-10-19 19:41:33.904518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.compression import compress, decompress
+
+
+# revision identifiers, used by Alembic.
+revision = '8f4b1d7e3a62'
+down_revision = '6c2e9a4d7f15'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+COLUMNS = [
+    ('feed_item', 'summary'),
+    ('feed_item', 'plain_text'),
+    ('summarized_article', 'summary'),
+]
+
+
+def rewrite(table, column, encode):
+    """Re-encodes every non-NULL value of a column, in batches."""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                f"SELECT id, {column} FROM {table} "
+                f"WHERE id > :last_id AND {column} IS NOT NULL "
+                f"ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(f"UPDATE {table} SET {column} = :value WHERE id = :id"),
+            [{'id': row_id, 'value': encode(value)} for row_id, value in rows],
+        )
+        last_id = rows[-1][0]
+
+
+def recreate_search_trigger():
+    # Recreating feed_item in batch mode drops the search index trigger.
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS feed_item_fts_delete "
+            "AFTER DELETE ON feed_item BEGIN "
+            "DELETE FROM feed_item_fts WHERE rowid = old.id; END"
+        )
+
+
+def upgrade():
+    # Existing values become UTF-8 bytes (SQLite casts them during the
+    # batch copy) and are then compressed with SUMMARY_COMPRESSION.
+    for table, column in COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Text(),
+                type_=sa.LargeBinary(),
+                postgresql_using=f"convert_to({column}, 'UTF8')",
+            )
+        rewrite(
+            table,
+            column,
+            lambda value: compress(
+                bytes(value).decode('utf-8')
+                if not isinstance(value, str)
+                else value
+            ),
+        )
+    recreate_search_trigger()
+
+
+def downgrade():
+    for table, column in COLUMNS:
+        rewrite(
+            table, column, lambda value: decompress(value).encode('utf-8')
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.LargeBinary(),
+                type_=sa.Text(),
+                postgresql_using=f"convert_from({column}, 'UTF8')",
+            )
+    recreate_search_trigger()
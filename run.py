@@ -2,7 +2,7 @@ import os
 from threading import Thread, Lock
 from flask import send_from_directory
 from waitress import serve
-from app import create_app, db
+from app import create_app, db, read_state
 from app.models import Category, User
 from app.background_worker import run_scheduler
 
@@ -49,6 +49,8 @@ if __name__ == "__main__":
                 db.session.add(category)
                 db.session.commit()
 
+    read_state.start(app)
+
     if os.getenv("ENV"):
         if os.getenv("ENV") == "DEV":
             app.run(debug=True, port=8000, host="0.0.0.0", use_reloader=False)
@@ -57,4 +59,5 @@ if __name__ == "__main__":
             app,
             host=app.config["FLASK_HOST"],
             port=app.config["FLASK_PORT"],
+            threads=app.config["WAITRESS_THREADS"],
         )
@@ -2,7 +2,7 @@ import { showMessage } from './utils/messages';
 import { checkUnreadCount } from './unreadCount';
 
 let isLoading = false;
-let lastItemId = null;
+let nextCursor = null;
 let loadedItems = new Set();
 let currentUrl = null;
 let displayEOF = true;
@@ -13,7 +13,7 @@ const dailyContainer = document.getElementById('daily-container');
 
 function resetConstants() {
     isLoading = false;
-    lastItemId = null;
+    nextCursor = null;
     loadedItems = new Set();
     stopped = false;
 }
@@ -79,8 +79,8 @@ function fetchDailyData(url) {
         isLoading = true;
     }
 
-    if (lastItemId) {
-        url += `?last_item_id=${lastItemId}`;
+    if (nextCursor) {
+        url += `${url.includes('?') ? '&' : '?'}cursor=${encodeURIComponent(nextCursor)}`;
     }
 
     fetch(url)
@@ -96,8 +96,8 @@ function fetchDailyData(url) {
         });
 }
 
-function displayDailyData(data) {
-    data.forEach((item) => {
+function displayDailyData({ items, next_cursor }) {
+    items.forEach((item) => {
         if (loadedItems.has(item.id)) {
             return;
         }
@@ -120,13 +120,13 @@ function displayDailyData(data) {
         itemElement.innerHTML = dailyHTMLTemplate(item, formattedDate);
         dailyContainer.appendChild(itemElement);
     });
-    if (data.length > 0) {
-        lastItemId = data[data.length - 1].id;
+    if (next_cursor) {
+        nextCursor = next_cursor;
     } else {
         stopped = true;
         console.log('No more items');
     }
-    if (data.length < 3 && displayEOF) {
+    if (items.length < 3 && displayEOF) {
         const noDataMessage = document.createElement('div');
         noDataMessage.innerHTML = noMoreItemsTemplate();
         dailyContainer.appendChild(noDataMessage);
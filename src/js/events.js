@@ -0,0 +1,45 @@
+import { setLiveUpdates, updateFeedListData, fetchLastSync } from './feedList';
+import { checkUnreadCount, setBadgePolling } from './unreadCount';
+import { showMessage } from './utils/messages';
+
+// A feed update commits its items one by one, so events arrive in bursts.
+const REFRESH_DELAY = 1000;
+
+let refreshTimer = null;
+
+function scheduleRefresh() {
+    if (refreshTimer !== null) return;
+    refreshTimer = setTimeout(() => {
+        refreshTimer = null;
+        updateFeedListData();
+        checkUnreadCount();
+    }, REFRESH_DELAY);
+}
+
+function setLive(enabled) {
+    setLiveUpdates(enabled);
+    setBadgePolling(!enabled);
+}
+
+/**
+ * Subscribes to the server's live events and stops polling while the stream
+ * is open. Polling takes over again while the browser reconnects, and for
+ * good if the server refused the stream.
+ */
+export function initLiveEvents() {
+    if (!('EventSource' in window)) return;
+
+    const source = new EventSource('/api/events');
+    source.addEventListener('open', () => {
+        setLive(true);
+        // Changes made while disconnected were not sent.
+        scheduleRefresh();
+    });
+    source.addEventListener('error', () => setLive(false));
+
+    source.addEventListener('unread', scheduleRefresh);
+    source.addEventListener('items', scheduleRefresh);
+    source.addEventListener('resync', scheduleRefresh);
+    source.addEventListener('last_sync', fetchLastSync);
+    source.addEventListener('daily', () => showMessage('Daily has been updated', 'success'));
+}
@@ -3,13 +3,17 @@ import { fetchCategoriesAndBlogs } from './feedList';
 import { checkUnreadCount } from './unreadCount';
 
 let loading = false;
-let lastItemId = null;
+let nextCursor = null;
 let EOF = false;
 const readPosts = new Set();
+// Posts scrolled past are sent in one request per burst of scrolling.
+const pendingReads = new Set();
+const MARK_READ_DELAY = 1000;
+let markReadTimer = null;
 
 export function reloadFeedList() {
   loading = false;
-  lastItemId = null;
+  nextCursor = null;
   EOF = false;
   readPosts.clear();
   document.getElementById('feed-container').innerHTML = '';
@@ -18,6 +22,7 @@ export function reloadFeedList() {
 
 export function feedListEventListeners() {
   window.addEventListener('scroll', handleScroll);
+  window.addEventListener('pagehide', flushReadPosts);
 }
 
 // Function to load items from the API and append them to the feed container
@@ -26,13 +31,13 @@ export function loadMoreItems() {
   if (loading) return;
   if (EOF) return;
   loading = true;
-  const apiPath = getApiPath(lastItemId);
+  const apiPath = getApiPath(nextCursor);
 
   fetch(apiPath)
     .then((response) => response.json())
-    .then((data) => {
-      if (data.length > 0) {
-        data.forEach((item) => {
+    .then(({ items, next_cursor }) => {
+      if (items.length > 0) {
+        items.forEach((item) => {
           const itemElement = document.createElement('div');
           itemElement.classList.add('feed-item', 'animate-itemShow');
           itemElement.dataset.read = item.read;
@@ -97,13 +102,14 @@ export function loadMoreItems() {
           handleOverflow(itemElement);
         });
 
-        lastItemId = data[data.length - 1].id;
+        nextCursor = next_cursor;
         loading = false;
       }
-      if (data.length === 1 || data.length === 2) {
+      if (items.length === 1 || items.length === 2) {
         emptyMessage(feedContainer);
         loading = false;
-      } else if (data.length === 0) {
+      }
+      if (!next_cursor) {
         emptyMessage(feedContainer);
         loading = false;
         EOF = true;
@@ -195,28 +201,49 @@ function checkPostsVisibility() {
 // Function to mark a post as read
 function markAsRead(postId) {
   if (!readPosts.has(postId)) {
-    fetch(`/mark_as_read/${postId}`, {
-      method: 'POST',
-      credentials: 'include',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    })
-      .then((response) => {
-        if (response.ok) {
-          readPosts.add(postId);
-          checkUnreadCount();
-          fetchCategoriesAndBlogs();
-        } else {
-          console.error('Error marking post as read:', response.statusText);
-        }
-      })
-      .catch((error) => {
-        console.error('Error marking post as read:', error);
-      });
+    readPosts.add(postId);
+    pendingReads.add(Number(postId));
+    if (markReadTimer === null) {
+      markReadTimer = setTimeout(flushReadPosts, MARK_READ_DELAY);
+    }
   }
 }
 
+// Function to send the pending read posts in one batch
+function flushReadPosts() {
+  clearTimeout(markReadTimer);
+  markReadTimer = null;
+  if (pendingReads.size === 0) {
+    return;
+  }
+  const ids = Array.from(pendingReads);
+  pendingReads.clear();
+
+  fetch('/mark_as_read/batch', {
+    method: 'POST',
+    credentials: 'include',
+    // Lets the request finish when the page is closed.
+    keepalive: true,
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ ids }),
+  })
+    .then((response) => {
+      if (response.ok) {
+        checkUnreadCount();
+        fetchCategoriesAndBlogs();
+      } else {
+        console.error('Error marking posts as read:', response.statusText);
+        ids.forEach((id) => readPosts.delete(String(id)));
+      }
+    })
+    .catch((error) => {
+      console.error('Error marking posts as read:', error);
+      ids.forEach((id) => readPosts.delete(String(id)));
+    });
+}
+
 function handleScroll() {
   const { scrollTop, scrollHeight, clientHeight } = document.documentElement;
   if (scrollTop + clientHeight >= scrollHeight * 0.7) {
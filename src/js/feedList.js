@@ -1,7 +1,13 @@
 import { showMessage } from './utils/messages';
 
+// With live events the sidebar is refetched on change, the slow interval
+// only keeps the relative last sync time current.
+const POLL_INTERVAL = 5000;
+const LIVE_INTERVAL = 60000;
+
 let pauseUpdate = false;
 let updateInterval = null;
+let liveUpdates = false;
 let currentFeedsSet = new Set();
 let currentLastSync = null;
 
@@ -34,7 +40,16 @@ export function resumeUpdates() {
     updateFeedListData();
 
     if (updateInterval === null) {
-        updateInterval = setInterval(updateFeedListData, 5000);
+        updateInterval = setInterval(updateFeedListData, liveUpdates ? LIVE_INTERVAL : POLL_INTERVAL);
+    }
+}
+
+export function setLiveUpdates(enabled) {
+    if (enabled === liveUpdates) return;
+    liveUpdates = enabled;
+    if (updateInterval !== null) {
+        clearInterval(updateInterval);
+        updateInterval = setInterval(updateFeedListData, liveUpdates ? LIVE_INTERVAL : POLL_INTERVAL);
     }
 }
 
@@ -135,7 +150,7 @@ export async function fetchCategoriesAndBlogs(clean = false) {
     }
 }
 
-async function fetchLastSync() {
+export async function fetchLastSync() {
     try {
         const response = await fetch('/api/last_sync');
         const data = await response.json();
@@ -243,7 +258,7 @@ export function initFeedListListeners() {
 }
 
 export function initSetInterval() {
-    updateInterval = setInterval(updateFeedListData, 5000);
+    updateInterval = setInterval(updateFeedListData, liveUpdates ? LIVE_INTERVAL : POLL_INTERVAL);
 }
 
 export async function updateFeedListData() {
@@ -9,6 +9,7 @@ import { getUserSettings, settingEventListeners as settingsEventListeners, safar
 import { fetchAndRenderCategories, initCategoryListeners } from './settingsManageCat';
 import { initDailySettings } from './settingsDaily';
 import { swipeToReload } from './utils/swipes';
+import { initLiveEvents } from './events';
 
 updateFeedListData();
 initFeedListListeners();
@@ -51,4 +52,5 @@ if (window.location.pathname.endsWith('settings/daily')) {
 
 initAddfeedModal();
 initBadgeUpdate();
+initLiveEvents();
 swipeToReload();
@@ -26,7 +26,16 @@ function updateBadge(count) {
     }
 }
 
+let badgeInterval = null;
+
+export function setBadgePolling(enabled) {
+    clearInterval(badgeInterval);
+    badgeInterval = enabled ? setInterval(checkUnreadCount, 60000 * 5) : null;
+}
+
 export function initBadgeUpdate() {
     checkUnreadCount();
-    setInterval(checkUnreadCount, 60000 * 5);
+    if (badgeInterval === null) {
+        setBadgePolling(true);
+    }
 }
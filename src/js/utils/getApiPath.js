@@ -1,6 +1,6 @@
 const limit = 5;
 
-export function getApiPath(lastItemId) {
+export function getApiPath(cursor) {
     const path = window.location.pathname;
     const basePath = '/api/feeditems';
     let apiPath = basePath;
@@ -23,5 +23,5 @@ export function getApiPath(lastItemId) {
         apiPath += '/all';
     }
 
-    return `${apiPath}?limit=${limit}${lastItemId ? `&last_item_id=${lastItemId}` : ''}`;
+    return `${apiPath}?limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`;
 }
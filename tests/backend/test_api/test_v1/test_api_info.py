@@ -1,6 +1,7 @@
 import pytest
 from flask import url_for
-from app import db
+from sqlalchemy import event
+from app import db, events
 from app.models import Category, Feed, FeedItem, User
 from datetime import datetime
 import pytz
@@ -12,7 +13,7 @@ def test_get_categories_and_blogs(client, auth, create_user):
 
     # Create test data
     with client.application.app_context():
-        category = Category(name="Test Category")
+        category = Category(name="Test Category", user_id=create_user.id)
         db.session.add(category)
         db.session.commit()
 
@@ -52,6 +53,68 @@ def test_get_categories_and_blogs(client, auth, create_user):
     assert data["categories_and_blogs"][0]["feeds"][0]["unread_count"] == 1
 
 
+def test_categories_and_blogs_single_query(client, auth, create_user):
+    """
+    Test that the sidebar is read with one query, lists empty categories,
+    and leaves out the categories and feeds of other users.
+    """
+    other = User(username="other", password="x")
+    db.session.add(other)
+    db.session.commit()
+    categories = [
+        Category(name=f"Category {i}", user_id=create_user.id)
+        for i in range(3)
+    ] + [Category(name="Foreign", user_id=other.id)]
+    db.session.add_all(categories)
+    db.session.commit()
+    db.session.add_all(
+        [
+            Feed(
+                category_id=categories[i % 2].id,
+                user_id=create_user.id,
+                title=f"Feed {i}",
+                url=f"http://example.com/{i}",
+            )
+            for i in range(4)
+        ]
+        + [
+            Feed(
+                category_id=categories[3].id,
+                user_id=other.id,
+                title="Foreign feed",
+                url="http://example.com/foreign",
+            )
+        ]
+    )
+    db.session.commit()
+
+    auth.login()
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if "category" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(url_for("api.get_categories_and_blogs"))
+        cached = client.get(url_for("api.get_categories_and_blogs"))
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    data = response.get_json()["categories_and_blogs"]
+    assert len(statements) == 1
+    assert cached.get_json()["categories_and_blogs"] == data
+    assert [category["name"] for category in data] == [
+        "Category 0",
+        "Category 1",
+        "Category 2",
+    ]
+    assert [len(category["feeds"]) for category in data] == [2, 2, 0]
+    assert data[0]["feeds"][0]["feed"]["title"] == "Feed 0"
+    assert data[0]["feeds"][0]["unread_count"] == 0
+
+
 def test_get_last_sync(client, auth, create_user):
     # Login the test user
     auth.login()
@@ -107,3 +170,32 @@ def test_unread_count(client, auth, create_user):
 
     assert response.status_code == 200
     assert data["unread_count"] == 1
+
+
+def test_live_events(app, client, auth, create_user):
+    auth.login()
+    app.config["EVENTS_KEEPALIVE"] = 0.1
+
+    response = client.get(url_for("api.live_events"))
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    stream = iter(response.response)
+    assert next(stream).startswith(b"retry:")
+
+    events.broker.publish(create_user.id, "items", {"feed_id": 1, "count": 2})
+    assert next(stream) == (
+        b'event: items\ndata: {"feed_id": 1, "count": 2}\n\n'
+    )
+    assert next(stream) == b": keepalive\n\n"
+
+    response.close()
+    assert events.broker.count() == 0
+
+
+def test_live_events_stream_limit(app, client, auth, create_user):
+    auth.login()
+    app.config["EVENTS_MAX_STREAMS"] = 0
+
+    response = client.get(url_for("api.live_events"))
+    assert response.status_code == 503
+    assert response.get_json()["status"] == "error"
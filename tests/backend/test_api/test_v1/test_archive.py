@@ -0,0 +1,101 @@
+from datetime import datetime
+import pytest
+from flask import url_for
+from app.archive import archive_items
+
+
+@pytest.fixture
+def archived_items(app, create_user, tmp_path):
+    app.config["ARCHIVE_DIR"] = str(tmp_path)
+    rows = [
+        {
+            "id": item_id,
+            "feed_id": 1,
+            "user_id": create_user.id,
+            "title": title,
+            "link": f"https://example.com/{item_id}",
+            "summary": f"<p>{title} summary</p>",
+            "pub_date": pub_date.isoformat(),
+            "creator": None,
+            "guid": None,
+            "read": True,
+            "favourite": False,
+        }
+        for item_id, title, pub_date in [
+            (1, "Python news", datetime(2024, 5, 3)),
+            (2, "Rust news", datetime(2024, 6, 1)),
+            (3, "Python tips", datetime(2024, 6, 9)),
+        ]
+    ]
+    archive_items(str(tmp_path), rows[:2])
+    archive_items(str(tmp_path), rows[2:])
+    return rows
+
+
+def test_search_archive_unauthenticated(client):
+    response = client.get(
+        url_for("api_archive_blueprint.search_archived_items")
+    )
+    assert response.status_code == 401
+
+
+def test_search_archive(client, auth, create_settings, archived_items):
+    auth.login()
+    response = client.get(
+        url_for("api_archive_blueprint.search_archived_items", q="python")
+    )
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json] == [3, 1]
+    assert "summary" not in response.json[0]
+
+    response = client.get(
+        url_for("api_archive_blueprint.search_archived_items", month="2024-06")
+    )
+    assert [item["id"] for item in response.json] == [3, 2]
+
+
+def test_get_archived_item(client, auth, create_settings, archived_items):
+    auth.login()
+    response = client.get(
+        url_for("api_archive_blueprint.get_archived_item", item_id=3)
+    )
+
+    assert response.status_code == 200
+    assert response.json["title"] == "Python tips"
+    assert response.json["summary"] == "<p>Python tips summary</p>"
+
+    response = client.get(
+        url_for("api_archive_blueprint.get_archived_item", item_id=42)
+    )
+    assert response.status_code == 404
+
+
+def test_item_archived_twice(
+    app, client, auth, create_settings, archived_items
+):
+    # A retry after a failed delete archives the item again.
+    archive_items(
+        app.config["ARCHIVE_DIR"], [dict(archived_items[0], favourite=True)]
+    )
+    auth.login()
+    response = client.get(
+        url_for("api_archive_blueprint.search_archived_items", q="python")
+    )
+    assert [item["id"] for item in response.json] == [3, 1]
+
+    response = client.get(
+        url_for("api_archive_blueprint.get_archived_item", item_id=1)
+    )
+    assert response.json["favourite"] is True
+
+
+def test_search_archive_invalid_month(
+    client, auth, create_settings, archived_items
+):
+    auth.login()
+    for month in ("../..", "2024-*", "2024-0[56]", "2024-6"):
+        response = client.get(
+            url_for("api_archive_blueprint.search_archived_items", month=month)
+        )
+        assert response.status_code == 400
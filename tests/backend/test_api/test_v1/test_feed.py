@@ -150,3 +150,23 @@ def test_update_feed_category_unauthorized(client, create_feed):
     assert response.status_code == 401
     json_data = response.get_json()
     assert json_data["error"] == "User not authenticated"
+
+
+def test_update_feed_max_items(client, auth, create_feed):
+    """
+    Test setting and clearing the item cap of a feed.
+    """
+    auth.login()
+    url = url_for(
+        "api_feeds_blueprint.update_feed_max_items", feed_id=create_feed.id
+    )
+    response = client.put(url, json={"max_items": 100})
+    assert response.status_code == 200
+    assert response.get_json()["feed"]["max_items"] == 100
+
+    response = client.put(url, json={"max_items": None})
+    assert response.status_code == 200
+    assert db.session.get(Feed, create_feed.id).max_items is None
+
+    response = client.put(url, json={"max_items": 0})
+    assert response.status_code == 400
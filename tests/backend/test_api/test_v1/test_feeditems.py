@@ -1,6 +1,7 @@
 import pytest
 from flask import url_for
-from app.models import Feed, FeedItem
+from sqlalchemy import event
+from app.models import ArticleLink, Feed, FeedItem, SummarizedArticle
 import pytz
 from app import db
 from datetime import datetime, timezone
@@ -13,7 +14,7 @@ def test_get_feed_items(client, auth, create_user, create_settings):
     auth.login()
     response = client.get(url_for("api_feeditems_blueprint.get_feed_items"))
     assert response.status_code == 200
-    assert isinstance(response.json, list)
+    assert isinstance(response.json["items"], list)
 
 
 def test_get_all_feed_items(client, auth, create_user, create_settings):
@@ -25,7 +26,7 @@ def test_get_all_feed_items(client, auth, create_user, create_settings):
         url_for("api_feeditems_blueprint.get_all_feed_items")
     )
     assert response.status_code == 200
-    assert isinstance(response.json, list)
+    assert isinstance(response.json["items"], list)
 
 
 def test_get_category_feed_items(client, auth, create_user, create_settings):
@@ -41,7 +42,7 @@ def test_get_category_feed_items(client, auth, create_user, create_settings):
         )
     )
     assert response.status_code == 200
-    assert isinstance(response.json, list)
+    assert isinstance(response.json["items"], list)
 
 
 def test_get_all_category_feed_items(
@@ -59,7 +60,7 @@ def test_get_all_category_feed_items(
         )
     )
     assert response.status_code == 200
-    assert isinstance(response.json, list)
+    assert isinstance(response.json["items"], list)
 
 
 def test_get_specific_feed_items(client, auth, create_user, create_settings):
@@ -77,7 +78,7 @@ def test_get_specific_feed_items(client, auth, create_user, create_settings):
         )
     )
     assert response.status_code == 200
-    assert isinstance(response.json, list)
+    assert isinstance(response.json["items"], list)
 
 
 def test_get_all_specific_feed_items(
@@ -97,7 +98,7 @@ def test_get_all_specific_feed_items(
         )
     )
     assert response.status_code == 200
-    assert isinstance(response.json, list)
+    assert isinstance(response.json["items"], list)
 
 
 # Additional helper function to create feed items
@@ -137,7 +138,7 @@ def test_get_feed_items_with_data(
     auth.login()
     response = client.get(url_for("api_feeditems_blueprint.get_feed_items"))
     assert response.status_code == 200
-    assert len(response.json) > 0
+    assert len(response.json["items"]) > 0
 
 
 def test_get_all_feed_items_with_data(
@@ -151,7 +152,7 @@ def test_get_all_feed_items_with_data(
         url_for("api_feeditems_blueprint.get_all_feed_items")
     )
     assert response.status_code == 200
-    assert len(response.json) > 0
+    assert len(response.json["items"]) > 0
 
 
 def test_get_category_feed_items_with_data(
@@ -169,7 +170,7 @@ def test_get_category_feed_items_with_data(
         )
     )
     assert response.status_code == 200
-    assert len(response.json) > 0
+    assert len(response.json["items"]) > 0
 
 
 def test_get_all_category_feed_items_with_data(
@@ -187,7 +188,7 @@ def test_get_all_category_feed_items_with_data(
         )
     )
     assert response.status_code == 200
-    assert len(response.json) > 0
+    assert len(response.json["items"]) > 0
 
 
 def test_get_specific_feed_items_with_data(
@@ -207,7 +208,7 @@ def test_get_specific_feed_items_with_data(
         )
     )
     assert response.status_code == 200
-    assert len(response.json) > 0
+    assert len(response.json["items"]) > 0
 
 
 def test_get_all_specific_feed_items_with_data(
@@ -227,4 +228,320 @@ def test_get_all_specific_feed_items_with_data(
         )
     )
     assert response.status_code == 200
-    assert len(response.json) > 0
+    assert len(response.json["items"]) > 0
+
+
+@pytest.mark.parametrize(
+    "endpoint, kwargs",
+    [
+        ("get_feed_items", {}),
+        ("get_all_feed_items", {}),
+        ("get_category_feed_items", {"cat_id": 1}),
+        ("get_all_category_feed_items", {"cat_id": 1}),
+        ("get_specific_feed_items", {"cat_id": 1, "feed_id": 1}),
+        ("get_all_specific_feed_items", {"cat_id": 1, "feed_id": 1}),
+    ],
+)
+def test_listing_uses_index_without_sorting(
+    client, auth, create_feed_items, sqlite_only, endpoint, kwargs
+):
+    """
+    Test that every listing reads feed_item through an index in
+    (pub_date, id) order instead of sorting into a temporary B-tree.
+    """
+    feed_id, feed_item_id = create_feed_items
+    kwargs = {
+        key: feed_id if key == "feed_id" else value
+        for key, value in kwargs.items()
+    }
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "ORDER BY feed_item.pub_date DESC" in statement:
+            statements.append((statement, parameters))
+
+    auth.login()
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        for last_item_id in (None, feed_item_id):
+            response = client.get(
+                url_for(
+                    f"api_feeditems_blueprint.{endpoint}",
+                    last_item_id=last_item_id,
+                    **kwargs,
+                )
+            )
+            assert response.status_code == 200
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 2
+    with db.engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = [
+                row[3]
+                for row in connection.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                )
+            ]
+            feed_item_steps = [step for step in plan if "feed_item" in step]
+            assert feed_item_steps, plan
+            assert "INDEX" in feed_item_steps[0], plan
+            assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+def test_listing_query_count_is_constant(
+    client, auth, create_user, create_settings
+):
+    """
+    Test that a listing page costs the same number of queries whatever its
+    size, and that serializing it leaves no ORM objects dirty.
+    """
+    feeds = [
+        Feed(
+            user_id=create_user.id,
+            category_id=1,
+            title=f"Feed {i}",
+            url=f"http://example.com/{i}",
+        )
+        for i in range(3)
+    ]
+    db.session.add_all(feeds)
+    db.session.commit()
+    db.session.add_all(
+        FeedItem(
+            feed_id=feeds[i % 3].id,
+            title=f"Item {i}",
+            link=f"http://example.com/item/{i}",
+            pub_date=datetime.now(timezone.utc),
+        )
+        for i in range(12)
+    )
+    db.session.commit()
+
+    auth.login()
+    # The first request loads the settings cache.
+    client.get(url_for("api_feeditems_blueprint.get_feed_items"))
+    counts = {}
+    for limit in (1, 12):
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            response = client.get(
+                url_for("api_feeditems_blueprint.get_feed_items", limit=limit)
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+        assert response.status_code == 200
+        assert len(response.json["items"]) == limit
+        assert {item["feed_title"] for item in response.json["items"]} <= {
+            "Feed 0",
+            "Feed 1",
+            "Feed 2",
+        }
+        counts[limit] = len(statements)
+
+    assert counts[1] == counts[12]
+    assert not db.session.dirty
+
+
+@pytest.fixture
+def paged_items(create_user, create_settings):
+    feed = Feed(
+        user_id=create_user.id,
+        category_id=1,
+        title="Paged feed",
+        url="http://example.com/paged",
+    )
+    db.session.add(feed)
+    db.session.commit()
+    items = [
+        FeedItem(
+            feed_id=feed.id,
+            title=f"Item {i}",
+            link=f"http://example.com/paged/{i}",
+            pub_date=datetime(2024, 1, 1 + i % 3, tzinfo=timezone.utc),
+        )
+        for i in range(7)
+    ]
+    db.session.add_all(items)
+    db.session.commit()
+    return [item.id for item in items]
+
+
+def test_cursor_pages_through_all_items(client, auth, paged_items):
+    """
+    Test that following next_cursor returns every item exactly once, in
+    (pub_date, id) order, and ends with a null cursor.
+    """
+    auth.login()
+    seen = []
+    cursor = None
+    for _ in range(10):
+        response = client.get(
+            url_for(
+                "api_feeditems_blueprint.get_all_feed_items",
+                limit=3,
+                cursor=cursor,
+            )
+        )
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json["items"])
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(paged_items)
+    assert len(seen) == len(set(seen))
+
+
+def test_cursor_survives_deleted_anchor(client, auth, paged_items):
+    """
+    Test that a cursor still continues after the last item of its page has
+    been deleted.
+    """
+    auth.login()
+    response = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items", limit=3)
+    )
+    first_page = [item["id"] for item in response.json["items"]]
+    cursor = response.json["next_cursor"]
+
+    db.session.delete(db.session.get(FeedItem, first_page[-1]))
+    db.session.commit()
+
+    response = client.get(
+        url_for(
+            "api_feeditems_blueprint.get_all_feed_items",
+            limit=3,
+            cursor=cursor,
+        )
+    )
+    assert response.status_code == 200
+    second_page = [item["id"] for item in response.json["items"]]
+    assert len(second_page) == 3
+    assert not set(first_page) & set(second_page)
+
+
+def test_invalid_cursor(client, auth, paged_items):
+    """
+    Test that tampered cursors and cursors of other listings are rejected.
+    """
+    auth.login()
+    response = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items", limit=3)
+    )
+    cursor = response.json["next_cursor"]
+
+    for bad_cursor in (cursor[:-2] + "xx", "garbage"):
+        response = client.get(
+            url_for(
+                "api_feeditems_blueprint.get_all_feed_items",
+                cursor=bad_cursor,
+            )
+        )
+        assert response.status_code == 400
+        assert response.json["error"] == "Invalid cursor"
+
+    response = client.get(
+        url_for("api_daily_blueprint.daily_feed", cursor=cursor)
+    )
+    assert response.status_code == 400
+
+
+def test_last_item_id_pagination(client, auth, paged_items):
+    """
+    Test that clients paging by last_item_id get the same pages as with
+    cursors.
+    """
+    auth.login()
+    response = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items", limit=3)
+    )
+    first_page = response.json
+    response = client.get(
+        url_for(
+            "api_feeditems_blueprint.get_all_feed_items",
+            limit=3,
+            last_item_id=first_page["items"][-1]["id"],
+        )
+    )
+    by_id = [item["id"] for item in response.json["items"]]
+    response = client.get(
+        url_for(
+            "api_feeditems_blueprint.get_all_feed_items",
+            limit=3,
+            cursor=first_page["next_cursor"],
+        )
+    )
+    by_cursor = [item["id"] for item in response.json["items"]]
+    assert by_id == by_cursor
+    assert len(by_id) == 3
+
+
+def test_daily_pages_through_multi_link_summaries(
+    client, auth, create_user, create_settings
+):
+    """
+    Test that summaries with several original articles fill whole pages and
+    that following next_cursor returns every summary exactly once.
+    """
+    feed = Feed(
+        user_id=create_user.id,
+        category_id=1,
+        title="Daily feed",
+        url="http://example.com/daily",
+    )
+    db.session.add(feed)
+    db.session.commit()
+    summaries = []
+    for i in range(30):
+        summary = SummarizedArticle(
+            summary=f"Summary {i}",
+            link=f"http://example.com/summary/{i}",
+            pub_date=datetime(2024, 1, 1 + i % 5),
+        )
+        items = [
+            FeedItem(
+                feed_id=feed.id,
+                title=f"Item {i}.{n}",
+                link=f"http://example.com/daily/{i}/{n}",
+                pub_date=datetime(2024, 1, 1 + i % 5),
+            )
+            for n in range(3)
+        ]
+        db.session.add(summary)
+        db.session.add_all(items)
+        db.session.flush()
+        db.session.add_all(
+            ArticleLink(
+                original_article_id=item.id,
+                summarized_article_id=summary.id,
+            )
+            for item in items
+        )
+        summaries.append(summary.id)
+    db.session.commit()
+
+    auth.login()
+    seen = []
+    cursor = None
+    for _ in range(10):
+        response = client.get(
+            url_for("api_daily_blueprint.daily_feed", limit=10, cursor=cursor)
+        )
+        assert response.status_code == 200
+        page = response.json["items"]
+        assert all(len(item["articles"]) == 3 for item in page)
+        seen.extend(item["id"] for item in page)
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+        assert len(page) == 10
+
+    assert sorted(seen) == sorted(summaries)
+    assert len(seen) == len(set(seen))
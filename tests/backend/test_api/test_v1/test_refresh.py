@@ -0,0 +1,112 @@
+import time
+import pytest
+from flask import url_for
+from app import db
+from app.models import Category, Feed
+from app import refresh_queue
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    refresh_queue._last_refresh.clear()
+
+
+@pytest.fixture
+def refresh_feed(app, create_user, create_settings):
+    with app.app_context():
+        category = Category(name="Refresh", user_id=create_user.id)
+        db.session.add(category)
+        db.session.commit()
+        feed = Feed(
+            title="Refresh Feed",
+            url="http://example.com/refresh",
+            user_id=create_user.id,
+            category_id=category.id,
+        )
+        db.session.add(feed)
+        db.session.commit()
+        return {"id": feed.id, "category_id": category.id}
+
+
+def wait_for_job(client, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        response = client.get(
+            url_for("api_refresh_blueprint.refresh_status", job_id=job_id)
+        )
+        if response.json["status"] in ("done", "failed"):
+            return response
+        time.sleep(0.05)
+    raise AssertionError("Refresh job did not finish in time")
+
+
+def test_refresh_feed_unauthenticated(client):
+    response = client.post(
+        url_for("api_refresh_blueprint.refresh_feed", feed_id=1)
+    )
+    assert response.status_code == 401
+
+
+def test_refresh_feed_not_found(client, auth, create_settings):
+    auth.login()
+    response = client.post(
+        url_for("api_refresh_blueprint.refresh_feed", feed_id=999)
+    )
+    assert response.status_code == 404
+
+
+def test_refresh_feed_reports_new_items(client, auth, refresh_feed, mocker):
+    mocker.patch("app.feed_updater.update_feed", return_value=3)
+    auth.login()
+
+    response = client.post(
+        url_for(
+            "api_refresh_blueprint.refresh_feed", feed_id=refresh_feed["id"]
+        )
+    )
+    assert response.status_code == 202
+    assert response.json["feed_ids"] == [refresh_feed["id"]]
+
+    status = wait_for_job(client, response.json["job_id"])
+    assert status.json["status"] == "done"
+    assert status.json["new_items"] == 3
+
+
+def test_refresh_category(client, auth, refresh_feed, mocker):
+    mocker.patch("app.feed_updater.update_feed", return_value=1)
+    auth.login()
+
+    response = client.post(
+        url_for(
+            "api_refresh_blueprint.refresh_category",
+            cat_id=refresh_feed["category_id"],
+        )
+    )
+    assert response.status_code == 202
+
+    status = wait_for_job(client, response.json["job_id"])
+    assert status.json["new_items"] == 1
+
+
+def test_refresh_feed_rate_limited(client, auth, refresh_feed, mocker):
+    mocker.patch("app.feed_updater.update_feed", return_value=0)
+    auth.login()
+    url = url_for(
+        "api_refresh_blueprint.refresh_feed", feed_id=refresh_feed["id"]
+    )
+
+    first = client.post(url)
+    wait_for_job(client, first.json["job_id"])
+    second = client.post(url)
+
+    assert first.status_code == 202
+    assert second.status_code == 429
+    assert second.json["skipped_feed_ids"] == [refresh_feed["id"]]
+
+
+def test_refresh_status_unknown_job(client, auth, create_settings):
+    auth.login()
+    response = client.get(
+        url_for("api_refresh_blueprint.refresh_status", job_id="missing")
+    )
+    assert response.status_code == 404
@@ -0,0 +1,25 @@
+from config import database_uri, engine_options
+
+
+def test_database_uri_uses_psycopg_for_postgres():
+    assert (
+        database_uri("postgres://user:pw@db/quickfeeds")
+        == "postgresql+psycopg://user:pw@db/quickfeeds"
+    )
+    assert (
+        database_uri("postgresql://user:pw@db/quickfeeds")
+        == "postgresql+psycopg://user:pw@db/quickfeeds"
+    )
+    assert database_uri("sqlite:///main.db") == "sqlite:///main.db"
+
+
+def test_engine_options(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "300")
+
+    assert engine_options("sqlite:///main.db") == {}
+    options = engine_options("postgresql+psycopg://db/quickfeeds")
+    assert options["pool_size"] == 20
+    assert options["pool_recycle"] == 300
+    assert options["max_overflow"] == 10
+    assert options["pool_pre_ping"] is True
@@ -0,0 +1,64 @@
+import pytest
+from flask import url_for
+from sqlalchemy import create_engine
+from app import db
+from app.db_maintenance import incremental_vacuum, pragma, run_maintenance
+from app.models import JobState
+
+
+@pytest.fixture
+def vacuum_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'vacuum.db'}")
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+        connection.exec_driver_sql("CREATE TABLE blob (data TEXT)")
+        for _ in range(200):
+            connection.exec_driver_sql(
+                "INSERT INTO blob VALUES (?)", ("x" * 4000,)
+            )
+        connection.exec_driver_sql("DELETE FROM blob")
+        connection.commit()
+    yield engine
+    engine.dispose()
+
+
+def test_incremental_vacuum_is_bounded(vacuum_engine):
+    with vacuum_engine.connect() as connection:
+        free_before = pragma(connection, "freelist_count")
+        assert free_before > 50
+
+        released = incremental_vacuum(connection, max_pages=50, step=20)
+        assert released == 50
+        assert pragma(connection, "freelist_count") == free_before - 50
+
+        incremental_vacuum(connection, max_pages=10_000)
+        assert pragma(connection, "freelist_count") == 0
+
+
+def test_run_maintenance_records_analyze(app, sqlite_only):
+    run_maintenance(app)
+
+    state = JobState.query.filter_by(name="db_maintenance:analyze").first()
+    assert state is not None
+    assert state.updated_at is not None
+
+
+def test_database_stats(client, auth, create_settings, sqlite_only):
+    auth.login()
+    response = client.get(
+        url_for("api_maintenance_blueprint.get_database_stats")
+    )
+
+    assert response.status_code == 200
+    assert response.json["dialect"] == "sqlite"
+    assert response.json["tables"]["user"] == 1
+    assert response.json["tables"]["settings"] == 1
+    assert "free_pages" in response.json
+    assert response.json["file_size"] > 0
+
+
+def test_database_stats_unauthenticated(client):
+    response = client.get(
+        url_for("api_maintenance_blueprint.get_database_stats")
+    )
+    assert response.status_code == 401
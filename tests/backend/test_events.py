@@ -0,0 +1,107 @@
+import queue
+from datetime import datetime
+import pytest
+from app import db, events
+from app.feed_counters import mark_feeds_read
+from app.models import Feed, FeedItem, User
+
+
+@pytest.fixture
+def feed(app, create_user):
+    feed = Feed(
+        title="Live", url="https://example.com/feed", user_id=create_user.id
+    )
+    db.session.add(feed)
+    db.session.commit()
+    return feed
+
+
+@pytest.fixture
+def subscription(create_user):
+    subscription = events.broker.subscribe(create_user.id)
+    yield subscription
+    events.broker.unsubscribe(create_user.id, subscription)
+
+
+def add_item(feed, n=0):
+    item = FeedItem(
+        feed_id=feed.id,
+        title=f"Item {n}",
+        link=f"https://example.com/{n}",
+        pub_date=datetime.now(),
+    )
+    db.session.add(item)
+    return item
+
+
+def test_unread_events_are_published_after_commit(feed, subscription):
+    item = add_item(feed)
+    db.session.flush()
+    assert subscription.empty()
+
+    db.session.commit()
+    assert subscription.get_nowait() == (
+        "unread",
+        {"feeds": {feed.id: 1}, "reset": []},
+    )
+
+    item.read = True
+    db.session.commit()
+    assert subscription.get_nowait() == (
+        "unread",
+        {"feeds": {feed.id: -1}, "reset": []},
+    )
+
+
+def test_rollback_discards_events(feed, subscription):
+    add_item(feed)
+    db.session.flush()
+    db.session.rollback()
+    db.session.commit()
+    assert subscription.empty()
+
+
+def test_bulk_mark_as_read_publishes_reset(feed, subscription):
+    add_item(feed)
+    db.session.commit()
+    subscription.get_nowait()
+
+    mark_feeds_read([feed.id])
+    db.session.commit()
+    assert subscription.get_nowait() == (
+        "unread",
+        {"feeds": {}, "reset": [feed.id]},
+    )
+
+
+def test_last_sync_event(create_user, subscription):
+    user = db.session.get(User, create_user.id)
+    user.last_sync = datetime(2024, 5, 1, 12, 0)
+    db.session.commit()
+    assert subscription.get_nowait() == (
+        "last_sync",
+        {"last_sync": "2024-05-01T12:00:00"},
+    )
+
+
+def test_other_users_get_nothing(feed, create_user):
+    subscription = events.broker.subscribe(create_user.id + 1)
+    try:
+        add_item(feed)
+        db.session.commit()
+        assert subscription.empty()
+    finally:
+        events.broker.unsubscribe(create_user.id + 1, subscription)
+
+
+def test_slow_stream_gets_resync(create_user, subscription):
+    for n in range(events.QUEUE_SIZE + 1):
+        events.broker.publish(create_user.id, "items", {"count": n})
+    assert subscription.get_nowait() == ("resync", {})
+    with pytest.raises(queue.Empty):
+        subscription.get_nowait()
+
+
+def test_subscribe_limit(create_user, subscription):
+    assert events.broker.subscribe(create_user.id, limit=1) is None
+    assert events.broker.count() == 1
@@ -1,9 +1,25 @@
 import pytest
 from datetime import datetime, timedelta
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import User, Feed, FeedItem, Settings
+from app.models import (
+    User,
+    Feed,
+    FeedItem,
+    Settings,
+    SummarizedArticle,
+    ArticleLink,
+)
 from app import db, create_app
-from app.feed_cleaner import clean_old_feed_items, clean_feeds
+from app.feed_cleaner import (
+    clean_old_feed_items,
+    clean_feeds,
+    CleanupBudget,
+    enforce_item_caps,
+    clean_summarized_articles,
+)
+from app.models import JobState
+from app.archive import read_archived_item, search_archive
+from app.utils import load_monitor
 import logging
 
 
@@ -164,3 +180,197 @@ def test_clean_feeds_unhandled_exception(app, user, feed_and_items, mocker):
         assert "Old Item" in remaining_titles
         assert "New Item" in remaining_titles
         assert "Favourite Item" in remaining_titles
+
+
+# Test that expired items are deleted in chunks together with their links
+def test_clean_old_feed_items_in_chunks(app, user, feed_and_items):
+    feed, items = feed_and_items
+    app.config["CLEANER_CHUNK_SIZE"] = 1
+
+    extra_item = FeedItem(
+        feed_id=feed.id,
+        title="Another Old Item",
+        pub_date=datetime.now() - timedelta(days=30),
+        link="https://example.com/another_old_item",
+    )
+    summarized = SummarizedArticle(summary="Summary", link="https://s.com/1")
+    db.session.add_all([extra_item, summarized])
+    db.session.commit()
+    db.session.add(
+        ArticleLink(
+            original_article_id=items[0].id,
+            summarized_article_id=summarized.id,
+        )
+    )
+    db.session.commit()
+
+    with app.app_context():
+        stats = clean_old_feed_items(user, app)
+
+    assert stats["items"] == 2
+    assert stats["links"] == 1
+    assert stats["chunks"] == 2
+    assert stats["duration"] >= 0
+    assert db.session.query(ArticleLink).count() == 0
+    remaining_titles = {item.title for item in db.session.query(FeedItem)}
+    assert remaining_titles == {"New Item", "Favourite Item"}
+
+
+# Test that a budgeted run stops early and the next run resumes
+def test_clean_old_feed_items_resumes_from_cursor(app, user, feed_and_items):
+    feed, items = feed_and_items
+    app.config["CLEANER_CHUNK_SIZE"] = 1
+    extra_item = FeedItem(
+        feed_id=feed.id,
+        title="Another Old Item",
+        pub_date=datetime.now() - timedelta(days=30),
+        link="https://example.com/another_old_item",
+    )
+    db.session.add(extra_item)
+    db.session.commit()
+    first_old_item_id = items[0].id
+
+    with app.app_context():
+        first = clean_old_feed_items(user, app, CleanupBudget(rows=1))
+
+    state = JobState.query.filter_by(name=f"feed_cleaner:{user.id}").one()
+    assert first["items"] == 1
+    assert first["complete"] is False
+    assert state.cursor == first_old_item_id
+
+    with app.app_context():
+        second = clean_old_feed_items(user, app, CleanupBudget(rows=10))
+
+    db.session.refresh(state)
+    assert second["items"] == 1
+    assert second["complete"] is True
+    assert state.cursor == 0
+    remaining_titles = {item.title for item in db.session.query(FeedItem)}
+    assert remaining_titles == {"New Item", "Favourite Item"}
+
+
+# Test that clean_feeds skips its slice while web requests are slow
+def test_clean_feeds_backs_off_when_busy(app, user, feed_and_items, mocker):
+    mocker.patch.object(load_monitor, "recent_latency", return_value=5.0)
+    app.config["CLEANER_BUSY_LATENCY"] = 1.0
+
+    with app.app_context():
+        clean_feeds(app)
+
+    titles = {item.title for item in db.session.query(FeedItem)}
+    assert "Old Item" in titles
+
+
+# Test that Daily summaries are cleaned up when the budget runs out
+def test_clean_feeds_cleans_summaries_after_budget(
+    app, user, feed_and_items, mocker
+):
+    app.config["CLEANER_ROW_BUDGET"] = 1
+    clean_summaries = mocker.patch(
+        "app.feed_cleaner.clean_summarized_articles"
+    )
+
+    with app.app_context():
+        clean_feeds(app)
+
+    clean_summaries.assert_called_once_with(app)
+
+    mocker.patch.object(load_monitor, "recent_latency", return_value=5.0)
+    app.config["CLEANER_BUSY_LATENCY"] = 1.0
+    with app.app_context():
+        clean_feeds(app)
+
+    clean_summaries.assert_called_once_with(app)
+
+
+# Test that expired items are archived before they are deleted
+def test_clean_old_feed_items_archives(app, user, feed_and_items, tmp_path):
+    feed, items = feed_and_items
+    old_item_id = items[0].id
+    app.config["ARCHIVE_DIR"] = str(tmp_path)
+    user.settings.archive_expired = True
+    db.session.commit()
+
+    with app.app_context():
+        stats = clean_old_feed_items(user, app)
+
+    assert stats["items"] == 1
+    assert stats["archived"] == 1
+    assert db.session.get(FeedItem, old_item_id) is None
+
+    results = search_archive(str(tmp_path), user.id, query="old")
+    assert [entry["id"] for entry in results] == [old_item_id]
+
+    archived = read_archived_item(str(tmp_path), user.id, old_item_id)
+    assert archived["title"] == "Old Item"
+    assert archived["link"] == "https://example.com/old_item"
+    assert read_archived_item(str(tmp_path), user.id + 1, old_item_id) is None
+
+
+# Test that a feed cap keeps only the newest items and all favourites
+def test_enforce_item_caps(app, user, feed_and_items):
+    feed, items = feed_and_items
+    for days in range(1, 6):
+        db.session.add(
+            FeedItem(
+                feed_id=feed.id,
+                title=f"Item {days}",
+                pub_date=datetime.now() - timedelta(days=days),
+                link=f"https://example.com/item_{days}",
+            )
+        )
+    feed.max_items = 3
+    db.session.commit()
+
+    stats = enforce_item_caps(user.id)
+
+    assert stats == {"items": 4, "archived": 0, "links": 0, "feeds": 1}
+    remaining_titles = {item.title for item in db.session.query(FeedItem)}
+    assert remaining_titles == {
+        "New Item",
+        "Item 1",
+        "Item 2",
+        "Favourite Item",
+    }
+    assert enforce_item_caps(user.id)["items"] == 0
+
+
+# Test that expired and orphaned Daily summaries are removed
+def test_clean_summarized_articles(app, user, feed_and_items):
+    feed, items = feed_and_items
+    long_ago = datetime.now() - timedelta(days=400)
+    linked = SummarizedArticle(summary="Linked", link="https://s.com/linked")
+    expired = SummarizedArticle(
+        summary="Expired", link="https://s.com/expired", pub_date=long_ago
+    )
+    orphaned = SummarizedArticle(
+        summary="Orphaned",
+        link="https://s.com/orphaned",
+        pub_date=datetime.now(),
+        created_at=long_ago,
+    )
+    fresh_orphan = SummarizedArticle(
+        summary="Fresh orphan", link="https://s.com/fresh"
+    )
+    db.session.add_all([linked, expired, orphaned, fresh_orphan])
+    db.session.commit()
+    db.session.add_all(
+        [
+            ArticleLink(
+                original_article_id=items[1].id,
+                summarized_article_id=linked.id,
+            ),
+            ArticleLink(
+                original_article_id=items[1].id,
+                summarized_article_id=expired.id,
+            ),
+        ]
+    )
+    db.session.commit()
+
+    stats = clean_summarized_articles(app)
+
+    assert stats == {"expired": 1, "orphaned": 1, "links": 1}
+    remaining = {article.summary for article in SummarizedArticle.query}
+    assert remaining == {"Linked", "Fresh orphan"}
+    assert db.session.query(ArticleLink).count() == 1
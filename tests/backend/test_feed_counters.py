@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+import pytest
+from flask import url_for
+from app import db
+from app.feed_cleaner import delete_feed_items
+from app.feed_counters import reconcile_counters
+from app.models import Feed, FeedCounter, FeedItem
+from app.utils import http_cache
+
+
+@pytest.fixture
+def counted_feed(app, create_user, create_settings):
+    feed = Feed(
+        title="Counted", url="https://example.com/feed", user_id=create_user.id
+    )
+    db.session.add(feed)
+    db.session.commit()
+    db.session.add_all(
+        FeedItem(
+            feed_id=feed.id,
+            title=f"Item {i}",
+            link=f"https://example.com/{i}",
+            pub_date=datetime.now() - timedelta(hours=i),
+            read=i == 0,
+        )
+        for i in range(4)
+    )
+    db.session.commit()
+    return feed.id
+
+
+def counts(feed_id):
+    counter = db.session.get(FeedCounter, feed_id, populate_existing=True)
+    return (counter.unread, counter.total) if counter else None
+
+
+def test_counters_follow_orm_changes(counted_feed):
+    assert counts(counted_feed) == (3, 4)
+
+    item = FeedItem.query.filter_by(feed_id=counted_feed, read=False).first()
+    item.read = True
+    db.session.commit()
+    assert counts(counted_feed) == (2, 4)
+
+    # Setting the same value again is not a change
+    item.read = True
+    db.session.commit()
+    assert counts(counted_feed) == (2, 4)
+
+    db.session.delete(item)
+    db.session.commit()
+    assert counts(counted_feed) == (2, 3)
+
+    db.session.delete(db.session.get(Feed, counted_feed))
+    db.session.commit()
+    assert counts(counted_feed) is None
+
+
+def test_counters_follow_bulk_statements(client, auth, counted_feed):
+    item_ids = [
+        item.id for item in FeedItem.query.filter_by(feed_id=counted_feed)
+    ]
+    delete_feed_items(item_ids[:2])
+    db.session.commit()
+    assert counts(counted_feed) == (1, 2)
+
+    auth.login()
+    client.post(url_for("mark_as_read.mark_as_read_all"))
+    assert counts(counted_feed) == (0, 2)
+
+
+def test_unread_count_endpoint(client, auth, counted_feed):
+    auth.login()
+    response = client.get(url_for("api.unread_count"))
+    assert response.json["unread_count"] == 3
+
+
+def test_reconcile_counters(app, counted_feed):
+    db.session.get(FeedCounter, counted_feed).unread = 42
+    db.session.commit()
+
+    version, _ = http_cache.data_version()
+    assert reconcile_counters(app) == 1
+    assert counts(counted_feed) == (3, 4)
+    # Cached responses with the drifted count are stale now.
+    assert http_cache.data_version()[0] > version
+
+    version, _ = http_cache.data_version()
+    assert reconcile_counters(app) == 0
+    assert http_cache.data_version()[0] == version
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta, UTC
+from unittest.mock import patch
+import pytest
+from app.models import User, Feed, Settings
+from app import db, create_app
+from app import feed_scheduler
+from app.feed_scheduler import (
+    feed_offset,
+    next_due_time,
+    collect_due_feeds,
+    update_due_feeds,
+    reset_schedule,
+)
+
+
+@pytest.fixture
+def app():
+    app = create_app(config_name="testing")
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def clean_schedule():
+    reset_schedule()
+    feed_scheduler._interval_seconds = None
+
+
+@pytest.fixture
+def feeds(app):
+    user = User(username="testuser", password="testpassword")
+    db.session.add(user)
+    db.session.commit()
+    db.session.add(
+        Settings(user_id=user.id, update_interval=10, timezone="UTC")
+    )
+    feeds = [
+        Feed(title=f"Feed {i}", url=f"http://test.feed/{i}", user_id=user.id)
+        for i in range(3)
+    ]
+    db.session.add_all(feeds)
+    db.session.commit()
+    return feeds
+
+
+def test_feed_offset_is_stable_and_within_interval():
+    offsets = [feed_offset(feed_id, 600) for feed_id in range(1, 200)]
+    assert offsets == [feed_offset(feed_id, 600) for feed_id in range(1, 200)]
+    assert all(0 <= offset < 600 for offset in offsets)
+    # Feeds should be spread across the interval, not bunched together
+    assert len(set(offset // 60 for offset in offsets)) == 10
+
+
+def test_next_due_time_is_in_the_future():
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    due = next_due_time(42, 600, now, jitter_seconds=30)
+    assert now < due <= now + timedelta(seconds=630)
+
+
+def test_collect_due_feeds_schedules_then_returns_due(feeds):
+    now = datetime.now(UTC)
+    assert collect_due_feeds(feeds, 600, 0, now) == []
+
+    later = now + timedelta(seconds=601)
+    due = collect_due_feeds(feeds, 600, 0, later)
+    assert sorted(feed.id for feed in due) == sorted(f.id for f in feeds)
+
+    # Once refreshed, the feeds are not due again until the next slot
+    assert collect_due_feeds(feeds, 600, 0, later) == []
+
+
+def test_update_due_feeds_refreshes_only_due_feeds(app, feeds):
+    now = datetime.now(UTC)
+    collect_due_feeds(feeds, 600, 0, now)
+    feed_scheduler._next_due[feeds[0].id] = now - timedelta(seconds=1)
+
+    refreshed = []
+
+    def fake_update_feed(feed, user, user_timezone):
+        refreshed.append(feed.id)
+        return 2
+
+    with patch("app.feed_scheduler.update_feed", side_effect=fake_update_feed):
+        update_due_feeds(app)
+
+    assert refreshed == [feeds[0].id]
+    assert feed_scheduler._next_due[feeds[0].id] > now
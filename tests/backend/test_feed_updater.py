@@ -335,6 +335,9 @@ def test_update_feed_with_image_enclosure(app, feed, mocker):
                 '<img src="http://test.feed/image.jpg" alt="Enclosure Image">'
                 "Cleaned Summary"
             )
+            assert feed_item.first_image == "http://test.feed/image.jpg"
+            assert feed_item.plain_text == "Cleaned Summary"
+            assert feed_item.word_count == 2
 
 
 # Test case for updating feed with audio enclosure
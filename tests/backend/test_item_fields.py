@@ -0,0 +1,39 @@
+from app import db
+from app.models import Feed, FeedItem
+
+
+def test_backfill_command(runner, app, create_user):
+    feed = Feed(
+        title="Old", url="https://example.com/feed", user_id=create_user.id
+    )
+    db.session.add(feed)
+    db.session.commit()
+    db.session.add_all(
+        [
+            FeedItem(
+                feed_id=feed.id,
+                title="Old item",
+                link="https://example.com/old",
+                summary='<p>Stored <i>before</i></p><img src="old.png">',
+            ),
+            FeedItem(
+                feed_id=feed.id,
+                title="Empty item",
+                link="https://example.com/empty",
+            ),
+        ]
+    )
+    db.session.commit()
+
+    result = runner.invoke(args=["items", "backfill", "--batch-size", "1"])
+    assert "Backfilled 2 feed items" in result.output
+
+    item = FeedItem.query.filter_by(title="Old item").one()
+    assert item.plain_text == "Stored before"
+    assert item.excerpt == "Stored before"
+    assert item.first_image == "old.png"
+    assert item.word_count == 2
+    assert FeedItem.query.filter_by(title="Empty item").one().word_count == 0
+
+    result = runner.invoke(args=["items", "backfill"])
+    assert "Backfilled 0 feed items" in result.output
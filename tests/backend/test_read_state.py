@@ -0,0 +1,213 @@
+import time
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import select
+from app import db, read_state
+from app.models import Category, Feed, FeedCounter, FeedItem
+
+
+@pytest.fixture
+def items(app, create_user, create_settings):
+    category = Category(name="Buffered", user_id=create_user.id)
+    db.session.add(category)
+    db.session.commit()
+    feed = Feed(
+        title="Buffered",
+        url="https://example.com/feed",
+        user_id=create_user.id,
+        category_id=category.id,
+    )
+    db.session.add(feed)
+    db.session.commit()
+    now = datetime.now()
+    db.session.add_all(
+        FeedItem(
+            feed_id=feed.id,
+            title=f"Item {i}",
+            link=f"https://example.com/{i}",
+            pub_date=now - timedelta(hours=i),
+        )
+        for i in range(3)
+    )
+    db.session.commit()
+    return FeedItem.query.order_by(FeedItem.pub_date.desc()).all()
+
+
+def install_buffer(app, path, interval=3600):
+    buffer = read_state.ReadStateBuffer(
+        app, read_state.Journal(str(path)), interval=interval
+    )
+    app.extensions["read_state"] = buffer
+    return buffer
+
+
+@pytest.fixture
+def buffer(app, tmp_path):
+    buffer = install_buffer(app, tmp_path / "journal.db")
+    yield buffer
+    buffer.flush()
+
+
+@pytest.fixture
+def started(app, tmp_path):
+    app.config.update(
+        READ_STATE_FLUSH_MS=3600 * 1000,
+        READ_STATE_JOURNAL=str(tmp_path / "journal.db"),
+    )
+    buffer = read_state.start(app)
+    yield buffer
+    buffer.flush()
+
+
+def stored_read_state(items):
+    return [
+        read
+        for read, in db.session.execute(
+            select(FeedItem.read)
+            .where(FeedItem.id.in_([item.id for item in items]))
+            .order_by(FeedItem.pub_date.desc())
+        )
+    ]
+
+
+def unread_counter(feed_id):
+    return db.session.execute(
+        select(FeedCounter.unread).where(FeedCounter.feed_id == feed_id)
+    ).scalar()
+
+
+def test_pending_changes_are_visible(client, auth, create_user, items, buffer):
+    auth.login()
+    feed_id = items[0].feed_id
+    changed = read_state.set_state(
+        create_user.id, [items[0].id, items[1].id], read=True
+    )
+    assert changed == {feed_id: 2}
+    assert stored_read_state(items) == [False, False, False]
+
+    response = client.get("/api/feeditems?limit=5")
+    assert [item["id"] for item in response.json["items"]] == [items[2].id]
+    response = client.get("/api/feeditems/all?limit=5")
+    assert [item["read"] for item in response.json["items"]] == [
+        True,
+        True,
+        False,
+    ]
+    assert client.get("/api/unread-count").json["unread_count"] == 1
+    sidebar = client.get("/api/categories_and_blogs").json
+    assert sidebar["categories_and_blogs"][0]["feeds"][0]["unread_count"] == 1
+
+    assert buffer.flush() == 2
+    assert len(buffer) == 0
+    assert stored_read_state(items) == [True, True, False]
+    assert unread_counter(feed_id) == 1
+    assert client.get("/api/unread-count").json["unread_count"] == 1
+
+
+def test_changes_are_merged(create_user, items, buffer):
+    read_state.set_state(create_user.id, [items[0].id], read=True)
+    read_state.set_state(create_user.id, [items[0].id], favourite=True)
+    changed = read_state.set_state(create_user.id, [items[0].id], read=True)
+    assert changed == {}
+    assert len(buffer) == 1
+    assert read_state.unread_deltas(create_user.id) == {items[0].feed_id: -1}
+
+    read_state.set_state(create_user.id, [items[0].id], read=False)
+    assert read_state.unread_deltas(create_user.id) == {items[0].feed_id: 0}
+
+    buffer.flush()
+    item = db.session.execute(
+        select(FeedItem.read, FeedItem.favourite).where(
+            FeedItem.id == items[0].id
+        )
+    ).one()
+    assert tuple(item) == (False, True)
+    assert unread_counter(items[0].feed_id) == 3
+
+
+def test_other_users_items_are_ignored(create_user, items, buffer):
+    assert (
+        read_state.set_state(create_user.id + 1, [items[0].id], read=True)
+        == {}
+    )
+    assert len(buffer) == 0
+
+
+def test_journal_is_replayed(app, tmp_path, create_user, items):
+    path = tmp_path / "journal.db"
+    install_buffer(app, path)
+    read_state.set_state(create_user.id, [items[2].id], read=True)
+
+    # A new process finds the change in the journal.
+    buffer = install_buffer(app, path)
+    assert len(buffer) == 1
+    buffer.flush()
+    assert stored_read_state(items) == [False, False, True]
+    assert len(install_buffer(app, path)) == 0
+
+
+def test_flush_thread(app, tmp_path, create_user, items):
+    buffer = install_buffer(app, tmp_path / "journal.db", interval=0.05)
+    read_state.set_state(create_user.id, [items[0].id], read=True)
+
+    deadline = time.monotonic() + 5
+    while len(buffer) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert len(buffer) == 0
+    db.session.expire_all()
+    assert stored_read_state(items) == [True, False, False]
+
+
+def test_only_started_apps_buffer(app, tmp_path):
+    path = tmp_path / "journal.db"
+    app.config.update(READ_STATE_FLUSH_MS=500, READ_STATE_JOURNAL=str(path))
+    read_state.init_app(app)
+    assert read_state.get_buffer().write_through
+    assert not path.exists()
+
+    buffer = read_state.start(app)
+    assert read_state.get_buffer() is buffer
+    assert not buffer.write_through
+    assert path.exists()
+
+
+def test_buffered_batch_request(client, auth, items, started):
+    auth.login()
+    response = client.get("/api/unread-count")
+    assert response.json["unread_count"] == 3
+    count_etag = response.headers["ETag"]
+    response = client.get("/api/feeditems?limit=5")
+    assert len(response.json["items"]) == 3
+    listing_etag = response.headers["ETag"]
+
+    response = client.post(
+        "/mark_as_read/batch", json={"ids": [items[0].id, items[1].id]}
+    )
+    assert response.json["marked"] == 2
+    assert len(started) == 2
+    assert stored_read_state(items) == [False, False, False]
+
+    # The pending change makes cached responses stale.
+    response = client.get(
+        "/api/unread-count", headers={"If-None-Match": count_etag}
+    )
+    assert response.status_code == 200
+    assert response.json["unread_count"] == 1
+    count_etag = response.headers["ETag"]
+    response = client.get(
+        "/api/feeditems?limit=5", headers={"If-None-Match": listing_etag}
+    )
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json["items"]] == [items[2].id]
+    response = client.get(
+        "/api/unread-count", headers={"If-None-Match": count_etag}
+    )
+    assert response.status_code == 304
+
+    assert started.flush() == 2
+    assert stored_read_state(items) == [True, True, False]
+    response = client.get(
+        "/api/unread-count", headers={"If-None-Match": count_etag}
+    )
+    assert response.status_code == 200
+    assert response.json["unread_count"] == 1
@@ -1,8 +1,11 @@
+from datetime import datetime, timedelta
 import pytest
 from flask import url_for
 from flask_login import login_user
 from app import create_app, db
-from app.models import User, Feed, FeedItem, Category
+from app.api.v1.feeditems import CURSOR_KIND
+from app.models import User, Feed, FeedCounter, FeedItem, Category
+from app.utils.cursors import encode_cursor
 from flask_testing import TestCase
 from werkzeug.security import generate_password_hash
 
@@ -127,6 +130,126 @@ class MarkAsReadTestCase(TestCase):
         for item in feed_items:
             assert item.read == True
 
+    def add_items(self, count):
+        """Adds unread items to the test feed, newest first."""
+        now = datetime(2024, 5, 1, 12, 0)
+        items = [
+            FeedItem(
+                feed_id=self.feed.id,
+                title=f"Item {i}",
+                link=f"http://testitem.com/{i}",
+                pub_date=now - timedelta(hours=i),
+            )
+            for i in range(count)
+        ]
+        db.session.add_all(items)
+        db.session.commit()
+        return items
+
+    def unread_count(self):
+        return db.session.get(FeedCounter, self.feed.id).unread
+
+    def test_mark_as_read_batch(self):
+        """
+        Tests the mark_as_read_batch endpoint.
+        - Marks three items, one of them already read, in one request.
+        - Asserts that only the two unread items are counted.
+        - Asserts that the feed counter follows.
+        """
+        items = self.add_items(3)
+        items[0].read = True
+        db.session.commit()
+        assert self.unread_count() == 3
+
+        response = self.client.post(
+            url_for("mark_as_read.mark_as_read_batch"),
+            json={"ids": [item.id for item in items]},
+        )
+        assert response.status_code == 200
+        assert response.json == {
+            "status": "success",
+            "marked": 2,
+            "feeds": {str(self.feed.id): 2},
+        }
+        assert self.unread_count() == 1
+
+    def test_mark_as_read_batch_other_user(self):
+        """
+        Tests that the batch endpoint ignores items of other users.
+        """
+        other = User(username="other", password="x")
+        db.session.add(other)
+        db.session.commit()
+        self.feed.user_id = other.id
+        db.session.commit()
+
+        response = self.client.post(
+            url_for("mark_as_read.mark_as_read_batch"),
+            json={"ids": [self.feed_item.id]},
+        )
+        assert response.json["marked"] == 0
+        assert db.session.get(FeedItem, self.feed_item.id).read is False
+
+    def test_mark_as_read_batch_invalid(self):
+        """
+        Tests that the batch endpoint rejects anything but a list of IDs.
+        """
+        for body in ({}, {"ids": "1,2"}, {"ids": [1, "2"]}):
+            response = self.client.post(
+                url_for("mark_as_read.mark_as_read_batch"), json=body
+            )
+            assert response.status_code == 400
+
+    def test_mark_as_read_range(self):
+        """
+        Tests the mark_as_read_range endpoint.
+        - Marks the feed up to the cursor of a two item page.
+        - Asserts that older items and items newer than max_id stay unread.
+        """
+        items = self.add_items(4)
+        cursor = encode_cursor(CURSOR_KIND, items[1].pub_date, items[1].id)
+
+        response = self.client.post(
+            url_for("mark_as_read.mark_as_read_range"),
+            json={
+                "cursor": cursor,
+                "feed_id": self.feed.id,
+                "max_id": items[-1].id,
+            },
+        )
+        assert response.status_code == 200
+        assert response.json["marked"] == 2
+        db.session.expire_all()
+        assert [item.read for item in items] == [True, True, False, False]
+        # The fixture item has no pub_date and is not in the range.
+        assert db.session.get(FeedItem, self.feed_item.id).read is False
+        assert self.unread_count() == 3
+
+    def test_mark_as_read_range_max_id(self):
+        """
+        Tests that items stored after the listing was loaded stay unread.
+        """
+        items = self.add_items(2)
+        response = self.client.post(
+            url_for("mark_as_read.mark_as_read_range"),
+            json={"category_id": self.category.id, "max_id": items[0].id},
+        )
+        # The fixture item and the first of the new items.
+        assert response.json["marked"] == 2
+        db.session.expire_all()
+        assert db.session.get(FeedItem, self.feed_item.id).read is True
+        assert db.session.get(FeedItem, items[1].id).read is False
+
+    def test_mark_as_read_range_invalid_cursor(self):
+        """
+        Tests that a forged cursor is rejected.
+        """
+        response = self.client.post(
+            url_for("mark_as_read.mark_as_read_range"),
+            json={"cursor": "forged"},
+        )
+        assert response.status_code == 400
+
 
 if __name__ == "__main__":
     pytest.main()
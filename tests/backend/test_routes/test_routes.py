@@ -47,8 +47,12 @@ Tests:
 
     test_settings_post_route:
         Verifies that the settings route correctly handles POST requests.
+
+    test_reset_last_sync_route:
+        Verifies that the reset_last_sync route may write on a GET request.
 """
 
+from datetime import datetime
 import pytest
 from flask import url_for
 from app import create_app, db
@@ -262,3 +266,13 @@ def test_settings_post_route(init_db, login_user):
     assert response.status_code == 200
     assert b"Settings" in response.data
     assert b"UTC" in response.data
+
+
+def test_reset_last_sync_route(init_db, login_user):
+    user = db.session.get(User, 1)
+    user.last_sync = datetime.now()
+    db.session.commit()
+
+    response = login_user.get(url_for("routes.reset_last_sync"))
+    assert response.status_code == 302
+    assert db.session.get(User, 1, populate_existing=True).last_sync is None
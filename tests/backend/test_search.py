@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+import pytest
+from flask import url_for
+from sqlalchemy import text
+from app import db
+from app.feed_cleaner import delete_feed_items
+from app.models import Feed, FeedItem
+from app.search import match_query, search_items
+from app.utils.cursors import InvalidCursor
+
+
+@pytest.fixture
+def searchable_feed(app, sqlite_only, create_user, create_settings):
+    feed = Feed(
+        title="Searchable",
+        url="https://example.com/feed",
+        user_id=create_user.id,
+    )
+    db.session.add(feed)
+    db.session.commit()
+    db.session.add_all(
+        [
+            FeedItem(
+                feed_id=feed.id,
+                title="Café opening in town",
+                link="https://example.com/cafe",
+                summary="<p>A new <b>espresso</b> bar opens.</p>",
+                pub_date=datetime.now(),
+            ),
+            FeedItem(
+                feed_id=feed.id,
+                title="Weather report",
+                link="https://example.com/weather",
+                summary="<p>Rain, then a cafe terrace afternoon.</p>",
+                pub_date=datetime.now() - timedelta(hours=1),
+            ),
+            FeedItem(
+                feed_id=feed.id,
+                title="Unrelated",
+                link="https://example.com/unrelated",
+                summary="<p>Nothing to see.</p>",
+                pub_date=datetime.now() - timedelta(hours=2),
+            ),
+        ]
+    )
+    db.session.commit()
+    return feed
+
+
+def titles(rows):
+    return [row["title"] for row in rows]
+
+
+def test_match_query_quotes_words():
+    assert match_query('cafe AND "x" espr*') == '"cafe" "AND" """x""" "espr"*'
+    assert match_query("- * ()") == ""
+
+
+def test_search_ranks_title_matches_first(searchable_feed, create_user):
+    rows, next_cursor = search_items(create_user.id, "cafe")
+    assert titles(rows) == ["Café opening in town", "Weather report"]
+    assert next_cursor is None
+    assert "<mark>" in rows[1]["snippet"]
+
+    rows, _ = search_items(create_user.id, "espr*")
+    assert titles(rows) == ["Café opening in town"]
+    assert search_items(create_user.id + 1, "cafe") == ([], None)
+
+
+def test_search_pages_with_cursor(searchable_feed, create_user):
+    first, cursor = search_items(create_user.id, "cafe", limit=1)
+    second, _ = search_items(create_user.id, "cafe", limit=1, cursor=cursor)
+    assert titles(first + second) == ["Café opening in town", "Weather report"]
+
+    with pytest.raises(InvalidCursor):
+        search_items(create_user.id, "cafe", cursor="not a cursor")
+
+
+def test_index_follows_edits_and_deletes(searchable_feed, create_user):
+    item = FeedItem.query.filter_by(title="Unrelated").one()
+    item.title = "Cafe news"
+    db.session.commit()
+    rows, _ = search_items(create_user.id, "cafe")
+    assert "Cafe news" in titles(rows)
+
+    delete_feed_items([item.id])
+    db.session.commit()
+    rows, _ = search_items(create_user.id, "cafe")
+    assert "Cafe news" not in titles(rows)
+
+
+def test_rebuild_command(runner, searchable_feed, create_user):
+    db.session.execute(text("DELETE FROM feed_item_fts"))
+    db.session.commit()
+    assert search_items(create_user.id, "cafe") == ([], None)
+
+    result = runner.invoke(args=["search", "rebuild"])
+    assert "Indexed 3 feed items" in result.output
+    rows, _ = search_items(create_user.id, "cafe")
+    assert len(rows) == 2
+
+
+def test_search_endpoint(client, auth, searchable_feed):
+    auth.login()
+    url = url_for("api_feeditems_blueprint.search_feed_items")
+    response = client.get(url, query_string={"q": "cafe", "limit": 1})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json["items"]] == [
+        "Café opening in town"
+    ]
+    assert response.json["items"][0]["feed_title"] == "Searchable"
+
+    response = client.get(
+        url,
+        query_string={"q": "cafe", "cursor": response.json["next_cursor"]},
+    )
+    assert [item["title"] for item in response.json["items"]] == [
+        "Weather report"
+    ]
+    assert response.json["next_cursor"] is None
+
+    assert client.get(url).status_code == 400
+    assert (
+        client.get(url, query_string={"q": "x", "cursor": "!"}).status_code
+        == 400
+    )
@@ -0,0 +1,113 @@
+import pytz
+from flask import url_for
+from sqlalchemy import event
+from app import create_app, db, settings_cache
+from app.models import Settings
+
+
+def count_statements(func, *args):
+    statements = []
+
+    def count(conn, cursor, statement, *rest):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        result = func(*args)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    return result, len(statements)
+
+
+def test_settings_are_cached(app, create_user, create_settings):
+    settings, queries = count_statements(
+        settings_cache.get_settings, create_user.id
+    )
+    assert queries == 1
+    assert settings.timezone == "UTC"
+    assert settings.tz is pytz.utc
+
+    cached, queries = count_statements(
+        settings_cache.get_settings, create_user.id
+    )
+    assert queries == 0
+    assert cached is settings
+
+
+def test_missing_settings_fall_back_to_utc(app, create_user):
+    assert settings_cache.get_settings(create_user.id) is None
+    assert settings_cache.get_timezone(create_user.id) is pytz.utc
+
+
+def test_commit_invalidates_settings(app, create_user, create_settings):
+    assert settings_cache.get_timezone(create_user.id) is pytz.utc
+
+    settings = Settings.query.filter_by(user_id=create_user.id).first()
+    settings.timezone = "Europe/Berlin"
+    db.session.commit()
+
+    assert settings_cache.get_timezone(create_user.id).zone == "Europe/Berlin"
+
+
+def test_rollback_invalidates_settings(app, create_user, create_settings):
+    settings = Settings.query.filter_by(user_id=create_user.id).first()
+    settings.timezone = "Europe/Berlin"
+    db.session.flush()
+    assert settings_cache.get_timezone(create_user.id).zone == "Europe/Berlin"
+
+    db.session.rollback()
+    assert settings_cache.get_timezone(create_user.id) is pytz.utc
+
+
+def test_settings_api_write_is_visible(
+    client, auth, create_user, create_settings
+):
+    auth.login()
+    response = client.get(url_for("api_settings_blueprint.user_settings"))
+    assert response.json["timezone"] == "UTC"
+    assert response.json["groq_api_key"] == "******************************"
+
+    response = client.post(
+        url_for("api_settings_blueprint.user_settings"),
+        json={"timezone": "Asia/Tokyo"},
+    )
+    assert response.status_code == 200
+
+    response = client.get(url_for("api_settings_blueprint.user_settings"))
+    assert response.json["timezone"] == "Asia/Tokyo"
+    assert settings_cache.get_timezone(create_user.id).zone == "Asia/Tokyo"
+
+
+def test_listing_does_not_query_settings(
+    client, auth, create_user, create_settings
+):
+    auth.login()
+    client.get(url_for("api_feeditems_blueprint.get_feed_items"))
+
+    statements = []
+
+    def capture(conn, cursor, statement, *rest):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(
+            url_for("api_feeditems_blueprint.get_feed_items")
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert response.status_code == 200
+    assert not any("FROM settings" in statement for statement in statements)
+
+
+def test_other_app_invalidates_settings(app, create_user, create_settings):
+    # The background jobs write through apps of their own.
+    other = create_app("testing")
+    assert settings_cache.get_timezone(create_user.id) is pytz.utc
+
+    with other.app_context():
+        settings = Settings.query.filter_by(user_id=create_user.id).first()
+        settings.timezone = "Europe/Berlin"
+        db.session.commit()
+
+    assert settings_cache.get_timezone(create_user.id).zone == "Europe/Berlin"
@@ -1,6 +1,6 @@
 import pytest
 from bs4 import BeautifulSoup
-from app.utils.cleaner import clean_summary
+from app.utils.cleaner import clean_summary, make_excerpt, summary_fields
 
 
 def setup_function():
@@ -56,6 +56,24 @@ def test_handle_iframes():
     assert iframe["height"] == "360px"
 
 
+def test_summary_fields():
+    fields = summary_fields(
+        '<p>Hello <b>big</b>\n world.</p><img src="a.jpg"><img src="b.jpg">'
+    )
+    assert fields == {
+        "plain_text": "Hello big world.",
+        "excerpt": "Hello big world.",
+        "first_image": "a.jpg",
+        "word_count": 3,
+    }
+    assert summary_fields(None)["word_count"] == 0
+
+
+def test_make_excerpt_cuts_at_word_boundary():
+    assert make_excerpt("one two, three", length=9) == "one two…"
+    assert make_excerpt("short", length=9) == "short"
+
+
 if __name__ == "__main__":
     test_remove_comments()
     test_remove_unallowed_tags()
@@ -64,4 +82,6 @@ if __name__ == "__main__":
     test_remove_button_tags()
     test_remove_div_and_svg_tags()
     test_handle_iframes()
+    test_summary_fields()
+    test_make_excerpt_cuts_at_word_boundary()
     print("All tests passed.")
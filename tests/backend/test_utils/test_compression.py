@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import select
+from app import db
+from app.models import Feed, FeedItem
+from app.utils import compression
+from app.utils.compression import RAW, ZLIB, compress, decompress
+
+LONG_TEXT = "<p>" + "Über lorem ipsum dolor sit amet. " * 40 + "</p>"
+
+
+def test_round_trip_and_version_byte():
+    stored = compress(LONG_TEXT, codec=ZLIB)
+    assert stored[0] == ZLIB
+    assert len(stored) < len(LONG_TEXT.encode("utf-8"))
+    assert decompress(stored) == LONG_TEXT
+
+    assert compress("short", codec=ZLIB) == bytes([RAW]) + b"short"
+    assert compress(LONG_TEXT, codec=RAW)[0] == RAW
+    assert decompress(compress(LONG_TEXT, codec=RAW)) == LONG_TEXT
+    assert decompress("stored before compression") == (
+        "stored before compression"
+    )
+    assert compress(None) is None and decompress(None) is None
+
+
+def test_unknown_version_and_codec():
+    with pytest.raises(ValueError):
+        decompress(b"\x07data")
+    with pytest.raises(ValueError):
+        compression.configure("lz4")
+
+
+def test_summary_is_stored_compressed(app, create_user):
+    feed = Feed(
+        title="Feed", url="https://example.com/feed", user_id=create_user.id
+    )
+    db.session.add(feed)
+    db.session.commit()
+    db.session.add(
+        FeedItem(
+            feed_id=feed.id,
+            title="Long",
+            link="https://example.com/long",
+            summary=LONG_TEXT,
+        )
+    )
+    db.session.commit()
+    db.session.expire_all()
+
+    item = FeedItem.query.filter_by(title="Long").one()
+    assert item.summary == LONG_TEXT
+    stored = db.session.execute(
+        select(FeedItem.__table__.c.summary.cast(db.LargeBinary))
+    ).scalar()
+    assert stored[0] == ZLIB
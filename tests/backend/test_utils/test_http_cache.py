@@ -0,0 +1,125 @@
+from datetime import datetime
+import pytest
+from flask import url_for
+from sqlalchemy import event
+from app import db
+from app.models import Feed, FeedItem
+from app.utils import http_cache
+
+
+@pytest.fixture
+def unread_item(create_user, create_settings):
+    feed = Feed(
+        user_id=create_user.id,
+        category_id=1,
+        title="Polled feed",
+        url="http://example.com/polled",
+    )
+    db.session.add(feed)
+    db.session.commit()
+    item = FeedItem(
+        feed_id=feed.id,
+        title="Polled item",
+        link="http://example.com/polled/1",
+        pub_date=datetime.now(),
+        read=False,
+    )
+    db.session.add(item)
+    db.session.commit()
+    return item.id
+
+
+def test_unchanged_poll_is_not_modified(client, auth, unread_item):
+    auth.login()
+    response = client.get(url_for("api.unread_count"))
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    etag = response.headers["ETag"]
+    assert etag.startswith("W/")
+
+    statements = []
+
+    def capture(conn, cursor, statement, *rest):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(
+            url_for("api.unread_count"), headers={"If-None-Match": etag}
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not any("feed_counter" in statement for statement in statements)
+
+
+def test_mark_read_changes_etag(client, auth, unread_item):
+    auth.login()
+    response = client.get(url_for("api.unread_count"))
+    etag = response.headers["ETag"]
+    assert response.json["unread_count"] == 1
+
+    client.post(url_for("mark_as_read.mark_as_read", item_id=unread_item))
+
+    response = client.get(
+        url_for("api.unread_count"), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json["unread_count"] == 0
+
+
+def test_bulk_update_changes_version(client, auth, unread_item):
+    auth.login()
+    version, _ = http_cache.data_version()
+    client.post(url_for("mark_as_read.mark_as_read_all"))
+    assert http_cache.data_version()[0] > version
+
+
+def test_rollback_keeps_version(app, unread_item):
+    version, _ = http_cache.data_version()
+    db.session.get(FeedItem, unread_item).read = True
+    db.session.flush()
+    db.session.rollback()
+    assert http_cache.data_version()[0] == version
+
+
+def test_etag_depends_on_url(client, auth, unread_item):
+    auth.login()
+    first = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items", limit=1)
+    )
+    second = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items", limit=2)
+    )
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+    response = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items", limit=2),
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert response.status_code == 200
+
+
+def test_if_modified_since(client, auth, unread_item):
+    auth.login()
+    response = client.get(url_for("api.get_categories_and_blogs"))
+    last_modified = response.headers["Last-Modified"]
+
+    response = client.get(
+        url_for("api.get_categories_and_blogs"),
+        headers={"If-Modified-Since": last_modified},
+    )
+    assert response.status_code == 304
+
+
+def test_last_sync_revalidates_by_body(client, auth, create_user):
+    auth.login()
+    response = client.get(url_for("api.get_last_sync"))
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        url_for("api.get_last_sync"), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
@@ -0,0 +1,100 @@
+import gzip
+import json
+import os
+from datetime import datetime
+import pytest
+from flask import url_for
+from app import db
+from app.models import Feed, FeedItem
+from app.utils.http_compression import available, precompress
+
+
+@pytest.fixture
+def long_items(create_user, create_settings):
+    feed = Feed(
+        user_id=create_user.id,
+        category_id=1,
+        title="Long feed",
+        url="http://example.com/long",
+    )
+    db.session.add(feed)
+    db.session.commit()
+    db.session.add_all(
+        FeedItem(
+            feed_id=feed.id,
+            title=f"Item {i}",
+            link=f"http://example.com/long/{i}",
+            summary="<p>" + "Lorem ipsum dolor sit amet. " * 50 + "</p>",
+            pub_date=datetime.now(),
+        )
+        for i in range(5)
+    )
+    db.session.commit()
+
+
+def test_json_is_gzipped(client, auth, long_items):
+    auth.login()
+    url = url_for("api_feeditems_blueprint.get_all_feed_items")
+    plain = client.get(url)
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert int(response.headers["Content-Length"]) < len(plain.data)
+    assert json.loads(gzip.decompress(response.data)) == plain.json
+
+
+def test_small_responses_are_not_compressed(client, auth, create_user):
+    auth.login()
+    response = client.get(
+        url_for("api.unread_count"), headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+
+
+def test_preferred_algorithm(client, auth, long_items):
+    auth.login()
+    response = client.get(
+        url_for("api_feeditems_blueprint.get_all_feed_items"),
+        headers={"Accept-Encoding": "gzip, br"},
+    )
+    assert response.headers["Content-Encoding"] == available(["br", "gzip"])[0]
+
+
+def test_precompressed_static_file(app, client, tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "static_folder", str(tmp_path))
+    path = tmp_path / "bundle.js"
+    path.write_text("console.log('quickfeeds');" * 100)
+    precompress([str(path)])
+
+    response = client.get(
+        "/static/bundle.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype == "text/javascript"
+    assert gzip.decompress(response.data) == path.read_bytes()
+    response.close()
+
+    response = client.get("/static/bundle.js")
+    assert "Content-Encoding" not in response.headers
+    assert response.data == path.read_bytes()
+    assert "Accept-Encoding" in response.headers["Vary"]
+    response.close()
+
+
+def test_stale_precompressed_file_is_ignored(
+    app, client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(app, "static_folder", str(tmp_path))
+    path = tmp_path / "bundle.css"
+    path.write_text("body { color: red; }" * 100)
+    precompress([str(path)])
+    modified = os.path.getmtime(path) + 10
+    os.utime(path, (modified, modified))
+
+    response = client.get(
+        "/static/bundle.css", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+    response.close()
@@ -0,0 +1,50 @@
+import pytest
+from app import db
+from app.models import Category
+from app.utils.read_only import ReadOnlySessionError, allow_writes
+
+
+@pytest.fixture
+def rename_view(app, create_user):
+    category = Category(name="Unnamed", user_id=create_user.id)
+    db.session.add(category)
+    db.session.commit()
+    category_id = category.id
+
+    def rename():
+        category = db.session.get(Category, category_id)
+        category.name = "Renamed"
+        db.session.commit()
+        return "ok"
+
+    app.add_url_rule("/rename", "rename", rename, methods=["GET", "POST"])
+    app.add_url_rule(
+        "/rename/allowed", "rename_allowed", allow_writes(lambda: rename())
+    )
+    return category_id
+
+
+def category_name(category_id):
+    return db.session.get(Category, category_id, populate_existing=True).name
+
+
+def test_get_request_cannot_write(client, rename_view):
+    with pytest.raises(ReadOnlySessionError):
+        client.get("/rename")
+    db.session.rollback()
+    assert category_name(rename_view) != "Renamed"
+
+    # The scope ends with the request.
+    assert db.session.autoflush
+    db.session.get(Category, rename_view).name = "Changed in test"
+    db.session.commit()
+
+
+def test_post_and_exempted_views_can_write(client, rename_view):
+    assert client.post("/rename").status_code == 200
+    assert category_name(rename_view) == "Renamed"
+
+    db.session.get(Category, rename_view).name = "Unnamed"
+    db.session.commit()
+    assert client.get("/rename/allowed").status_code == 200
+    assert category_name(rename_view) == "Renamed"
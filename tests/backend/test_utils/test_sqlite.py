@@ -0,0 +1,42 @@
+import pytest
+from app import db
+from app.utils.sqlite import connection_pragmas
+
+
+def test_connection_profile_is_applied(app, sqlite_only):
+    with db.engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql(
+            "PRAGMA journal_mode"
+        ).scalar()
+        busy_timeout = connection.exec_driver_sql(
+            "PRAGMA busy_timeout"
+        ).scalar()
+        synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+
+    assert journal_mode == "wal"
+    assert busy_timeout == app.config["SQLITE_BUSY_TIMEOUT"]
+    # NORMAL
+    assert synchronous == 1
+
+
+def test_connection_pragmas():
+    pragmas = connection_pragmas(
+        {
+            "SQLITE_JOURNAL_MODE": "wal",
+            "SQLITE_SYNCHRONOUS": "normal",
+            "SQLITE_BUSY_TIMEOUT": "2500",
+            "SQLITE_CACHE_SIZE": -2000,
+        }
+    )
+    assert pragmas == [
+        "PRAGMA auto_vacuum=INCREMENTAL",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=2500",
+        "PRAGMA cache_size=-2000",
+    ]
+
+
+def test_connection_pragmas_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        connection_pragmas({"SQLITE_JOURNAL_MODE": "WAL; DROP TABLE user"})